@@ -0,0 +1,238 @@
+"""
+Data-scale benchmark.
+
+For each scale and file format, loads a synthetic amazon_sales file
+(see synthetic_sales.py) the way the app does - DuckDBConnection._load_csv
+for CSV, a Parquet view for Parquet - and runs the fixed SQL suite
+through execute_query and the execute_sql tool. Reports load time,
+rollup build time, p50/p95 query latency, result serialization cost and
+peak RSS as JSON.
+
+Every scale/format runs in a fresh process so peak RSS is its own. The
+result cache is disabled and queries have no timeout, so each timed
+call does the full work.
+
+Run from the repo root:
+    python -m benchmarks.data_scale [--rows 1m 10m] [--format csv parquet]
+        [--iterations 10] [--output results.json] [--compare baseline.json]
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import platform
+import resource
+import statistics
+import subprocess
+import multiprocessing
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+from .sql_suite import SQL_SUITE
+from .synthetic_sales import SCALES, DEFAULT_OUT, TABLE, generate
+
+# Applied before the worker process imports the app's config
+BENCHMARK_ENV = {
+    "RESULT_CACHE_ENABLED": "False",
+    "QUERY_TIMEOUT_SECONDS": "0",
+}
+
+
+def _stats(samples: list) -> dict:
+    samples_ms = sorted(s * 1000 for s in samples)
+    return {
+        "mean_ms": round(statistics.mean(samples_ms), 3),
+        "p50_ms": round(samples_ms[len(samples_ms) // 2], 3),
+        "p95_ms": round(samples_ms[min(len(samples_ms) - 1, int(0.95 * len(samples_ms)))], 3),
+        "max_ms": round(samples_ms[-1], 3),
+    }
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KB on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    value = fn(*args)
+    return value, time.perf_counter() - start
+
+
+def _run_scale(path: str, fmt: str, iterations: int) -> dict:
+    """Load one file and run the suite (in a worker process)."""
+    from retail_insights_agent.config import TABLE_SCHEMAS, ROLLUPS_ENABLED, RESULT_BUDGET_ROWS
+    from retail_insights_agent.database.duckdb.connection import DuckDBConnection
+    from retail_insights_agent.database.duckdb.executor import execute_query
+    from retail_insights_agent.tools.sql_executor import execute_sql, _serialize
+
+    # Importing the package starts the app on its own data - swap in the benchmark table
+    DuckDBConnection.reset()
+    rss_after_import = _peak_rss_mb()
+
+    schema = TABLE_SCHEMAS[TABLE]
+    conn = DuckDBConnection(parquet=fmt == "parquet")
+    conn._ensure_manifest()
+    if fmt == "parquet":
+        rows, load_s = _timed(conn._load_parquet_view, TABLE, schema, [Path(path)])
+    else:
+        rows, load_s = _timed(conn._load_csv, TABLE, [Path(path)], schema)
+    if rows is None:
+        raise RuntimeError(f"Failed to load {path}")
+
+    rollups_s = None
+    if ROLLUPS_ENABLED:
+        _, rollups_s = _timed(conn._build_rollups)
+    conn._tables_loaded = True
+    conn._data_version = f"benchmark:{fmt}:{rows}"
+    DuckDBConnection._instance = conn
+    rss_after_load = _peak_rss_mb()
+
+    queries = {}
+    for name, sql in SQL_SUITE.items():
+        sql = " ".join(sql.split())
+        result = execute_query(sql, max_rows=RESULT_BUDGET_ROWS)  # Warm-up
+        if not result.success:
+            queries[name] = {"error": result.error, "error_code": result.error_code}
+            continue
+
+        samples = []
+        for _ in range(iterations):
+            result, elapsed = _timed(execute_query, sql, RESULT_BUDGET_ROWS)
+            samples.append(elapsed)
+
+        serialize = []
+        for _ in range(iterations):
+            payload, elapsed = _timed(lambda: json.dumps(_serialize(result), default=str))
+            serialize.append(elapsed)
+
+        async def tool_calls():
+            timings = []
+            for _ in range(iterations):
+                start = time.perf_counter()
+                response = await execute_sql(sql)
+                timings.append(time.perf_counter() - start)
+            return response, timings
+
+        response, tool_samples = asyncio.run(tool_calls())
+        queries[name] = {
+            "rows": result.row_count,
+            "truncated": result.truncated,
+            "execute_query": _stats(samples),
+            "serialize": {**_stats(serialize), "bytes": len(payload)},
+            "execute_sql": {
+                **_stats(tool_samples),
+                "summarized": response.get("summarized", False),
+                "bytes": len(json.dumps(response, default=str)),
+            },
+        }
+
+    return {
+        "rows": rows,
+        "format": fmt,
+        "file_mb": round(Path(path).stat().st_size / 1e6, 1),
+        "load_s": round(load_s, 3),
+        "rollups_s": round(rollups_s, 3) if rollups_s is not None else None,
+        "rss_after_import_mb": rss_after_import,
+        "rss_after_load_mb": rss_after_load,
+        "peak_rss_mb": _peak_rss_mb(),
+        "queries": queries,
+    }
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def _metadata(args) -> dict:
+    import duckdb
+
+    return {
+        "commit": _git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "duckdb": duckdb.__version__,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "seed": args.seed,
+        "iterations": args.iterations,
+        "env": {k: os.environ.get(k, "") for k in sorted({*BENCHMARK_ENV, "ROLLUPS_ENABLED", "DUCKDB_THREADS"})},
+    }
+
+
+def _metrics(run: dict) -> dict:
+    """Flatten a run into comparable metrics (lower is better)."""
+    key = f"{run['format']}:{run['rows']}"
+    metrics = {f"{key}:load_s": run["load_s"], f"{key}:peak_rss_mb": run["peak_rss_mb"]}
+    for name, query in run["queries"].items():
+        if "error" not in query:
+            metrics[f"{key}:{name}:execute_query_p95_ms"] = query["execute_query"]["p95_ms"]
+            metrics[f"{key}:{name}:execute_sql_p95_ms"] = query["execute_sql"]["p95_ms"]
+    return metrics
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    List metrics that got worse than the baseline by more than tolerance.
+
+    Returns:
+        List of dicts with metric, baseline, current and change (fraction)
+    """
+    before = {k: v for run in baseline["runs"] for k, v in _metrics(run).items()}
+    regressions = []
+    for run in results["runs"]:
+        for metric, value in _metrics(run).items():
+            old = before.get(metric)
+            if old and value > old * (1 + tolerance):
+                regressions.append(
+                    {"metric": metric, "baseline": old, "current": value, "change": round(value / old - 1, 3)}
+                )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", nargs="+", default=["1m"], help=f"Row counts or {', '.join(SCALES)}")
+    parser.add_argument("--format", nargs="+", choices=["csv", "parquet"], default=["csv"])
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--data-dir", type=Path, default=DEFAULT_OUT, help="Where generated files are kept")
+    parser.add_argument("--output", type=Path, help="Also write the JSON results to this file")
+    parser.add_argument("--compare", type=Path, help="Baseline results; exit 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown vs baseline (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    for key, value in BENCHMARK_ENV.items():
+        os.environ[key] = value
+
+    results = {"metadata": _metadata(args), "runs": []}
+    for scale in args.rows:
+        rows = SCALES.get(scale.lower()) or int(scale)
+        for fmt in args.format:
+            path = generate(rows, fmt, args.data_dir, args.seed)
+            # Fresh interpreter per run: peak RSS and caches start clean
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+                results["runs"].append(pool.submit(_run_scale, str(path), fmt, args.iterations).result())
+
+    if args.compare:
+        results["regressions"] = compare(results, json.loads(args.compare.read_text()), args.tolerance)
+
+    output = json.dumps(results, indent=2)
+    print(output)
+    if args.output:
+        args.output.write_text(output)
+    if results.get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Guardrail per-check overhead benchmark.
+
+Compares the old per-call setup (new InputValidator, config parsed and
+LLMRails built for every message) with the shared RailsPool.
+
+By default only setup overhead is measured, so no OpenAI calls are made.
+Pass --live to time full check_async() calls against the real LLM rail.
+
+Run from the repo root:
+    python -m benchmarks.guardrail_overhead [--iterations 20] [--live]
+"""
+
+import os
+import re
+import time
+import json
+import asyncio
+import argparse
+import statistics
+
+# LLMRails builds its OpenAI client eagerly; a placeholder key is enough for setup timing
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark-placeholder")
+
+from nemoguardrails import LLMRails, RailsConfig
+
+from retail_insights_agent.guardrails.nemo import InputValidator, RailsPool
+from retail_insights_agent.guardrails.nemo.config import RAILS_YAML, RAILS_COLANG, BLOCK_PATTERNS
+
+QUERY = "What are the top 5 categories by sales?"
+
+
+def _stats(samples: list) -> dict:
+    samples_ms = sorted(s * 1000 for s in samples)
+    return {
+        "mean_ms": round(statistics.mean(samples_ms), 3),
+        "p50_ms": round(samples_ms[len(samples_ms) // 2], 3),
+        "max_ms": round(samples_ms[-1], 3),
+    }
+
+
+def _setup_before() -> None:
+    """Per-check setup as done before pooling."""
+    patterns = [re.compile(p) for p in BLOCK_PATTERNS]
+    any(p.search(QUERY) for p in patterns)
+    LLMRails(RailsConfig.from_content(colang_content=RAILS_COLANG, yaml_content=RAILS_YAML))
+
+
+async def _setup_after() -> None:
+    """Per-check setup with the shared pool."""
+    validator = InputValidator()
+    validator._quick_pattern_check(QUERY)
+    RailsPool.get()
+
+
+async def _run(iterations: int, live: bool) -> dict:
+    results = {}
+
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        _setup_before()
+        samples.append(time.perf_counter() - start)
+    results["setup_before"] = _stats(samples)
+
+    await _setup_after()  # Warm-up: compile config once
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await _setup_after()
+        samples.append(time.perf_counter() - start)
+    results["setup_after"] = _stats(samples)
+
+    if live:
+        validator = InputValidator()
+        samples = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            await validator.check_async(QUERY)
+            samples.append(time.perf_counter() - start)
+        results["check_async_live"] = _stats(samples)
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--live", action="store_true", help="Include real LLM rail calls")
+    args = parser.parse_args()
+
+    results = asyncio.run(_run(args.iterations, args.live))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
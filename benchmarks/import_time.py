@@ -0,0 +1,124 @@
+"""
+Import-time benchmark.
+
+Imports the package in fresh interpreters with `python -X importtime`
+and reports the median import time, the slowest second-level imports and
+any heavyweight dependency that got pulled in. Importing the package
+must not load the agents' dependencies, and loading root_agent must not
+load the SQL generator's OpenAI client, PandasAI, NeMo Guardrails or
+langchain_openai - those are imported on first use. A violation exits with status 1, as does a slowdown past
+--tolerance against a --compare baseline.
+
+Run from the repo root:
+    python -m benchmarks.import_time [--runs 5] [--top 15] [--output results.json] [--compare baseline.json]
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Target -> (statement, modules it must not import)
+# (google.adk itself imports langchain_core, via vertexai)
+_FIRST_USE = ["openai", "pandasai", "nemoguardrails", "langchain", "langchain_openai"]
+TARGETS = {
+    "package": ("import retail_insights_agent", _FIRST_USE + ["langchain_core", "google.adk", "duckdb"]),
+    "root_agent": ("from retail_insights_agent import root_agent", _FIRST_USE),
+}
+
+_LINE_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def _profile(statement: str) -> tuple:
+    """Import in a fresh interpreter; returns (wall seconds, {module: (self_us, cumulative_us, depth)})."""
+    env = {**os.environ, "WARMUP_ON_LOAD": "False"}
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True,
+    )
+    wall = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(f"{statement!r} failed:\n{proc.stderr[-2000:]}")
+
+    modules = {}
+    for line in proc.stderr.splitlines():
+        match = _LINE_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules[name] = (int(self_us), int(cumulative_us), len(indent) // 2)
+    return wall, modules
+
+
+def _run_target(statement: str, forbidden: list, runs: int, top: int) -> dict:
+    walls, imports, modules = [], [], {}
+    for _ in range(runs):
+        wall, modules = _profile(statement)
+        walls.append(wall)
+        imports.append(sum(cumulative for _, cumulative, depth in modules.values() if depth == 0))
+
+    # Imports made directly by the top-level ones (e.g. retail_insights_agent.tracing)
+    slowest = sorted(
+        ((name, cumulative) for name, (_, cumulative, depth) in modules.items() if depth == 1),
+        key=lambda item: -item[1],
+    )[:top]
+    loaded = sorted(
+        name for name in forbidden
+        if any(module == name or module.startswith(name + ".") for module in modules)
+    )
+    return {
+        "statement": statement,
+        "import_ms": round(statistics.median(imports) / 1000, 1),
+        "wall_ms": round(statistics.median(walls) * 1000, 1),
+        "modules": len(modules),
+        "slowest": [{"module": name, "cumulative_ms": round(us / 1000, 1)} for name, us in slowest],
+        "forbidden_loaded": loaded,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per target (median is reported)")
+    parser.add_argument("--top", type=int, default=15, help="Slowest second-level imports to list")
+    parser.add_argument("--target", nargs="+", choices=list(TARGETS), default=list(TARGETS))
+    parser.add_argument("--output", type=Path, help="Also write the JSON results to this file")
+    parser.add_argument("--compare", type=Path, help="Baseline results; exit 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown vs baseline (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    results = {
+        "python": sys.version.split()[0],
+        "targets": {name: _run_target(*TARGETS[name], args.runs, args.top) for name in args.target},
+    }
+
+    regressions = []
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["targets"]
+        for name, result in results["targets"].items():
+            old = baseline.get(name, {}).get("import_ms")
+            if old and result["import_ms"] > old * (1 + args.tolerance):
+                regressions.append({
+                    "target": name,
+                    "baseline_ms": old,
+                    "current_ms": result["import_ms"],
+                    "change": round(result["import_ms"] / old - 1, 3),
+                })
+        results["regressions"] = regressions
+
+    output = json.dumps(results, indent=2)
+    print(output)
+    if args.output:
+        args.output.write_text(output)
+    if regressions or any(r["forbidden_loaded"] for r in results["targets"].values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
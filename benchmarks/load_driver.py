@@ -0,0 +1,177 @@
+"""
+Concurrent load driver for the full agent pipeline.
+
+Runs N concurrent ADK sessions through root_agent and reports
+throughput plus p50/p99 latency end to end and per stage (agent runs,
+Gemini calls per agent, tool calls, NeMo rail, SQL generation, DuckDB
+queries), taken from the OpenTelemetry spans the app already emits.
+
+LLM calls are replayed from recorded fixtures by default
+(LLM_REPLAY_MODE=replay), so no network or API keys are needed and the
+numbers measure the orchestration itself. Record fixtures once with a
+live run:
+    LLM_REPLAY_MODE=record python -m benchmarks.load_driver --sessions 1
+
+Run from the repo root:
+    python -m benchmarks.load_driver [--sessions 20] [--turns 1] [--concurrency 20]
+        [--latency recorded|MS] [--questions FILE] [--output results.json]
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+from pathlib import Path
+
+QUESTIONS = [
+    "What are the top 5 categories by revenue?",
+    "Which states have the most orders?",
+    "Show the monthly revenue trend",
+    "What is the cancellation rate by category?",
+    "Which cities in Maharashtra generate the most revenue?",
+    "Compare B2B and B2C order values",
+    "What is the average order value by size?",
+    "Give me an executive summary of sales performance",
+]
+
+APP_NAME = "load_driver"
+
+
+def _percentile(sorted_values: list, pct: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))]
+
+
+def _latency_stats(samples: list) -> dict:
+    samples_ms = sorted(s * 1000 for s in samples)
+    return {
+        "p50_ms": round(_percentile(samples_ms, 50), 1),
+        "p99_ms": round(_percentile(samples_ms, 99), 1),
+        "max_ms": round(samples_ms[-1], 1),
+    }
+
+
+def _install_span_collector():
+    """Collect every finished span in memory (before the app is imported)."""
+    from opentelemetry import trace
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+    return exporter
+
+
+def _stage_records(spans: list) -> list:
+    """Span records, with each Gemini call labelled by the agent that made it."""
+    from retail_insights_agent.tracing.exporters import span_record
+
+    records = [span_record(s) for s in spans]
+    by_id = {r["span_id"]: r for r in records}
+    for record in records:
+        if record["name"] != "call_llm":
+            continue
+        parent = by_id.get(record["parent_id"])
+        while parent is not None and not parent["name"].startswith("agent_run ["):
+            parent = by_id.get(parent["parent_id"])
+        if parent is not None:
+            record["name"] = "call_llm " + parent["name"][len("agent_run "):]
+    return records
+
+
+async def _run_session(runner, user_id: str, questions: list, semaphore: asyncio.Semaphore) -> list:
+    """Run one session's turns in order; returns (latency_s, error) per turn."""
+    from google.genai import types
+
+    session = await runner.session_service.create_session(app_name=APP_NAME, user_id=user_id)
+    turns = []
+    for question in questions:
+        message = types.Content(role="user", parts=[types.Part(text=question)])
+        async with semaphore:
+            start = time.perf_counter()
+            error = None
+            try:
+                async for _ in runner.run_async(user_id=user_id, session_id=session.id, new_message=message):
+                    pass
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            turns.append((time.perf_counter() - start, error))
+    return turns
+
+
+async def _drive(sessions: int, turns: int, concurrency: int, questions: list) -> dict:
+    from google.adk.runners import InMemoryRunner
+    from retail_insights_agent import root_agent
+
+    runner = InMemoryRunner(agent=root_agent, app_name=APP_NAME)
+    semaphore = asyncio.Semaphore(concurrency)
+    plans = [
+        [questions[(s + t) % len(questions)] for t in range(turns)]
+        for s in range(sessions)
+    ]
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(
+        _run_session(runner, f"user-{s}", plan, semaphore) for s, plan in enumerate(plans)
+    ))
+    wall = time.perf_counter() - start
+
+    latencies = [latency for session in results for latency, error in session if error is None]
+    errors = [error for session in results for _, error in session if error is not None]
+    return {"wall_s": wall, "latencies": latencies, "errors": errors}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=20, help="Concurrent ADK sessions")
+    parser.add_argument("--turns", type=int, default=1, help="Questions per session, asked in order")
+    parser.add_argument("--concurrency", type=int, help="Max turns in flight (default: --sessions)")
+    parser.add_argument("--latency", help="Replayed LLM latency: 'recorded' or milliseconds (LLM_REPLAY_LATENCY)")
+    parser.add_argument("--questions", type=Path, help="File with one question per line")
+    parser.add_argument("--output", type=Path, help="Also write the JSON results to this file")
+    args = parser.parse_args()
+
+    # Must be set before the app's config is imported
+    os.environ.setdefault("LLM_REPLAY_MODE", "replay")
+    if args.latency is not None:
+        os.environ["LLM_REPLAY_LATENCY"] = args.latency
+    exporter = _install_span_collector()
+
+    questions = QUESTIONS
+    if args.questions:
+        questions = [q.strip() for q in args.questions.read_text().splitlines() if q.strip()]
+
+    run = asyncio.run(_drive(args.sessions, args.turns, args.concurrency or args.sessions, questions))
+
+    from retail_insights_agent.tracing.report import summarize_spans
+
+    completed = len(run["latencies"])
+    results = {
+        "sessions": args.sessions,
+        "turns": args.turns,
+        "concurrency": args.concurrency or args.sessions,
+        "llm_replay_mode": os.environ["LLM_REPLAY_MODE"],
+        "llm_replay_latency": os.environ.get("LLM_REPLAY_LATENCY", "recorded"),
+        "completed": completed,
+        "errors": len(run["errors"]),
+        "wall_s": round(run["wall_s"], 3),
+        "throughput_rps": round(completed / run["wall_s"], 3) if run["wall_s"] else None,
+        "latency": _latency_stats(run["latencies"]) if completed else None,
+        "stages": summarize_spans(_stage_records(exporter.get_finished_spans()), percentiles=(50, 99)),
+        "error_samples": sorted(set(run["errors"]))[:5],
+    }
+
+    output = json.dumps(results, indent=2)
+    print(output)
+    if args.output:
+        args.output.write_text(output)
+    if run["errors"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
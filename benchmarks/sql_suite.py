@@ -0,0 +1,69 @@
+"""
+Fixed suite of analytical queries over amazon_sales.
+
+Shaped like the SQL the agents generate for typical business questions.
+Names are stable so results can be compared between runs; change a
+query only together with its name.
+"""
+
+SQL_SUITE = {
+    "total_revenue": """
+        SELECT SUM(amount) AS revenue, COUNT(*) AS orders FROM amazon_sales
+        WHERE status != 'Cancelled'
+    """,
+    "revenue_by_category": """
+        SELECT category, SUM(amount) AS revenue, COUNT(*) AS orders
+        FROM amazon_sales GROUP BY category ORDER BY revenue DESC
+    """,
+    "top_states_by_orders": """
+        SELECT state, COUNT(*) AS orders FROM amazon_sales
+        GROUP BY state ORDER BY orders DESC LIMIT 10
+    """,
+    "top_cities_in_state": """
+        SELECT city, SUM(amount) AS revenue FROM amazon_sales
+        WHERE state = 'MAHARASHTRA' GROUP BY city ORDER BY revenue DESC LIMIT 5
+    """,
+    "monthly_trend": """
+        SELECT date_trunc('month', order_date) AS month, SUM(amount) AS revenue, COUNT(*) AS orders
+        FROM amazon_sales GROUP BY month ORDER BY month
+    """,
+    "daily_revenue": """
+        SELECT order_date, SUM(amount) AS revenue FROM amazon_sales
+        GROUP BY order_date ORDER BY order_date
+    """,
+    "cancellation_rate_by_category": """
+        SELECT category,
+               100.0 * COUNT(*) FILTER (WHERE status = 'Cancelled') / COUNT(*) AS cancel_pct
+        FROM amazon_sales GROUP BY category ORDER BY cancel_pct DESC
+    """,
+    "avg_order_value_by_size": """
+        SELECT size, AVG(amount) AS avg_order_value, SUM(quantity) AS units
+        FROM amazon_sales WHERE amount IS NOT NULL GROUP BY size ORDER BY avg_order_value DESC
+    """,
+    "b2b_vs_b2c": """
+        SELECT is_b2b, fulfilment, COUNT(*) AS orders, SUM(amount) AS revenue
+        FROM amazon_sales GROUP BY is_b2b, fulfilment
+    """,
+    "top_skus": """
+        SELECT sku, SUM(quantity) AS units, SUM(amount) AS revenue FROM amazon_sales
+        GROUP BY sku ORDER BY revenue DESC LIMIT 20
+    """,
+    "category_share_by_state": """
+        WITH by_state AS (
+            SELECT state, category, SUM(amount) AS revenue FROM amazon_sales GROUP BY state, category
+        ),
+        totals AS (SELECT state, SUM(revenue) AS total FROM by_state GROUP BY state)
+        SELECT b.state, b.category, 100.0 * b.revenue / t.total AS share
+        FROM by_state b JOIN totals t ON b.state = t.state
+        ORDER BY b.state, share DESC
+    """,
+    "orders_in_window": """
+        SELECT order_id, order_date, category, amount, city FROM amazon_sales
+        WHERE order_date BETWEEN DATE '2022-05-01' AND DATE '2022-05-07' AND category = 'Set'
+        ORDER BY amount DESC NULLS LAST LIMIT 100
+    """,
+    "large_result": """
+        SELECT order_id, order_date, status, category, amount, state FROM amazon_sales
+        WHERE fulfilment = 'Merchant'
+    """,
+}
@@ -0,0 +1,226 @@
+"""
+Seeded synthetic amazon_sales generator.
+
+Writes amazon_sales-shaped data at any scale: a CSV with the source
+file's headers and date format (loaded through the normal CSV path), or
+a Parquet file with the loaded column names and types (attached as a
+view, as in parquet storage mode). Columns, headers and types come from
+TABLE_SCHEMAS; category, state, city, status, size and fulfilment follow
+the skew of the original 128K-row report.
+
+Rows are a pure function of (row number, seed), so the same seed gives
+the same data at every scale and on every machine, whatever DuckDB's
+thread count.
+
+Run from the repo root:
+    python -m benchmarks.synthetic_sales --rows 1000000 [--format parquet] [--out DIR]
+"""
+
+import time
+import argparse
+from pathlib import Path
+
+import duckdb
+
+from retail_insights_agent.config import TABLE_SCHEMAS
+
+TABLE = "amazon_sales"
+SCALES = {"1m": 1_000_000, "10m": 10_000_000, "100m": 100_000_000}
+DEFAULT_OUT = Path(__file__).parent / ".data"
+
+# Value weights, proportional to the counts in the original report
+CATEGORY_WEIGHTS = {
+    "Set": 50284, "kurta": 49877, "Western Dress": 15500, "Top": 10622, "Ethnic Dress": 1159,
+    "Blouse": 926, "Bottom": 440, "Saree": 164, "Dupatta": 3,
+}
+STATUS_WEIGHTS = {
+    "Shipped": 77804, "Shipped - Delivered to Buyer": 28769, "Cancelled": 18332,
+    "Shipped - Returned to Buyer": 1953, "Shipped - Picked Up": 973, "Pending": 658,
+    "Pending - Waiting for Pick Up": 281, "Shipped - Returned to Seller": 145,
+    "Shipped - Out for Delivery": 35, "Shipped - Rejected by Buyer": 11, "Shipping": 8,
+    "Shipped - Lost in Transit": 5, "Shipped - Damaged": 1,
+}
+SIZE_WEIGHTS = {
+    "M": 22711, "L": 22132, "XL": 20876, "XXL": 18096, "S": 17090, "3XL": 14816,
+    "XS": 11161, "6XL": 738, "5XL": 550, "4XL": 427, "Free": 378,
+}
+FULFILMENT_WEIGHTS = {"Amazon": 89698, "Merchant": 39277}
+# State -> (orders, its largest shipping cities)
+STATE_WEIGHTS = {
+    "MAHARASHTRA": (22260, ["MUMBAI", "PUNE", "THANE", "NAGPUR", "NASHIK"]),
+    "KARNATAKA": (17326, ["BENGALURU", "MYSURU", "MANGALURU", "HUBLI"]),
+    "TAMIL NADU": (11483, ["CHENNAI", "COIMBATORE", "MADURAI", "TIRUPPUR"]),
+    "TELANGANA": (11330, ["HYDERABAD", "SECUNDERABAD", "WARANGAL"]),
+    "UTTAR PRADESH": (10638, ["LUCKNOW", "NOIDA", "GHAZIABAD", "KANPUR", "VARANASI"]),
+    "DELHI": (6782, ["NEW DELHI", "DELHI"]),
+    "KERALA": (6585, ["KOCHI", "THIRUVANANTHAPURAM", "KOZHIKODE", "THRISSUR"]),
+    "WEST BENGAL": (5963, ["KOLKATA", "HOWRAH", "SILIGURI"]),
+    "ANDHRA PRADESH": (5430, ["VISAKHAPATNAM", "VIJAYAWADA", "GUNTUR"]),
+    "GUJARAT": (4489, ["AHMEDABAD", "SURAT", "VADODARA", "RAJKOT"]),
+    "HARYANA": (4415, ["GURUGRAM", "FARIDABAD", "PANIPAT"]),
+    "RAJASTHAN": (2705, ["JAIPUR", "JODHPUR", "UDAIPUR"]),
+    "MADHYA PRADESH": (2264, ["INDORE", "BHOPAL", "GWALIOR"]),
+    "ODISHA": (2138, ["BHUBANESWAR", "CUTTACK"]),
+    "BIHAR": (2114, ["PATNA", "GAYA"]),
+    "PUNJAB": (1938, ["LUDHIANA", "AMRITSAR", "JALANDHAR"]),
+    "ASSAM": (1675, ["GUWAHATI", "DIBRUGARH"]),
+    "UTTARAKHAND": (1553, ["DEHRADUN", "HALDWANI"]),
+    "JHARKHAND": (1492, ["RANCHI", "JAMSHEDPUR"]),
+    "GOA": (1106, ["PANAJI", "MARGAO"]),
+    "CHHATTISGARH": (934, ["RAIPUR", "BILASPUR"]),
+    "HIMACHAL PRADESH": (805, ["SHIMLA", "SOLAN"]),
+    "JAMMU & KASHMIR": (754, ["JAMMU", "SRINAGAR"]),
+    "PUDUCHERRY": (360, ["PUDUCHERRY"]),
+    "CHANDIGARH": (350, ["CHANDIGARH"]),
+}
+# Category -> typical order amount in INR
+CATEGORY_PRICES = {
+    "Set": 830, "kurta": 455, "Western Dress": 765, "Top": 525, "Ethnic Dress": 720,
+    "Blouse": 520, "Bottom": 360, "Saree": 800, "Dupatta": 305,
+}
+B2B_SHARE = 0.007
+START_DATE = "2022-03-31"
+DAYS = 91
+
+
+def _uniform(seed: int, stream: int) -> str:
+    """SQL for a uniform [0, 1) draw per row, independent per stream."""
+    return f"((hash(i, {seed}, {stream}) % 1000000) / 1000000.0)"
+
+
+def _quote(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _weighted(weights: dict, draw: str) -> str:
+    """SQL CASE choosing a value with probability proportional to its weight."""
+    total = sum(weights.values())
+    cumulative = 0
+    whens = []
+    for value, weight in list(weights.items())[:-1]:
+        cumulative += weight
+        whens.append(f"WHEN {draw} < {cumulative / total:.8f} THEN {_quote(value)}")
+    last = _quote(list(weights)[-1])
+    return f"CASE {' '.join(whens)} ELSE {last} END"
+
+
+def _cities(draw: str) -> str:
+    """SQL CASE picking one of the row's state's cities."""
+    whens = [
+        f"WHEN state = {_quote(state)} THEN [{', '.join(_quote(c) for c in cities)}]"
+        f"[1 + CAST(floor({draw} * {len(cities)}) AS INTEGER)]"
+        for state, (_, cities) in STATE_WEIGHTS.items()
+    ]
+    return f"CASE {' '.join(whens)} END"
+
+
+def sales_sql(rows: int, seed: int = 42) -> str:
+    """
+    SQL producing rows synthetic orders with the loaded amazon_sales columns and types.
+
+    Args:
+        rows: Number of orders
+        seed: Seed; the same seed always yields the same rows
+    """
+    def u(stream: int) -> str:
+        return _uniform(seed, stream)
+
+    prices = "CASE " + " ".join(
+        f"WHEN category = {_quote(c)} THEN {p}" for c, p in CATEGORY_PRICES.items()
+    ) + " END"
+    states = {state: weight for state, (weight, _) in STATE_WEIGHTS.items()}
+
+    # Draws are made in an inner query so dependent columns (city, amount) can use them
+    return f"""
+SELECT
+    printf('%03d-%07d-%07d', 171 + i % 236, i % 9999991, (i * 7919) % 9999991) AS order_id,
+    CAST(DATE '{START_DATE}' + CAST(floor({u(1)} * {DAYS}) AS INTEGER) AS DATE) AS order_date,
+    status,
+    {_weighted(FULFILMENT_WEIGHTS, u(2))} AS fulfilment,
+    style,
+    style || '-' || size AS sku,
+    category,
+    size,
+    CASE WHEN status = 'Cancelled' AND {u(3)} < 0.4 THEN 0 ELSE 1 + CAST({u(4)} < 0.03 AS INTEGER) END AS quantity,
+    CASE WHEN status = 'Cancelled' AND {u(5)} < 0.4 THEN NULL
+         ELSE CAST(round(({prices}) * (0.55 + 0.9 * {u(6)}), 2) AS DECIMAL(12,2)) END AS amount,
+    {_cities(u(7))} AS city,
+    state,
+    {u(8)} < {B2B_SHARE} AS is_b2b
+FROM (
+    SELECT
+        i,
+        {_weighted(STATUS_WEIGHTS, u(9))} AS status,
+        {_weighted(CATEGORY_WEIGHTS, u(10))} AS category,
+        {_weighted(SIZE_WEIGHTS, u(11))} AS size,
+        {_weighted(states, u(12))} AS state,
+        'JNE' || CAST(3000 + floor({u(13)} * 1400) AS INTEGER) AS style
+    FROM range({rows}) t(i)
+)
+"""
+
+
+def _csv_select(schema: dict) -> str:
+    """Select list turning loaded columns back into the source CSV's headers and formats."""
+    columns = []
+    for orig, new in schema["column_mapping"].items():
+        value = new
+        if schema["column_types"].get(new) == "DATE" and schema.get("date_format"):
+            value = f"strftime({new}, '{schema['date_format']}')"
+        columns.append(f'{value} AS "{orig}"')
+    return ", ".join(columns)
+
+
+def generate(rows: int, fmt: str = "csv", out_dir: Path = DEFAULT_OUT, seed: int = 42, force: bool = False) -> Path:
+    """
+    Write a synthetic amazon_sales file, reusing an existing one.
+
+    Args:
+        rows: Number of orders
+        fmt: "csv" (source headers, loaded with _load_csv) or "parquet" (loaded columns and types)
+        out_dir: Directory for the file
+        seed: Seed for the rows
+        force: Regenerate even if the file exists
+
+    Returns:
+        Path of the file
+    """
+    schema = TABLE_SCHEMAS[TABLE]
+    path = Path(out_dir) / f"{TABLE}_{rows}_s{seed}.{fmt}"
+    if path.exists() and not force:
+        return path
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    select = _csv_select(schema) if fmt == "csv" else "*"
+    options = "FORMAT CSV, HEADER" if fmt == "csv" else "FORMAT PARQUET, COMPRESSION ZSTD"
+
+    conn = duckdb.connect()
+    try:
+        conn.execute(
+            f"COPY (SELECT {select} FROM ({sales_sql(rows, seed)})) "
+            f"TO '{tmp_path}' ({options})"
+        )
+    finally:
+        conn.close()
+    tmp_path.replace(path)
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", default="1m", help=f"Row count or one of {', '.join(SCALES)}")
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--force", action="store_true", help="Regenerate an existing file")
+    args = parser.parse_args()
+
+    rows = SCALES.get(args.rows.lower()) or int(args.rows)
+    start = time.perf_counter()
+    path = generate(rows, args.format, args.out, args.seed, args.force)
+    print(f"{path} ({path.stat().st_size / 1e6:,.1f} MB, {time.perf_counter() - start:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,12 @@
 Retail Insights Agent - GenAI-powered retail analytics.
 
 Multi-agent system for natural language queries on retail sales data.
-Built with Google ADK, DuckDB, PandasAI, and NVIDIA NeMo Guardrails.
+Built with Google ADK, DuckDB, OpenAI (or PandasAI), and NVIDIA NeMo Guardrails.
+
+Importing the package is cheap: root_agent (and with it google.adk) is
+imported when first accessed, and the data, SQL generator and
+guardrails are built on first use or by the background warm-up (see
+health.py).
 """
 
 import logging
@@ -13,23 +18,25 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 
-print("\n" + "="*60)
-print("  RETAIL INSIGHTS AGENT - Startup")
-print("="*60)
-
 # Import config first to set up authentication
 from . import config
 
-# Eager load: Initialize DuckDB and load CSV tables at startup
-from .database.duckdb import get_connection
-get_connection()
+# Export spans before anything runs (no-op unless TRACING_ENABLED)
+from .tracing import setup_tracing
+setup_tracing()
+
+
+def __getattr__(name: str):
+    # ADK looks up root_agent when it loads the app - define the agents only then
+    if name == "root_agent":
+        from .agents import root_agent
 
-# Import agents after database is ready
-from .agents import root_agent
+        if config.WARMUP_ON_LOAD:
+            from .health import start_warmup
+            start_warmup()
+        return root_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-print("="*60)
-print("  RETAIL INSIGHTS AGENT - Ready!")
-print("="*60 + "\n")
 
 # ADK entry point
 __all__ = ["root_agent"]
@@ -5,7 +5,8 @@ This file exports the root_agent for ADK CLI.
 Run with: adk web
 """
 
-from .agents import root_agent
+# Through the package, so loading the agent also starts the warm-up
+from . import root_agent
 
 # Re-export for ADK
 __all__ = ["root_agent"]
@@ -8,12 +8,13 @@ Executes SQL queries and retrieves data from DuckDB.
 from google.adk.agents import LlmAgent
 
 from ..tools import execute_sql
+from ..replay import agent_model
 from ..config import PIPELINE_AGENT_MODEL
 
 
 data_extraction_agent = LlmAgent(
     name="data_extraction_agent",
-    model=PIPELINE_AGENT_MODEL,
+    model=agent_model(PIPELINE_AGENT_MODEL),
 
     description=(
         "Executes SQL queries against the retail database and retrieves data. "
@@ -36,8 +37,10 @@ IMPORTANT:
 - Do not modify the query
 - Return the raw results from the execute_sql tool
 - Include the data, columns, and row count in your response
+- If the result is marked summarized, return the summary and sample rows and say the full result was too large
 
-If the query execution fails, report the error clearly.""",
+If the query execution fails, report the error clearly, including its error_code
+(e.g. "too_expensive" or "timeout" - the query was stopped to protect the database).""",
 
     tools=[execute_sql],
     output_key="query_results",
@@ -0,0 +1,252 @@
+"""
+Fast Path Agent.
+
+Front of the analytics agent. Common templated questions (top-N,
+breakdowns, totals, rates) are answered with locally built SQL and a
+deterministic formatter - no LLM calls. Everything else is delegated to
+the full pipeline.
+"""
+
+import logging
+from datetime import date
+from typing import AsyncGenerator, Optional
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.genai import types
+
+from ..database.duckdb import execute_query, run_in_worker
+from ..database.templates import TemplateMatch, match_question
+from ..database.templates import catalog
+from ..tracing import set_attributes
+from ..config import FAST_PATH_ENABLED, QUERY_TIMEOUT_SECONDS
+
+logger = logging.getLogger(__name__)
+
+_MAX_BULLETS = 5
+
+
+def _compact(value: float) -> str:
+    for threshold, suffix in ((1e9, "B"), (1e6, "M"), (1e3, "K")):
+        if abs(value) >= threshold:
+            return f"{value / threshold:.1f}{suffix}"
+    return f"{value:,.0f}"
+
+
+def _format_value(value, kind: str) -> str:
+    """Format a metric value the way the response agent does (₹35.7M, 22K, 45%)."""
+    if value is None:
+        return "n/a"
+    if kind == "currency":
+        return f"₹{_compact(value)}"
+    if kind == "pct":
+        return f"{value:.1f}%"
+    if value >= 10_000:
+        return _compact(value)
+    return f"{value:,.0f}"
+
+
+def _format_label(value, dimension: Optional[str]) -> str:
+    """Display form of a dimension value."""
+    if value is None:
+        return "Unknown"
+    if dimension in catalog.TIME_DIMENSIONS:
+        return date.fromisoformat(str(value)[:10]).strftime("%b %Y")
+    text = str(value)
+    return text.title() if text.isupper() else text
+
+
+def _filter_text(match: TemplateMatch) -> str:
+    return f" ({', '.join(match.filters)})" if match.filters else ""
+
+
+def _format_ranked(match: TemplateMatch, records: list) -> str:
+    """Top-N and breakdown answers."""
+    dimension = match.dimension
+    _, _, singular, plural, _ = catalog.DIMENSIONS[dimension]
+    _, alias, metric_label, kind, _ = catalog.METRICS[match.metrics[0]]
+    chronological = match.intent == "breakdown" and dimension in catalog.TIME_DIMENSIONS
+    has_share = "share_pct" in records[0]
+
+    lines = []
+    if chronological:
+        peak = max(records, key=lambda r: r[alias] or 0)
+        lines.append(f"**{_format_label(peak[dimension], dimension)} Was the Peak {singular.title()} for {metric_label}**")
+        lines.append("")
+        lines.append(f"{metric_label} by {singular}{_filter_text(match)}, in chronological order.")
+    else:
+        leader = _format_label(records[0][dimension], dimension)
+        if match.ascending:
+            lines.append(f"**{leader} Has the Lowest {metric_label} Among {plural.title()}**")
+        else:
+            lines.append(f"**{leader} Leads {plural.title()} by {metric_label}**")
+        lines.append("")
+        if has_share and not match.ascending:
+            context = f"{leader} accounts for {records[0]['share_pct']:.1f}% of total {metric_label.lower()}{_filter_text(match)}."
+        else:
+            context = f"{plural.title()} ranked by {metric_label.lower()}{_filter_text(match)}."
+        if len(records) > _MAX_BULLETS:
+            context += f" Top {_MAX_BULLETS} of {len(records)} shown."
+        lines.append(context)
+
+    lines.append("")
+    for record in records[:_MAX_BULLETS]:
+        bullet = f"- **{_format_label(record[dimension], dimension)}:** {_format_value(record[alias], kind)}"
+        if has_share and not chronological:
+            bullet += f" ({record['share_pct']:.1f}%)"
+        lines.append(bullet)
+
+    lines.append("")
+    if chronological and len(records) > 1 and records[0][alias]:
+        first, last = records[0][alias], records[-1][alias] or 0
+        change = 100.0 * (last - first) / first
+        direction = "up" if change >= 0 else "down"
+        lines.append(
+            f"**Insight:** {metric_label} is {direction} {abs(change):.0f}% from "
+            f"{_format_label(records[0][dimension], dimension)} to {_format_label(records[-1][dimension], dimension)}."
+        )
+    elif has_share and not match.ascending and len(records) > 1:
+        top = records[:3]
+        combined = sum(r["share_pct"] or 0 for r in top)
+        mix = "a highly concentrated" if combined >= 60 else "a moderately concentrated" if combined >= 40 else "a broad-based"
+        lines.append(f"**Insight:** The top {len(top)} {plural} make up {combined:.0f}% of {metric_label.lower()} - {mix} mix.")
+    elif match.ascending:
+        lines.append(f"**Insight:** These {plural} contribute the least and may warrant a closer look.")
+    else:
+        lines.append(f"**Insight:** {_format_label(records[0][dimension], dimension)} stands out on {metric_label.lower()}.")
+
+    return "\n".join(lines)
+
+
+def _format_rate(match: TemplateMatch, records: list) -> str:
+    """Rate answers, overall or by dimension."""
+    _, alias, label, _ = catalog.RATES[match.rate]
+    lines = []
+
+    if not match.dimension:
+        record = records[0]
+        rate = record[alias] or 0.0
+        lines.append(f"**{label}: {_format_value(rate, 'pct')}**")
+        lines.append("")
+        lines.append(f"Based on {record['orders']:,} orders{_filter_text(match)}.")
+        lines.append("")
+        if rate > 0:
+            lines.append(f"**Insight:** Roughly 1 in {max(1, round(100 / rate))} orders falls in this group.")
+        else:
+            lines.append("**Insight:** No orders fall in this group.")
+        return "\n".join(lines)
+
+    dimension = match.dimension
+    _, _, _, plural, _ = catalog.DIMENSIONS[dimension]
+    leader = _format_label(records[0][dimension], dimension)
+    word = "Lowest" if match.ascending else "Highest"
+    lines.append(f"**{leader} Has the {word} {label}**")
+    lines.append("")
+    context = f"{label} by {catalog.DIMENSIONS[dimension][2]}{_filter_text(match)}."
+    if len(records) > _MAX_BULLETS:
+        context += f" Top {_MAX_BULLETS} of {len(records)} shown."
+    lines.append(context)
+    lines.append("")
+    for record in records[:_MAX_BULLETS]:
+        lines.append(
+            f"- **{_format_label(record[dimension], dimension)}:** "
+            f"{_format_value(record[alias], 'pct')} ({record['orders']:,} orders)"
+        )
+    lines.append("")
+    rates = [r[alias] for r in records if r[alias] is not None]
+    spread = max(rates) - min(rates) if rates else 0.0
+    lines.append(f"**Insight:** {label} varies by {spread:.1f} points across {plural}.")
+    return "\n".join(lines)
+
+
+def _format_total(match: TemplateMatch, records: list) -> str:
+    """Single-row totals."""
+    record = records[0]
+    first = match.metrics[0]
+    _, alias, label, kind, _ = catalog.METRICS[first]
+    prefix = "" if first == "aov" else "Total "
+
+    lines = [f"**{prefix}{label}: {_format_value(record[alias], kind)}**", ""]
+    lines.append(f"Across all orders{_filter_text(match)}.")
+
+    if len(match.metrics) > 1:
+        lines.append("")
+        for metric in match.metrics:
+            _, alias, label, kind, _ = catalog.METRICS[metric]
+            lines.append(f"- **{label}:** {_format_value(record[alias], kind)}")
+
+    if "revenue" in match.metrics and "orders" in match.metrics and record.get("orders"):
+        per_order = (record["revenue"] or 0) / record["orders"]
+        lines.append("")
+        lines.append(f"**Insight:** That works out to about {_format_value(per_order, 'currency')} per order.")
+    return "\n".join(lines)
+
+
+def format_answer(match: TemplateMatch, records: list) -> str:
+    """Format query results as an executive-ready answer."""
+    if match.intent == "rate":
+        return _format_rate(match, records)
+    if match.intent == "total":
+        return _format_total(match, records)
+    return _format_ranked(match, records)
+
+
+def answer_from_template(question: str, timeout: Optional[float] = QUERY_TIMEOUT_SECONDS) -> Optional[tuple]:
+    """
+    Answer a question from the template catalog.
+
+    Blocking: matching may rebuild the matcher (DISTINCT scans) and the
+    query runs on DuckDB - from async code, run it with run_in_worker.
+
+    Returns:
+        (sql, answer_text), or None if no template matches or the query
+        returns nothing (the full pipeline then handles it)
+    """
+    match = match_question(question)
+    if match is None:
+        return None
+
+    result = execute_query(match.sql, timeout=timeout)
+    if not result.success or result.row_count == 0:
+        logger.info(f"Fast path query failed or empty, falling back: {result.error}")
+        return None
+
+    return match.sql, format_answer(match, result.to_records())
+
+
+class FastPathAgent(BaseAgent):
+    """
+    Answers templated questions locally, delegating the rest.
+
+    The first sub-agent is the fallback (the full analytics pipeline).
+    """
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        question = ""
+        if ctx.user_content and ctx.user_content.parts:
+            question = " ".join(p.text for p in ctx.user_content.parts if p.text)
+
+        answer = None
+        if FAST_PATH_ENABLED and question.strip():
+            try:
+                # Off the event loop; the worker's timeout covers matching and the query
+                answer = await run_in_worker(answer_from_template, question, None, timeout=QUERY_TIMEOUT_SECONDS)
+            except Exception as e:
+                logger.error(f"Fast path failed, falling back: {e}")
+
+        set_attributes(**{"retail.fast_path": bool(answer)})
+        if answer:
+            sql, text = answer
+            logger.info(f"Fast path answered: {question[:50]}...")
+            yield Event(
+                invocation_id=ctx.invocation_id,
+                author=self.name,
+                branch=ctx.branch,
+                content=types.Content(role="model", parts=[types.Part(text=text)]),
+                actions=EventActions(state_delta={"generated_sql": sql, "final_response": text}),
+            )
+            return
+
+        async for event in self.sub_agents[0].run_async(ctx):
+            yield event
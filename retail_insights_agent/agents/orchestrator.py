@@ -9,7 +9,8 @@ from google.adk.agents import LlmAgent
 from google.adk.tools.agent_tool import AgentTool
 
 from .pipeline import analytics_agent
-from ..tools import input_guardrail
+from ..tools import input_guardrail, executive_summary
+from ..replay import agent_model
 from ..config import ORCHESTRATOR_MODEL
 
 
@@ -19,7 +20,7 @@ analytics_agent_tool = AgentTool(agent=analytics_agent)
 
 root_agent = LlmAgent(
     name="retail_insights_agent",
-    model=ORCHESTRATOR_MODEL,
+    model=agent_model(ORCHESTRATOR_MODEL),
 
     description=(
         "Retail Insights Assistant - An intelligent agent that analyzes retail sales data. "
@@ -67,12 +68,13 @@ Call `input_guardrail(user_query="<question>")`
 
 **Summary Request** ("summary", "overview", "report", "insights"):
 1. Call input_guardrail once with original request
-2. Call analytics_agent IN PARALLEL (4 calls in ONE response):
-   - "What is the total revenue and order count?"
-   - "What are the top 5 categories by sales?"
-   - "What are the top 5 states by order count?"
-   - "What is the distribution of order status?"
+2. Call executive_summary ONCE - it returns every section in one payload:
+   - period and total (revenue, orders, avg_order_value)
+   - top_categories (by revenue, with share %)
+   - top_states (by orders, with share %)
+   - status_distribution (orders and share % per status)
 3. SYNTHESIZE results into executive summary (see template)
+   - Use analytics_agent only for a follow-up the payload doesn't cover
 
 ---
 
@@ -100,7 +102,7 @@ What would you like to explore?
 Present the pipeline response directly - it's already formatted professionally.
 
 ### Executive Summary:
-Synthesize the 4 pipeline results into a cohesive narrative. Use this structure:
+Synthesize the executive_summary payload into a cohesive narrative. Use this structure:
 
 ```
 **Executive Summary: Amazon India Sales Performance**
@@ -152,5 +154,5 @@ Before EVERY response, verify:
 ✓ Response is concise and scannable
 ✓ Would impress a senior executive""",
 
-    tools=[input_guardrail, analytics_agent_tool],
+    tools=[input_guardrail, executive_summary, analytics_agent_tool],
 )
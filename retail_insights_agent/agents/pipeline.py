@@ -5,21 +5,29 @@ Orchestrates the 3-agent pipeline for business analytics:
 1. Query Resolution: Interprets business questions
 2. Data Extraction: Retrieves relevant data
 3. Response Validation: Formats insights
+
+Templated questions are answered by the fast path in front of the
+pipeline without any LLM calls (see fast_path.py). With
+ANALYTICS_MODE=single_call the single-call agent replaces the pipeline
+(see single_call.py).
 """
 
 from google.adk.agents import SequentialAgent
 
+from .fast_path import FastPathAgent
+from .single_call import SingleCallAgent, response_formatter_agent
 from .query_resolution import query_resolution_agent
 from .data_extraction import data_extraction_agent
 from .response_validation import response_validation_agent
+from ..config import ANALYTICS_MODE
 
 
-analytics_agent = SequentialAgent(
-    name="analytics_agent",
+analytics_pipeline = SequentialAgent(
+    name="analytics_pipeline",
 
     description=(
-        "Analytics agent that processes business questions about retail data. "
-        "Interprets queries, retrieves data, and delivers formatted insights."
+        "Three-agent pipeline that interprets business questions, retrieves data, "
+        "and delivers formatted insights."
     ),
 
     sub_agents=[
@@ -28,3 +36,26 @@ analytics_agent = SequentialAgent(
         response_validation_agent,
     ],
 )
+
+
+single_call_agent = SingleCallAgent(
+    name="single_call_analytics",
+
+    description=(
+        "Generates and runs SQL locally, then formats the results with a single LLM call."
+    ),
+
+    sub_agents=[response_formatter_agent],
+)
+
+
+analytics_agent = FastPathAgent(
+    name="analytics_agent",
+
+    description=(
+        "Analytics agent that processes business questions about retail data. "
+        "Interprets queries, retrieves data, and delivers formatted insights."
+    ),
+
+    sub_agents=[single_call_agent if ANALYTICS_MODE == "single_call" else analytics_pipeline],
+)
@@ -8,12 +8,13 @@ Converts natural language questions into SQL queries.
 from google.adk.agents import LlmAgent
 
 from ..tools import generate_sql
+from ..replay import agent_model
 from ..config import PIPELINE_AGENT_MODEL
 
 
 query_resolution_agent = LlmAgent(
     name="query_resolution_agent",
-    model=PIPELINE_AGENT_MODEL,
+    model=agent_model(PIPELINE_AGENT_MODEL),
 
     description=(
         "Converts natural language questions about retail sales data into SQL queries. "
@@ -27,11 +28,11 @@ Convert the user's question into a SQL query using the generate_sql tool.
 TABLE: amazon_sales (128K orders, Apr-Jun 2022)
 
 COLUMNS:
-- order_id, order_date, status, fulfilment
+- order_id, order_date (DATE), status, fulfilment
 - category (product type: Set, Kurta, Western Dress, Top, Ethnic Dress, etc.)
 - sku, style, size, quantity
 - amount (INR, null for cancelled)
-- city, state, is_b2b
+- city, state, is_b2b (BOOLEAN)
 
 QUERY GUIDANCE:
 - "products" or "product categories" → Use `category` column (NOT sku)
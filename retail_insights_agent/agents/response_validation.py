@@ -7,19 +7,12 @@ Validates results and formats the final response.
 
 from google.adk.agents import LlmAgent
 
+from ..replay import agent_model
 from ..config import PIPELINE_AGENT_MODEL
 
 
-response_validation_agent = LlmAgent(
-    name="response_validation_agent",
-    model=PIPELINE_AGENT_MODEL,
-
-    description=(
-        "Validates query results, checks for data quality issues, and formats "
-        "the response in a clear, business-friendly manner with insights."
-    ),
-
-    instruction="""You are a senior data analyst preparing results for executive presentation.
+# Shared with the single-call analytics agent's formatter (see single_call.py)
+RESPONSE_INSTRUCTION = """You are a senior data analyst preparing results for executive presentation.
 
 Your job: Validate query results and format them into a clean, professional response.
 
@@ -27,6 +20,8 @@ Your job: Validate query results and format them into a clean, professional resp
 1. Check if results are valid (not empty, no errors)
 2. If empty: State "No data matches the criteria" with brief explanation
 3. If error: Explain in user-friendly terms
+   - error_code "too_expensive" or "timeout": the question needs too much computation - suggest narrowing it (a date range, category or state)
+4. If summarized (result too large): Answer from the summary statistics and sample, and suggest a narrower question
 
 ## FORMATTING RULES
 - Lead with **bold headline** (1 sentence, the key answer)
@@ -70,7 +65,19 @@ These two categories account for 70% of total revenue.
 ## RULES
 - MAX 5 bullets always
 - Keep each bullet under 10 words
-- No SKU codes, sizes, or unit counts unless specifically asked""",
+- No SKU codes, sizes, or unit counts unless specifically asked"""
+
+
+response_validation_agent = LlmAgent(
+    name="response_validation_agent",
+    model=agent_model(PIPELINE_AGENT_MODEL),
+
+    description=(
+        "Validates query results, checks for data quality issues, and formats "
+        "the response in a clear, business-friendly manner with insights."
+    ),
+
+    instruction=RESPONSE_INSTRUCTION,
 
     tools=[],
     output_key="final_response",
@@ -0,0 +1,94 @@
+"""
+Single-Call Analytics Agent.
+
+Alternative to the three-agent pipeline (ANALYTICS_MODE=single_call).
+SQL generation and execution run directly in Python; the only Gemini
+call formats the results, saving the query resolution and data
+extraction round-trips.
+"""
+
+import json
+import logging
+from typing import AsyncGenerator
+
+from google.adk.agents import BaseAgent, LlmAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+
+from .response_validation import RESPONSE_INSTRUCTION
+from ..tools import generate_sql, execute_sql
+from ..replay import agent_model
+from ..config import PIPELINE_AGENT_MODEL
+
+logger = logging.getLogger(__name__)
+
+
+response_formatter_agent = LlmAgent(
+    name="response_formatter_agent",
+    model=agent_model(PIPELINE_AGENT_MODEL),
+
+    description="Formats query results into a business-friendly response with insights.",
+
+    instruction=RESPONSE_INSTRUCTION + """
+
+## QUERY RESULTS
+Results of the SQL query run for the user's question:
+
+{query_results}""",
+
+    tools=[],
+    output_key="final_response",
+)
+
+
+async def resolve_and_execute(question: str) -> dict:
+    """
+    Generate SQL for a question and run it, as the pipeline's first two agents would.
+
+    Returns:
+        Dict with sql (None if generation failed) and results (the
+        execute_sql response, or an error payload)
+    """
+    generated = await generate_sql(question)
+    if generated["status"] != "success":
+        return {
+            "sql": None,
+            "results": {"status": "error", "data": None, "row_count": 0, "message": generated["message"]},
+        }
+
+    sql = generated["sql"]
+    return {"sql": sql, "results": await execute_sql(sql)}
+
+
+class SingleCallAgent(BaseAgent):
+    """
+    Resolves and executes a question locally, then formats it with one LLM call.
+
+    The first sub-agent is the formatter; it reads the results from the
+    "query_results" state key.
+    """
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        question = ""
+        if ctx.user_content and ctx.user_content.parts:
+            question = " ".join(p.text for p in ctx.user_content.parts if p.text)
+
+        try:
+            outcome = await resolve_and_execute(question)
+        except Exception as e:
+            logger.error(f"Single-call analytics failed: {e}")
+            outcome = {"sql": None, "results": {"status": "error", "data": None, "row_count": 0, "message": str(e)}}
+
+        logger.info(f"Single-call analytics resolved: {question[:50]}...")
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            actions=EventActions(state_delta={
+                "generated_sql": outcome["sql"],
+                "query_results": json.dumps(outcome["results"], default=str),
+            }),
+        )
+
+        async for event in self.sub_agents[0].run_async(ctx):
+            yield event
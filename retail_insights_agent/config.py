@@ -5,6 +5,8 @@ All settings in one place for easy management and environment overrides.
 """
 
 import os
+import json
+import hashlib
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -29,7 +31,7 @@ os.environ.setdefault("GOOGLE_CLOUD_PROJECT", os.getenv("GOOGLE_CLOUD_PROJECT",
 os.environ.setdefault("GOOGLE_CLOUD_LOCATION", os.getenv("GOOGLE_CLOUD_LOCATION", "us-central1"))
 
 
-# LLM - OpenAI (PandasAI + NeMo Guardrails)
+# LLM - OpenAI (SQL generation + NeMo Guardrails)
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o")
 
@@ -38,11 +40,114 @@ ORCHESTRATOR_MODEL = os.getenv("ORCHESTRATOR_MODEL", "gemini-2.5-pro")      # Ro
 PIPELINE_AGENT_MODEL = os.getenv("PIPELINE_AGENT_MODEL", "gemini-2.5-flash")  # Sub-agents in QA pipeline
 
 
+# Analytics fast path - answer templated questions without LLM calls
+FAST_PATH_ENABLED = os.getenv("FAST_PATH_ENABLED", "True").lower() == "true"
+
+# Analytics mode behind the fast path
+# "single_call": generate and run SQL locally, one Gemini call formats the answer
+# "pipeline":    three-agent SequentialAgent (query resolution, data extraction, response validation)
+ANALYTICS_MODE = os.getenv("ANALYTICS_MODE", "single_call")
+
+# Startup - the DuckDB tables, SQL generator and guardrails are built on first use. With
+# WARMUP_ON_LOAD a background thread builds them as soon as the agent is loaded; readiness
+# (see health.py) stays false until it has finished
+WARMUP_ON_LOAD = os.getenv("WARMUP_ON_LOAD", "True").lower() == "true"
+
+
+# DuckDB Storage
+# "snapshot": build a typed on-disk DuckDB file once, attach it read-only on later starts
+# "memory":   re-parse the source CSVs into an in-memory database on every start
+# "parquet":  query Parquet files in place through views - source CSVs are converted once
+#             per file into PARQUET_DIR, or a table can point at existing files ("parquet_glob")
+DUCKDB_STORAGE_MODE = os.getenv("DUCKDB_STORAGE_MODE", "snapshot")
+SNAPSHOT_DIR = Path(os.getenv("DUCKDB_SNAPSHOT_DIR", DATA_DIR / ".snapshots"))
+PARQUET_DIR = Path(os.getenv("DUCKDB_PARQUET_DIR", DATA_DIR / ".parquet"))
+
+# DuckDB resource limits - intermediates beyond the memory limit spill to the temp directory
+DUCKDB_MEMORY_LIMIT = os.getenv("DUCKDB_MEMORY_LIMIT", "")  # e.g. "4GB"; empty = DuckDB default (80% of RAM)
+DUCKDB_TEMP_DIRECTORY = os.getenv("DUCKDB_TEMP_DIRECTORY", str(DATA_DIR / ".duckdb_tmp"))
+
+# DuckDB concurrency - queries run on pooled cursors, at most DUCKDB_MAX_CONCURRENCY at once;
+# all of them share one DuckDB worker pool of DUCKDB_THREADS threads (empty = one per core)
+DUCKDB_MAX_CONCURRENCY = int(os.getenv("DUCKDB_MAX_CONCURRENCY", "4"))
+DUCKDB_THREADS = os.getenv("DUCKDB_THREADS", "")
+# Query admission - only single SELECT/WITH statements run; plans whose joins EXPLAIN
+# estimates at more rows than the budget are rejected, and queries running past the
+# timeout are interrupted (0 = no limit for either)
+QUERY_MAX_ESTIMATED_ROWS = int(os.getenv("QUERY_MAX_ESTIMATED_ROWS", "100000000"))
+QUERY_TIMEOUT_SECONDS = float(os.getenv("QUERY_TIMEOUT_SECONDS", "30"))
+
+
+# Query Results
+# Tool response encoding: "records" ([{col: value}, ...]) or "columns" ({col: [values]})
+RESULT_FORMAT = os.getenv("RESULT_FORMAT", "records")
+# Result budget for tool responses - larger results are summarized instead
+RESULT_BUDGET_ROWS = int(os.getenv("RESULT_BUDGET_ROWS", "200"))
+RESULT_BUDGET_BYTES = int(os.getenv("RESULT_BUDGET_BYTES", str(32 * 1024)))
+RESULT_SUMMARY_TOP_K = int(os.getenv("RESULT_SUMMARY_TOP_K", "5"))
+RESULT_SAMPLE_ROWS = int(os.getenv("RESULT_SAMPLE_ROWS", "10"))
+
+# Query Result Cache (canonical SQL + data version -> result)
+RESULT_CACHE_ENABLED = os.getenv("RESULT_CACHE_ENABLED", "True").lower() == "true"
+RESULT_CACHE_MAX_BYTES = int(os.getenv("RESULT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+
+# SQL Generation Cache (NL question -> generated SQL)
+SQL_CACHE_ENABLED = os.getenv("SQL_CACHE_ENABLED", "True").lower() == "true"
+SQL_CACHE_MAX_ENTRIES = int(os.getenv("SQL_CACHE_MAX_ENTRIES", "1024"))
+SQL_CACHE_TTL_SECONDS = float(os.getenv("SQL_CACHE_TTL_SECONDS", "86400"))
+SQL_CACHE_SIMILARITY_THRESHOLD = float(os.getenv("SQL_CACHE_SIMILARITY_THRESHOLD", "0.9"))
+SQL_CACHE_PATH = os.getenv("SQL_CACHE_PATH", "")  # Empty = in-memory only
+
+# SQL Generation backend
+# "native":   one OpenAI call whose prompt holds the schema, field descriptions and a column
+#             profile (top values, numeric ranges, date span - built once per data version);
+#             the model replies with the SQL itself
+# "pandasai": PandasAI agents generate Python code and the SQL is extracted from it
+SQL_GENERATOR = os.getenv("SQL_GENERATOR", "native")
+SQL_PROFILE_TOP_K = int(os.getenv("SQL_PROFILE_TOP_K", "10"))  # Most frequent values listed per dimension column
+# PandasAI concurrency - each question is generated by an isolated PandasAI agent
+# (own memory, connectors and LLM client) borrowed from a pool of at most this many
+SQL_GENERATOR_MAX_CONCURRENCY = int(os.getenv("SQL_GENERATOR_MAX_CONCURRENCY", "4"))
+
+
 # Guardrails
 GUARDRAILS_BLOCKED_MESSAGE = """I'm focused on retail sales analytics. If you have questions about sales data, I'm here to help."""
 
+# Local intent classifier - confident allow/block without the LLM rail
+INTENT_CLASSIFIER_ENABLED = os.getenv("INTENT_CLASSIFIER_ENABLED", "True").lower() == "true"
+INTENT_ALLOW_THRESHOLD = float(os.getenv("INTENT_ALLOW_THRESHOLD", "0.85"))
+INTENT_BLOCK_THRESHOLD = float(os.getenv("INTENT_BLOCK_THRESHOLD", "0.15"))
+
+# Guardrail verdict cache (normalized query -> allow/block from the LLM rail)
+GUARDRAILS_CACHE_ENABLED = os.getenv("GUARDRAILS_CACHE_ENABLED", "True").lower() == "true"
+GUARDRAILS_CACHE_MAX_ENTRIES = int(os.getenv("GUARDRAILS_CACHE_MAX_ENTRIES", "4096"))
+GUARDRAILS_CACHE_TTL_SECONDS = float(os.getenv("GUARDRAILS_CACHE_TTL_SECONDS", "86400"))
+GUARDRAILS_CACHE_PATH = os.getenv("GUARDRAILS_CACHE_PATH", "")  # Empty = in-memory only
+
+
+# Tracing - OpenTelemetry spans for ADK agent runs, Gemini calls (with token usage) and tools,
+# plus NeMo/SQL generation LLM calls and DuckDB queries; exported to a JSONL file or OTLP/HTTP collector
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "False").lower() == "true"
+TRACE_EXPORTER = os.getenv("TRACE_EXPORTER", "jsonl")  # "jsonl" or "otlp"
+TRACE_FILE = Path(os.getenv("TRACE_FILE") or BASE_DIR / "traces.jsonl")
+TRACE_OTLP_ENDPOINT = os.getenv("TRACE_OTLP_ENDPOINT", "")  # Empty = OTEL_EXPORTER_OTLP_* env or localhost:4318
+TRACE_SERVICE_NAME = os.getenv("TRACE_SERVICE_NAME", "retail-insights-agent")
+
+
+# LLM record/replay - stand-ins for the Gemini agents, the SQL generator's OpenAI client and the
+# NeMo rails LLM, for offline load tests. "off", "record" (call the real LLMs and save each
+# response to LLM_FIXTURES_DIR) or "replay" (serve saved responses; no network or API keys)
+LLM_REPLAY_MODE = os.getenv("LLM_REPLAY_MODE", "off")
+LLM_FIXTURES_DIR = Path(os.getenv("LLM_FIXTURES_DIR") or BASE_DIR / "fixtures" / "llm")
+LLM_REPLAY_LATENCY = os.getenv("LLM_REPLAY_LATENCY", "recorded")  # "recorded" or fixed milliseconds per call
+
 
 # Table Schema - Amazon Sales
+# Sources: "source_file" (one CSV under DATA_DIR) or "source_glob" (e.g. "sales/month=*/*.csv")
+# for tables fed by many files, with "partition_columns" naming Hive-style partition keys
+# (e.g. ["month"]). New files are picked up by ingest_new_files() without a restart.
+# In "parquet" storage mode, "parquet_glob" (under DATA_DIR) serves existing Parquet files directly.
 TABLE_SCHEMAS = {
     "amazon_sales": {
         "source_file": "Amazon Sale Report.csv",
@@ -62,9 +167,26 @@ TABLE_SCHEMAS = {
             "ship-state": "state",
             "B2B": "is_b2b",
         },
+        # Target types applied at load; ENUM types are built from the column's distinct values
+        "column_types": {
+            "order_id": "VARCHAR",
+            "order_date": "DATE",
+            "status": "ENUM",
+            "fulfilment": "ENUM",
+            "style": "VARCHAR",
+            "sku": "VARCHAR",
+            "category": "ENUM",
+            "size": "ENUM",
+            "quantity": "INTEGER",
+            "amount": "DECIMAL(12,2)",
+            "city": "VARCHAR",
+            "state": "ENUM",
+            "is_b2b": "BOOLEAN",
+        },
+        "date_format": "%m-%d-%y",
         "field_descriptions": {
             "order_id": "Unique Amazon order identifier",
-            "order_date": "Order date (MM-DD-YY format)",
+            "order_date": "Order date (DATE)",
             "status": "Order status: Shipped, Cancelled, Pending, Delivered, etc.",
             "fulfilment": "Fulfilment type: Amazon or Merchant",
             "style": "Product style code",
@@ -81,6 +203,35 @@ TABLE_SCHEMAS = {
 }
 
 
+# Materialized Rollups - aggregate tables built from a source table at load time.
+# Each rollup stores row_count plus {measure}_sum/_count/_min/_max per dimension
+# combination; aggregate queries covered by a rollup are answered from the
+# smallest one instead of scanning the fact table.
+ROLLUPS_ENABLED = os.getenv("ROLLUPS_ENABLED", "True").lower() == "true"
+ROLLUP_SCHEMAS = {
+    "rollup_product": {
+        "source_table": "amazon_sales",
+        "dimensions": ["category", "size", "status", "fulfilment", "is_b2b"],
+        "measures": ["amount", "quantity"],
+    },
+    "rollup_state": {
+        "source_table": "amazon_sales",
+        "dimensions": ["state", "category", "status", "fulfilment", "is_b2b"],
+        "measures": ["amount", "quantity"],
+    },
+    "rollup_city": {
+        "source_table": "amazon_sales",
+        "dimensions": ["state", "city", "status"],
+        "measures": ["amount", "quantity"],
+    },
+    "rollup_daily": {
+        "source_table": "amazon_sales",
+        "dimensions": ["order_date", "category", "status", "fulfilment", "is_b2b"],
+        "measures": ["amount", "quantity"],
+    },
+}
+
+
 def get_schema_summary() -> str:
     """Get human-readable schema summary for agent instructions."""
     lines = []
@@ -89,3 +240,9 @@ def get_schema_summary() -> str:
         lines.append(f"- {table_name}: {schema['description']}")
         lines.append(f"  Columns: {', '.join(cols[:8])}...")
     return "\n".join(lines)
+
+
+def get_schema_fingerprint() -> str:
+    """Get a stable hash of TABLE_SCHEMAS (changes whenever the schema does)."""
+    payload = json.dumps(TABLE_SCHEMAS, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
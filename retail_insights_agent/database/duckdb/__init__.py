@@ -1,4 +1,7 @@
 """DuckDB in-memory database for analytical queries."""
 
-from .connection import DuckDBConnection, get_connection
-from .executor import execute_query, QueryResult
+from .connection import DuckDBConnection, get_connection, get_pool_stats, ingest_new_files
+from .executor import execute_query, execute_query_async, stream_query, QueryResult, get_result_cache_stats
+from .workers import run_in_worker, QueryTimeout
+from .budget import summarize_query
+from .summary import compute_summary
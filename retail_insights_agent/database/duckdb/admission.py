@@ -0,0 +1,264 @@
+"""
+Query admission.
+
+Generated SQL runs only if it is a single read-only SELECT/WITH
+statement that reads nothing but the loaded tables and views, and whose
+plan fits the cost budget. Table functions (read_text, read_csv, glob,
+...) and file paths in FROM are rejected, so generated SQL can't read
+files such as .env or service-account.json. The cost of a plan is the
+largest row count any join in it is estimated to produce, read from
+DuckDB's EXPLAIN output. Rejections carry a code the pipeline can act on.
+"""
+
+import re
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from .sql_text import tokenize
+
+logger = logging.getLogger(__name__)
+
+# Error codes (QueryResult.error_code / execute_sql "error_code")
+EMPTY_QUERY = "empty_query"
+NOT_A_QUERY = "not_a_query"
+TOO_EXPENSIVE = "too_expensive"
+TIMEOUT = "timeout"
+EXECUTION_ERROR = "execution_error"
+
+# Join operators whose EXPLAIN estimate is missing or ignores the join
+# condition - their output is bounded by the product of their inputs instead
+_NESTED_LOOP_JOINS = {
+    "CROSS_PRODUCT", "NESTED_LOOP_JOIN", "BLOCKWISE_NL_JOIN", "PIECEWISE_MERGE_JOIN", "IE_JOIN",
+}
+
+# Rendered EXPLAIN boxes are 29 characters wide, laid out on a grid
+_BOX_WIDTH = 29
+_ESTIMATE_RE = re.compile(r"EC:\s*(\d+)|~(\d+) rows")
+
+
+@dataclass
+class Rejection:
+    """Why a query was not admitted."""
+
+    code: str
+    message: str
+    estimated_rows: Optional[int] = None
+
+
+def check_statement(sql: str) -> Optional[Rejection]:
+    """Reject anything but a single read-only SELECT/WITH statement."""
+    if not sql or not sql.strip():
+        return Rejection(EMPTY_QUERY, "Empty SQL query")
+
+    tokens = tokenize(sql)
+    while tokens and tokens[-1][1] == ";":
+        tokens.pop()
+    if not tokens:
+        return Rejection(EMPTY_QUERY, "Empty SQL query")
+
+    if any(text == ";" for _, text in tokens):
+        return Rejection(NOT_A_QUERY, "Only a single statement can be executed")
+
+    first = tokens[0][1].upper()
+    if first not in ("SELECT", "WITH"):
+        return Rejection(NOT_A_QUERY, f"Only SELECT queries are permitted, got {first}")
+
+    main = _main_keyword(tokens)
+    if main not in ("SELECT", "WITH"):
+        return Rejection(NOT_A_QUERY, f"Write operations not permitted ({main})")
+    return None
+
+
+def _main_keyword(tokens: list) -> str:
+    """Keyword of the statement after a WITH clause's CTEs (e.g. SELECT or INSERT)."""
+    first = tokens[0][1].upper()
+    if first != "WITH":
+        return first
+
+    depth = 0
+    after_cte = False
+    for _, text in tokens[1:]:
+        if text == "(":
+            depth += 1
+        elif text == ")":
+            depth -= 1
+            after_cte = depth == 0
+        elif depth == 0:
+            # "name(cols) AS (...)": a column list is followed by AS, a CTE body by "," or the statement
+            if after_cte and text != "," and text.upper() != "AS":
+                return text.upper()
+            after_cte = False
+    return first
+
+
+def _relations(node, tables: set, functions: set, ctes: set) -> None:
+    """Collect base-table, table-function and CTE names from a serialized parse tree."""
+    if isinstance(node, dict):
+        if node.get("type") == "BASE_TABLE" and "table_name" in node:
+            tables.add((node.get("schema_name") or "", node["table_name"]))
+        elif node.get("type") == "TABLE_FUNCTION" and isinstance(node.get("function"), dict):
+            functions.add(node["function"].get("function_name", "?"))
+        cte_map = node.get("cte_map")
+        if isinstance(cte_map, dict):
+            ctes.update(entry["key"].lower() for entry in cte_map.get("map", []))
+        for value in node.values():
+            _relations(value, tables, functions, ctes)
+    elif isinstance(node, list):
+        for value in node:
+            _relations(value, tables, functions, ctes)
+
+
+def check_relations(cursor, sql: str) -> Optional[Rejection]:
+    """
+    Reject a query that reads anything but the loaded tables and views.
+
+    Parses the query with DuckDB (json_serialize_sql) and checks every
+    relation it references, in subqueries and CTEs too: table functions
+    are rejected, and base tables must be loaded tables/views (internal
+    "_" tables excluded) or CTEs - a quoted file path in FROM parses as
+    a base table and fails that check.
+
+    Args:
+        cursor: DuckDB cursor to parse on
+        sql: Query that passed check_statement()
+    """
+    serialized = cursor.execute("SELECT json_serialize_sql(?::VARCHAR)", [sql]).fetchone()[0]
+    tree = json.loads(serialized)
+    if tree.get("error"):
+        if tree.get("error_type") == "not implemented":
+            return Rejection(NOT_A_QUERY, "Only SELECT queries are permitted")
+        # Syntax errors surface when the query runs
+        return None
+
+    tables, functions, ctes = set(), set(), set()
+    _relations(tree.get("statements", []), tables, functions, ctes)
+    if functions:
+        logger.warning(f"Query rejected: table functions {sorted(functions)}")
+        return Rejection(NOT_A_QUERY, f"Table functions are not permitted ({', '.join(sorted(functions))})")
+
+    loaded = {
+        row[0].lower() for row in cursor.execute("SHOW TABLES").fetchall() if not row[0].startswith("_")
+    }
+    unknown = sorted(
+        f"{schema}.{name}" if schema else name
+        for schema, name in tables
+        if schema.lower() not in ("", "main") or (name.lower() not in loaded and name.lower() not in ctes)
+    )
+    if unknown:
+        logger.warning(f"Query rejected: unknown relations {unknown}")
+        return Rejection(
+            NOT_A_QUERY,
+            f"Only the loaded tables can be queried ({', '.join(sorted(loaded))}); got {', '.join(unknown)}",
+        )
+    return None
+
+
+@dataclass
+class _PlanNode:
+    name: str
+    column: int
+    estimate: Optional[int]
+    children: List["_PlanNode"] = field(default_factory=list)
+
+
+def _parse_plan(plan: str) -> Optional[_PlanNode]:
+    """Rebuild the operator tree from EXPLAIN's box rendering."""
+    lines = plan.split("\n")
+    levels = []
+    i = 0
+    while i < len(lines):
+        top = lines[i]
+        if "┌" not in top:
+            i += 1
+            continue
+        end = i + 1
+        while end < len(lines) and "└" not in lines[end]:
+            end += 1
+        body = lines[i + 1:end]
+
+        nodes = []
+        for start in range(0, len(top), _BOX_WIDTH):
+            if top[start] != "┌":
+                continue
+            cells = [line[start + 1:start + _BOX_WIDTH - 1].strip() for line in body]
+            cells = [c for c in cells if c and not set(c) <= {"─", " "}]
+            estimate = None
+            for cell in cells:
+                match = _ESTIMATE_RE.search(cell)
+                if match:
+                    estimate = int(match.group(1) or match.group(2))
+            nodes.append(_PlanNode(cells[0] if cells else "", start // _BOX_WIDTH, estimate))
+        levels.append(nodes)
+        i = end + 1
+
+    if not levels or len(levels[0]) != 1:
+        return None
+
+    # A node's subtree spans the grid columns up to the next node on its level
+    for parents, children in zip(levels, levels[1:]):
+        for k, parent in enumerate(parents):
+            bound = parents[k + 1].column if k + 1 < len(parents) else float("inf")
+            parent.children = [c for c in children if parent.column <= c.column < bound]
+    return levels[0][0]
+
+
+def _estimate_rows(node: _PlanNode, joins: list) -> Optional[int]:
+    """Estimated output rows of a node; appends join estimates to joins."""
+    inputs = [rows for rows in (_estimate_rows(c, joins) for c in node.children) if rows is not None]
+    rows = node.estimate
+    if node.name in _NESTED_LOOP_JOINS and len(inputs) == 2:
+        rows = max(rows or 0, inputs[0] * inputs[1])
+    if rows is None and inputs:
+        rows = max(inputs)
+    if rows is not None and (node.name in _NESTED_LOOP_JOINS or "JOIN" in node.name):
+        joins.append(rows)
+    return rows
+
+
+def estimate_join_rows(plan: str) -> Optional[int]:
+    """
+    Largest row count any join of a rendered physical plan is estimated to produce.
+
+    Returns:
+        Row estimate, 0 if the plan has no joins, or None if it couldn't be parsed
+    """
+    root = _parse_plan(plan)
+    if root is None:
+        return None
+    joins = []
+    _estimate_rows(root, joins)
+    return max(joins, default=0)
+
+
+def check_cost(cursor, sql: str, max_rows: int) -> Optional[Rejection]:
+    """
+    Reject a query whose joins are estimated to produce more than max_rows rows.
+
+    Args:
+        cursor: DuckDB cursor to run EXPLAIN on
+        sql: Query that passed check_statement()
+        max_rows: Row budget per join (0 = no limit)
+    """
+    if not max_rows:
+        return None
+
+    rows = cursor.execute(f"EXPLAIN {sql}").fetchall()
+    plan = next((text for kind, text in rows if kind == "physical_plan"), None)
+    estimate = estimate_join_rows(plan) if plan else None
+    if estimate is None:
+        logger.warning("Could not read query plan estimates - admitting query")
+        return None
+
+    if estimate > max_rows:
+        logger.warning(f"Query rejected: joins estimated at {estimate:,} rows (budget {max_rows:,})")
+        return Rejection(
+            TOO_EXPENSIVE,
+            (
+                f"Query too expensive: its joins are estimated to produce {estimate:,} rows "
+                f"(budget {max_rows:,}). Add join conditions or filters, or aggregate before joining."
+            ),
+            estimated_rows=estimate,
+        )
+    return None
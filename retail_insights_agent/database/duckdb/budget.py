@@ -0,0 +1,93 @@
+"""
+Result budget for tool responses.
+
+Keeps oversized query results out of the LLM context: a LIMIT is pushed
+down into the query, and results past the row/byte budget are replaced
+by a compact statistical summary computed in DuckDB.
+"""
+
+import logging
+from typing import Optional
+
+from .connection import get_connection
+from .sql_text import tokenize
+
+logger = logging.getLogger(__name__)
+
+# Statements that can be wrapped as a subquery
+_WRAPPABLE = ("SELECT", "WITH", "FROM", "VALUES", "(")
+
+# Columns with at least this share of distinct values get no top-k list
+_NEAR_UNIQUE_RATIO = 0.5
+
+
+def strip_sql(sql: str) -> str:
+    """Remove surrounding whitespace and trailing semicolons."""
+    return sql.strip().rstrip(";").strip()
+
+
+def limit_sql(sql: str, max_rows: int) -> Optional[str]:
+    """
+    Wrap a query so DuckDB stops after max_rows + 1 rows.
+
+    The extra row tells the caller the budget was exceeded.
+    Returns None for statements that can't be used as a subquery.
+    """
+    tokens = tokenize(sql)
+    if not tokens or tokens[0][1].upper() not in _WRAPPABLE:
+        return None
+    return f"SELECT * FROM ({strip_sql(sql)}) AS _budget LIMIT {max_rows + 1}"
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def summarize_query(sql: str, top_k: int = 5) -> dict:
+    """
+    Summarize a query result without materializing it.
+
+    Returns:
+        Dict with total row_count and per-column type, null share,
+        min/max, approximate distinct count and top-k values
+    """
+    conn = get_connection()
+    inner = strip_sql(sql)
+
+    with conn.cursor() as cursor:
+        rows = cursor.execute(f"SUMMARIZE ({inner})").fetchall()
+        total_rows = rows[0][10] if rows else cursor.execute(f"SELECT COUNT(*) FROM ({inner})").fetchone()[0]
+
+    columns = []
+    top_k_queries = []
+    for name, col_type, min_v, max_v, approx_unique, *_rest, count, null_pct in rows:
+        base_type = col_type.split("(")[0]  # ENUM('a', 'b', ...) -> ENUM
+        column = {
+            "name": name,
+            "type": base_type if base_type == "ENUM" else col_type,
+            "min": min_v,
+            "max": max_v,
+            "approx_unique": approx_unique,
+            "null_percentage": float(null_pct) if null_pct is not None else None,
+        }
+        columns.append(column)
+
+        numeric = any(t in base_type for t in ("INT", "DECIMAL", "DOUBLE", "FLOAT", "REAL"))
+        near_unique = count and approx_unique >= _NEAR_UNIQUE_RATIO * count
+        if not numeric and not near_unique:
+            top_k_queries.append(
+                f"(SELECT {len(columns) - 1} AS col_idx, CAST({_quote(name)} AS VARCHAR) AS value, "
+                f"COUNT(*) AS cnt FROM _summary GROUP BY 2 ORDER BY 3 DESC LIMIT {top_k})"
+            )
+
+    if top_k_queries:
+        top_sql = f"WITH _summary AS ({inner}) " + " UNION ALL ".join(top_k_queries)
+        with conn.cursor() as cursor:
+            top_values = cursor.execute(top_sql).fetchall()
+        for col_idx, value, cnt in top_values:
+            columns[col_idx].setdefault("top_values", []).append({"value": value, "count": cnt})
+        for column in columns:
+            if "top_values" in column:
+                column["top_values"].sort(key=lambda v: -v["count"])
+
+    return {"row_count": total_rows, "columns": columns}
@@ -0,0 +1,102 @@
+"""
+Query result cache.
+
+Results are keyed on the canonicalized SQL plus the connection's data
+version, bounded by an approximate byte budget with LRU eviction, and
+dropped as soon as the data version changes (tables reloaded).
+"""
+
+import re
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from .sql_text import canonicalize_sql
+
+logger = logging.getLogger(__name__)
+
+# Functions whose results change between runs - never cache these queries
+_VOLATILE_RE = re.compile(
+    r"\b(RANDOM|UUID|GEN_RANDOM_UUID|NOW|CURRENT_DATE|CURRENT_TIME|CURRENT_TIMESTAMP|GET_CURRENT_TIME|TODAY|SETSEED)\b",
+    re.IGNORECASE,
+)
+
+
+class ResultCache:
+    """Thread-safe, byte-bounded LRU cache of query results."""
+
+    def __init__(self, max_bytes: int):
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._data_version: Optional[str] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(sql: str) -> Optional[str]:
+        """Build the cache key for a query, or None if it is not cacheable."""
+        canonical = canonicalize_sql(sql)
+        if _VOLATILE_RE.search(canonical):
+            return None
+        return canonical
+
+    def _check_version(self, data_version: str) -> None:
+        """Drop everything if the underlying data changed."""
+        if data_version != self._data_version:
+            if self._entries:
+                logger.info(f"Data version changed ({self._data_version} -> {data_version}), clearing result cache")
+            self._entries.clear()
+            self._bytes = 0
+            self._data_version = data_version
+
+    def get(self, key: str, data_version: str) -> Optional[Any]:
+        """Get a cached result, or None."""
+        with self._lock:
+            self._check_version(data_version)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: str, data_version: str, value: Any, size: int) -> None:
+        """Store a result of the given approximate size in bytes."""
+        if size > self._max_bytes:
+            return
+
+        with self._lock:
+            self._check_version(data_version)
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        """Get hit/miss counters and current size."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self._max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
@@ -1,106 +1,741 @@
 """
 DuckDB connection management.
 
-Provides singleton connection to in-memory DuckDB database
-with CSV data loaded as tables.
+Provides singleton connection to a DuckDB database with CSV data
+loaded as tables, either in memory, from a read-only on-disk snapshot,
+or as views over Parquet files that are scanned in place. Rollup tables
+(ROLLUP_SCHEMAS) are built alongside the source tables, and new source
+files can be ingested incrementally (see ingest()). Queries run on
+pooled cursors so concurrent sessions don't share one handle; ingests
+commit in one transaction and replaced instances close only after their
+borrowed cursors are returned, so no query sees a half-loaded table.
 """
 
+import os
 import atexit
+import shutil
 import logging
-from typing import Optional
+import itertools
+import threading
+from pathlib import Path
+from contextlib import ExitStack, contextmanager
+from typing import Iterator, Optional
 
 import duckdb
 
-from ...config import DATA_DIR, TABLE_SCHEMAS
+from .pool import CursorPool, PoolClosed
+from .rollups import rollup_sql
+from .parquet import parquet_root, parquet_target, needs_conversion, existing_parquet, prune_parquet
+from .snapshot import snapshot_key, snapshot_path, prune_snapshots
+from .sources import source_files, source_description, file_stamp, sql_path, sql_path_list
+from ...config import (
+    DATA_DIR,
+    TABLE_SCHEMAS,
+    DUCKDB_STORAGE_MODE,
+    DUCKDB_MEMORY_LIMIT,
+    DUCKDB_TEMP_DIRECTORY,
+    DUCKDB_MAX_CONCURRENCY,
+    DUCKDB_THREADS,
+    ROLLUPS_ENABLED,
+    ROLLUP_SCHEMAS,
+)
 
 logger = logging.getLogger(__name__)
 
+# Monotonic load counter - makes every (re)load a distinct data version
+_load_counter = itertools.count(1)
+
+# Source files loaded per table (path, size, mtime) - drives incremental ingest
+_MANIFEST_TABLE = "_ingest_manifest"
+
+
+def _duckdb_config() -> dict:
+    """Resource settings applied to every DuckDB database."""
+    config = {"temp_directory": DUCKDB_TEMP_DIRECTORY}
+    if DUCKDB_MEMORY_LIMIT:
+        config["memory_limit"] = DUCKDB_MEMORY_LIMIT
+    if DUCKDB_THREADS:
+        config["threads"] = DUCKDB_THREADS
+    return config
+
 
 class DuckDBConnection:
     """
     Singleton connection manager for DuckDB.
 
-    Loads CSV files into in-memory tables on first access.
-    All agents share the same connection instance.
+    Loads CSV files into tables on first access. In snapshot mode the
+    tables are built once into an on-disk file and attached read-only
+    on later starts; in parquet mode tables are views over Parquet files.
+    All agents share the same connection instance; their queries borrow
+    cursors from its pool (see cursor()).
     """
 
     _instance: Optional["DuckDBConnection"] = None
+    _instance_lock = threading.Lock()
+    # Serializes ingest() and reload() - one writer at a time
+    _ingest_lock = threading.Lock()
 
-    def __init__(self):
-        self._conn = duckdb.connect(":memory:")
+    def __init__(self, database: str = ":memory:", read_only: bool = False, parquet: bool = False):
+        self._database = database
+        self._read_only = read_only
+        self._parquet = parquet
+        self._conn = duckdb.connect(database, read_only=read_only, config=_duckdb_config())
+        self._pool = CursorPool(self._conn, DUCKDB_MAX_CONCURRENCY)
         self._tables_loaded = False
         self._closed = False
+        self._retired = False
+        self._data_version = None
+        self._rollups: Optional[dict] = None
+        self._snapshot_key: Optional[str] = None
+        # Last error a load step logged and swallowed - reported if it aborted an ingest
+        self._load_error: Optional[Exception] = None
 
     @classmethod
     def get_instance(cls) -> "DuckDBConnection":
-        """Get or create singleton instance."""
+        """Get or create singleton instance (loads the tables on first call)."""
         if cls._instance is None:
+            # Warm-up and the first request may both get here - load once
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls._create_instance()
+                    # Register cleanup on exit
+                    atexit.register(cls._instance.close)
+        return cls._instance
+
+    @classmethod
+    def _create_instance(cls) -> "DuckDBConnection":
+        """Open or load the database for the configured storage mode."""
+        instance = None
+        if DUCKDB_STORAGE_MODE == "snapshot":
+            instance = cls._open_snapshot()
+        elif DUCKDB_STORAGE_MODE == "parquet":
+            print("[DuckDB] Initializing Parquet views...")
+            logger.info("Initializing DuckDB views over Parquet files...")
+            instance = cls(parquet=True)
+            instance._load_tables()
+
+        if instance is None:
             print("[DuckDB] Initializing in-memory database...")
             logger.info("Initializing DuckDB in-memory database...")
-            cls._instance = cls()
-            cls._instance._load_tables()
-            # Register cleanup on exit
-            atexit.register(cls._instance.close)
-        return cls._instance
+            instance = cls()
+            instance._load_tables()
+        return instance
+
+    @classmethod
+    def _open_snapshot(cls) -> Optional["DuckDBConnection"]:
+        """
+        Attach the on-disk snapshot read-only, building it first if needed.
+
+        Returns None if no snapshot can be used (missing sources or build
+        failure), in which case the caller falls back to in-memory loading.
+        """
+        key = snapshot_key(TABLE_SCHEMAS, DATA_DIR, ROLLUP_SCHEMAS if ROLLUPS_ENABLED else {})
+        if key is None:
+            logger.warning("Source files missing - snapshot mode unavailable")
+            return None
+
+        path = snapshot_path(key)
+        try:
+            if not path.exists():
+                cls._build_snapshot(path)
+
+            return cls._attach_snapshot(path, key)
+
+        except Exception as e:
+            print(f"[DuckDB] WARNING: Snapshot unavailable ({e}), loading in memory")
+            logger.warning(f"Snapshot unavailable, falling back to in-memory load: {e}")
+            return None
+
+    @classmethod
+    def _attach_snapshot(cls, path: Path, key: str) -> "DuckDBConnection":
+        """Open a published snapshot read-only."""
+        print(f"[DuckDB] Attaching snapshot {path.name} (read-only)...")
+        instance = cls(str(path), read_only=True)
+        instance._tables_loaded = True
+        instance._snapshot_key = key
+        instance._data_version = f"snapshot-{key}:{next(_load_counter)}"
+        tables = instance.get_tables()
+        logger.info(f"DuckDB snapshot {path.name} ready with {len(tables)} tables: {', '.join(tables)}")
+        return instance
+
+    @classmethod
+    def _build_snapshot(cls, path: Path) -> None:
+        """Load all tables into a new database file and publish it atomically."""
+        print(f"[DuckDB] Building snapshot {path.name}...")
+        logger.info(f"Building DuckDB snapshot: {path}")
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Build under a per-process name so concurrent workers never see a partial file
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        builder = cls(str(tmp_path))
+        try:
+            builder._load_tables()
+            missing = set(TABLE_SCHEMAS) - set(builder.get_tables())
+            if missing:
+                raise RuntimeError(f"tables failed to load: {', '.join(sorted(missing))}")
+            builder.close()
+            os.replace(tmp_path, path)
+        finally:
+            builder.close()
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+        prune_snapshots(keep=path)
 
     def _load_tables(self) -> None:
-        """Load all CSV files into DuckDB tables."""
+        """Load all source files into DuckDB tables."""
         if self._tables_loaded:
             return
 
         print(f"[DuckDB] Loading tables from {DATA_DIR}...")
+        self._ensure_manifest()
 
         for table_name, schema in TABLE_SCHEMAS.items():
-            csv_path = DATA_DIR / schema["source_file"]
+            if self._parquet:
+                self._load_parquet_view(table_name, schema)
+                continue
+
+            files = source_files(schema, DATA_DIR)
 
-            if not csv_path.exists():
-                print(f"[DuckDB] WARNING: CSV not found: {csv_path}")
-                logger.warning(f"CSV not found: {csv_path}")
+            if not files:
+                print(f"[DuckDB] WARNING: No source files for {table_name}: {source_description(schema)}")
+                logger.warning(f"No source files for {table_name}: {source_description(schema)}")
                 continue
 
-            self._load_csv(table_name, csv_path, schema.get("column_mapping", {}))
+            self._load_csv(table_name, files, schema)
+
+        if ROLLUPS_ENABLED:
+            self._build_rollups()
 
         self._tables_loaded = True
+        self._data_version = f"{self._version_prefix}:{next(_load_counter)}"
         tables = self.get_tables()
         print(f"[DuckDB] Loaded {len(tables)} tables: {', '.join(tables)}")
         logger.info(f"DuckDB ready with {len(tables)} tables: {', '.join(tables)}")
 
-    def _load_csv(self, table_name: str, csv_path, column_mapping: dict) -> None:
-        """Load a single CSV file as a table with column renaming."""
-        path_str = str(csv_path).replace("\\", "/")
+    def _load_csv(self, table_name: str, files: list, schema: dict, append: bool = False) -> Optional[int]:
+        """
+        Load CSV files as a table (or append them to it) with column renaming and typing.
+
+        Returns:
+            Number of rows loaded, or None if the load failed or, when
+            appending, the files hold ENUM values the table can't store.
+            Inside an ingest a failed load also aborts the transaction
+            (see _check_transaction()).
+        """
+        stage = f"_stage_{table_name}"
+        try:
+            self._stage_csv(table_name, stage, files, schema)
+            casts = self._column_casts(table_name, stage, schema, create_types=not append)
+            if casts is None:
+                return None
+
+            select = f"SELECT {', '.join(casts)} FROM {stage}"
+            if append:
+                self._conn.execute(f"INSERT INTO {table_name} {select}")
+            else:
+                self._conn.execute(f"CREATE TABLE {table_name} AS {select}")
+            self._record_files(table_name, files)
+
+            count = self._conn.execute(f"SELECT COUNT(*) FROM {stage}").fetchone()[0]
+            action = "Appended" if append else "Loaded"
+            print(f"[DuckDB] {action} {table_name}: {count:,} rows from {len(files)} file(s)")
+            logger.info(f"{action} {table_name}: {count:,} rows from {len(files)} file(s)")
+            return count
+        except Exception as e:
+            print(f"[DuckDB] ERROR loading {table_name}: {e}")
+            logger.error(f"Failed to load {table_name}: {e}")
+            self._load_error = e
+            return None
+        finally:
+            self._drop_stage(stage)
+
+    def _stage_csv(self, table_name: str, stage: str, files: list, schema: dict) -> None:
+        """
+        Read CSV files into a temporary staging table.
+
+        With column_types declared, values are parsed by a typed read_csv
+        and rows that fail to parse are rejected and reported. ENUM columns
+        are staged as text - their types are built from the data.
+        """
+        column_mapping = schema.get("column_mapping", {})
+        column_types = schema.get("column_types", {})
+        partitions = schema.get("partition_columns", [])
+        rejects = f"_rejects_{table_name}"
+
+        options = ["header = true"]
+        if partitions:
+            options.append("hive_partitioning = true")
+
+        if column_types:
+            reader = "read_csv"
+            read_types = {
+                orig: "VARCHAR" if column_types.get(new, "VARCHAR") == "ENUM" else column_types.get(new, "VARCHAR")
+                for orig, new in column_mapping.items()
+            }
+            options += [
+                "types = {" + ", ".join(f"'{orig}': '{t}'" for orig, t in read_types.items()) + "}",
+                "store_rejects = true",
+                f"rejects_table = '{rejects}'",
+                f"rejects_scan = '{rejects}_scan'",
+            ]
+            if schema.get("date_format"):
+                options.append(f"dateformat = '{schema['date_format']}'")
+        else:
+            reader = "read_csv_auto"
 
         if column_mapping:
-            select_cols = ", ".join([
-                f'"{orig}" as {new}' for orig, new in column_mapping.items()
-            ])
-            sql = f"CREATE TABLE {table_name} AS SELECT {select_cols} FROM read_csv_auto('{path_str}')"
+            select_cols = [f'"{orig}" AS {new}' for orig, new in column_mapping.items()]
+            select_cols += [f'"{column}"' for column in partitions]
         else:
-            sql = f"CREATE TABLE {table_name} AS SELECT * FROM read_csv_auto('{path_str}')"
+            select_cols = ["*"]
+
+        self._conn.execute(
+            f"CREATE TEMP TABLE {stage} AS SELECT {', '.join(select_cols)} "
+            f"FROM {reader}({sql_path_list(files)}, {', '.join(options)})"
+        )
+        if column_types:
+            self._report_rejects(table_name, rejects)
+
+    def _column_casts(self, table_name: str, stage: str, schema: dict, create_types: bool) -> Optional[list]:
+        """
+        Build the SELECT list casting staged columns to their target types.
+
+        ENUM types are created from the staged distinct values, or - when
+        appending - checked against the existing type. Returns None if
+        staged values don't fit an existing ENUM.
+        """
+        column_types = schema.get("column_types", {})
+        columns = [row[0] for row in self._conn.execute(f"DESCRIBE {stage}").fetchall()]
+
+        casts = []
+        for column in columns:
+            target = column_types.get(column)
+            if target is None:
+                casts.append(column)
+                continue
+
+            if target == "ENUM":
+                target = f"{table_name}_{column}_enum"
+                if create_types:
+                    self._conn.execute(
+                        f"CREATE TYPE {target} AS ENUM "
+                        f"(SELECT DISTINCT {column} FROM {stage} WHERE {column} IS NOT NULL ORDER BY 1)"
+                    )
+                else:
+                    unseen = self._conn.execute(
+                        f"SELECT COUNT(*) FROM {stage} WHERE {column} IS NOT NULL AND TRY_CAST({column} AS {target}) IS NULL"
+                    ).fetchone()[0]
+                    if unseen:
+                        logger.info(f"New {table_name}.{column} values - table needs a full reload")
+                        return None
+            casts.append(f"CAST({column} AS {target}) AS {column}")
+        return casts
+
+    def _report_rejects(self, table_name: str, rejects: str) -> None:
+        """Print and log rows the typed CSV reader rejected."""
+        rejected = self._conn.execute(f"SELECT COUNT(DISTINCT line) FROM {rejects}").fetchone()[0]
+        if not rejected:
+            self._drop_rejects(rejects)
+            return
+
+        print(f"[DuckDB] WARNING: {table_name}: {rejected:,} rows rejected during load")
+        logger.warning(f"{table_name}: {rejected:,} rows rejected during load")
+        samples = self._conn.execute(
+            f"SELECT line, column_name, error_message FROM {rejects} ORDER BY line LIMIT 5"
+        ).fetchall()
+        for line, column, message in samples:
+            print(f"[DuckDB]   line {line}, column {column}: {message}")
+            logger.warning(f"{table_name} rejected line {line}, column {column}: {message}")
+        self._drop_rejects(rejects)
+
+    def _drop_rejects(self, rejects: str) -> None:
+        self._conn.execute(f"DROP TABLE IF EXISTS {rejects}")
+        self._conn.execute(f"DROP TABLE IF EXISTS {rejects}_scan")
+
+    def _sync_parquet(self, table_name: str, schema: dict) -> list:
+        """
+        Get the Parquet files backing a table, converting new or changed source CSVs.
 
+        Tables with a "parquet_glob" are served from those files as-is.
+        """
+        if schema.get("parquet_glob"):
+            return existing_parquet(schema)
+
+        root = parquet_root(table_name, schema)
+        targets = []
+        for source in source_files(schema, DATA_DIR):
+            target = parquet_target(root, source)
+            if needs_conversion(source, target):
+                self._convert_to_parquet(table_name, source, target, schema)
+            if target.exists():
+                targets.append(target)
+
+        # Files the current view reads are kept until the view is re-pointed
+        loaded = {Path(path) for path in self._manifest(table_name)}
+        prune_parquet(table_name, root, set(targets) | loaded)
+        return targets
+
+    def _convert_to_parquet(self, table_name: str, source: Path, target: Path, schema: dict) -> None:
+        """Convert one source CSV (typed, renamed) into a Parquet file."""
+        stage = f"_stage_{table_name}"
+        # Partition columns come back from the directory names when the view is read
+        partitions = schema.get("partition_columns", [])
+        exclude = f" EXCLUDE ({', '.join(partitions)})" if partitions else ""
+        tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
         try:
-            self._conn.execute(sql)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            self._stage_csv(table_name, stage, [source], schema)
+            self._conn.execute(
+                f"COPY (SELECT *{exclude} FROM {stage}) TO {sql_path(tmp_path)} (FORMAT PARQUET, COMPRESSION ZSTD)"
+            )
+            os.replace(tmp_path, target)
+            logger.info(f"Converted {source.name} to Parquet: {target}")
+        except Exception as e:
+            print(f"[DuckDB] ERROR converting {source.name} to Parquet: {e}")
+            logger.error(f"Failed to convert {source} to Parquet: {e}")
+            self._load_error = e
+        finally:
+            self._drop_stage(stage)
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    def _load_parquet_view(self, table_name: str, schema: dict, files: Optional[list] = None) -> Optional[int]:
+        """
+        Expose Parquet files as a view (scanned lazily, nothing copied into memory).
+
+        The view lists its files explicitly, so files added later only
+        become visible - with a new data version - through ingest().
+        """
+        try:
+            files = self._sync_parquet(table_name, schema) if files is None else files
+            if not files:
+                print(f"[DuckDB] WARNING: No Parquet files for {table_name}")
+                logger.warning(f"No Parquet files for {table_name}")
+                return None
+
+            hive = "true" if schema.get("partition_columns") else "false"
+            self._conn.execute(
+                f"CREATE OR REPLACE VIEW {table_name} AS "
+                f"SELECT * FROM read_parquet({sql_path_list(files)}, hive_partitioning = {hive})"
+            )
+            self._conn.execute(f"DELETE FROM {_MANIFEST_TABLE} WHERE table_name = ?", [table_name])
+            self._record_files(table_name, files)
+
             count = self._conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
-            print(f"[DuckDB] Loaded {table_name}: {count:,} rows")
-            logger.info(f"Loaded {table_name}: {count:,} rows")
+            print(f"[DuckDB] Attached {table_name}: {count:,} rows in {len(files)} Parquet file(s)")
+            logger.info(f"Attached {table_name} as a view over {len(files)} Parquet file(s): {count:,} rows")
+            return count
         except Exception as e:
-            print(f"[DuckDB] ERROR loading {table_name}: {e}")
-            logger.error(f"Failed to load {table_name}: {e}")
+            print(f"[DuckDB] ERROR attaching {table_name}: {e}")
+            logger.error(f"Failed to attach {table_name}: {e}")
+            self._load_error = e
+            return None
+
+    def _drop_stage(self, stage: str) -> None:
+        """Drop a staging table - unless the transaction is aborted, whose ROLLBACK drops it."""
+        if not self._transaction_aborted():
+            self._conn.execute(f"DROP TABLE IF EXISTS {stage}")
+
+    def _transaction_aborted(self) -> bool:
+        """Whether a failed statement aborted the open transaction (only ROLLBACK runs then)."""
+        try:
+            self._conn.execute("SELECT 1")
+            return False
+        except duckdb.Error:
+            return True
+
+    def _check_transaction(self, step: str) -> None:
+        """
+        Stop an ingest whose transaction a failed load step aborted.
+
+        Raises:
+            RuntimeError: Chained to the error the step logged
+        """
+        if self._transaction_aborted():
+            raise RuntimeError(f"{step} failed: {self._load_error}") from self._load_error
+
+    def _ensure_manifest(self) -> None:
+        """Create the table tracking which source files have been loaded."""
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {_MANIFEST_TABLE} "
+            "(table_name VARCHAR, path VARCHAR, size BIGINT, mtime_ns BIGINT, "
+            "loaded_at TIMESTAMP DEFAULT current_timestamp)"
+        )
+
+    def _record_files(self, table_name: str, files: list) -> None:
+        """Add loaded files to the manifest."""
+        rows = [(table_name, str(path), *file_stamp(path)) for path in files]
+        self._conn.executemany(
+            f"INSERT INTO {_MANIFEST_TABLE} (table_name, path, size, mtime_ns) VALUES (?, ?, ?, ?)", rows
+        )
+
+    def _manifest(self, table_name: str) -> dict:
+        """Get loaded files of a table: path -> (size, mtime_ns)."""
+        rows = self._conn.execute(
+            f"SELECT path, size, mtime_ns FROM {_MANIFEST_TABLE} WHERE table_name = ?", [table_name]
+        ).fetchall()
+        return {path: (size, mtime_ns) for path, size, mtime_ns in rows}
+
+    def _drop_table(self, table_name: str, schema: dict) -> None:
+        """Drop a table with its rollups, ENUM types and manifest entries."""
+        for name, definition in ROLLUP_SCHEMAS.items():
+            if definition["source_table"] == table_name:
+                self._conn.execute(f"DROP TABLE IF EXISTS {name}")
+        self._conn.execute(f"DROP TABLE IF EXISTS {table_name}")
+        for column, target in schema.get("column_types", {}).items():
+            if target == "ENUM":
+                self._conn.execute(f"DROP TYPE IF EXISTS {table_name}_{column}_enum")
+        self._conn.execute(f"DELETE FROM {_MANIFEST_TABLE} WHERE table_name = ?", [table_name])
+
+    def _ingest(self) -> dict:
+        """
+        Bring writable tables up to date with their source files.
+
+        Files not in the manifest are appended. Tables whose loaded files
+        changed or disappeared, or whose new files carry new ENUM values,
+        are rebuilt from all their files. Parquet views are re-pointed at
+        their current files. Affected rollups are refreshed.
+
+        Everything runs in one transaction: queries on pooled cursors see
+        the previous tables until it commits, and a failed step rolls the
+        whole ingest back.
+        """
+        self._ensure_manifest()
+        self._load_error = None
+        self._conn.execute("BEGIN TRANSACTION")
+        try:
+            report = self._ingest_tables()
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._rollups = None
+        return report
+
+    def _ingest_tables(self) -> dict:
+        """Apply new and changed source files to each table (inside _ingest's transaction)."""
+        tables = set(self._own_tables())
+        report = {}
+
+        for table_name, schema in TABLE_SCHEMAS.items():
+            if self._parquet:
+                loaded = self._manifest(table_name)
+                files = self._sync_parquet(table_name, schema)
+                self._check_transaction(f"Converting {table_name} to Parquet")
+                current = {str(path): file_stamp(path) for path in files}
+                if current == loaded:
+                    continue
+                new_files = [path for path in current if path not in loaded]
+                unchanged = all(current.get(path) == stamp for path, stamp in loaded.items())
+                rows = self._load_parquet_view(table_name, schema, files) or 0
+                self._check_transaction(f"Attaching {table_name}")
+                if unchanged and new_files:
+                    # Only row-group metadata is read
+                    rows = self._conn.execute(
+                        f"SELECT COUNT(*) FROM read_parquet([{', '.join(sql_path(Path(p)) for p in new_files)}])"
+                    ).fetchone()[0]
+                report[table_name] = {
+                    "mode": "append" if unchanged else "reload",
+                    "files": len(new_files) if unchanged else len(files),
+                    "rows": rows,
+                }
+                continue
+
+            files = source_files(schema, DATA_DIR)
+            loaded = self._manifest(table_name)
+            current = {str(path): file_stamp(path) for path in files}
+            new_files = [path for path in files if str(path) not in loaded]
+            changed = [path for path, stamp in loaded.items() if current.get(path) != stamp]
+
+            if table_name in tables and not changed and not new_files:
+                continue
+
+            rows = None
+            if table_name in tables and not changed:
+                rows = self._load_csv(table_name, new_files, schema, append=True)
+                self._check_transaction(f"Appending to {table_name}")
+                report[table_name] = {"mode": "append", "files": len(new_files), "rows": rows}
+
+            if rows is None:
+                self._drop_table(table_name, schema)
+                rows = self._load_csv(table_name, files, schema) if files else 0
+                if rows is None:
+                    raise RuntimeError(f"Reloading {table_name} failed: {self._load_error}") from self._load_error
+                report[table_name] = {"mode": "reload", "files": len(files), "rows": rows}
+
+        if report and ROLLUPS_ENABLED:
+            self._build_rollups(sources=set(report))
+        return report
+
+    @classmethod
+    def ingest(cls) -> dict:
+        """
+        Pick up new source files without a full reload or restart.
+
+        In memory mode new files are appended in place; in parquet mode
+        they are converted and added to the views. In snapshot mode a
+        new snapshot is derived from a copy of the current one, ingested
+        into, published and swapped in. Either way rollups over affected
+        tables are refreshed and the data version changes. Concurrent
+        calls run one after another.
+
+        Returns:
+            Dict of table -> {"mode": "append" | "reload", "files", "rows"}
+            for tables this call updated (empty if nothing was new)
+
+        Raises:
+            Exception: If a table failed to reload; nothing is changed
+        """
+        with cls._ingest_lock:
+            instance = cls.get_instance()
+            if instance.read_only:
+                return cls._ingest_snapshot(instance)
+
+            report = instance._ingest()
+            if report:
+                instance._data_version = f"{instance._version_prefix}:{next(_load_counter)}"
+            return report
+
+    @classmethod
+    def _ingest_snapshot(cls, current: "DuckDBConnection") -> dict:
+        """Derive, publish and attach a snapshot that includes new source files."""
+        key = snapshot_key(TABLE_SCHEMAS, DATA_DIR, ROLLUP_SCHEMAS if ROLLUPS_ENABLED else {})
+        if key is None or key == current._snapshot_key:
+            return {}
+
+        path = snapshot_path(key)
+        report = {}
+        if not path.exists():
+            print(f"[DuckDB] Deriving snapshot {path.name} from {Path(current._database).name}...")
+            logger.info(f"Deriving DuckDB snapshot {path} from {current._database}")
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            shutil.copyfile(current._database, tmp_path)
+            builder = cls(str(tmp_path))
+            try:
+                report = builder._ingest()
+                builder.close()
+                os.replace(tmp_path, path)
+            finally:
+                builder.close()
+                if tmp_path.exists():
+                    tmp_path.unlink()
+
+        cls._swap(cls._attach_snapshot(path, key))
+        prune_snapshots(keep=path)
+        return report
+
+    @classmethod
+    def _swap(cls, instance: "DuckDBConnection") -> None:
+        """Make instance the singleton; the one it replaces closes once its queries finish."""
+        with cls._instance_lock:
+            previous, cls._instance = cls._instance, instance
+            atexit.register(instance.close)
+        if previous is not None:
+            previous.retire()
+
+    def _build_rollups(self, sources: Optional[set] = None) -> None:
+        """Materialize rollup tables from the loaded source tables (or only the given ones)."""
+        tables = set(self._own_tables())
+        for name, definition in ROLLUP_SCHEMAS.items():
+            if definition["source_table"] not in tables:
+                continue
+            if sources is not None and definition["source_table"] not in sources:
+                continue
+            try:
+                self._conn.execute(rollup_sql(name, definition))
+                count = self._conn.execute(f"SELECT COUNT(*) FROM {name}").fetchone()[0]
+                print(f"[DuckDB] Built rollup {name}: {count:,} rows")
+                logger.info(f"Built rollup {name}: {count:,} rows")
+            except Exception as e:
+                print(f"[DuckDB] ERROR building rollup {name}: {e}")
+                logger.error(f"Failed to build rollup {name}: {e}")
+                self._load_error = e
+                self._check_transaction(f"Building rollup {name}")
+
+    @property
+    def read_only(self) -> bool:
+        """Whether the database is attached read-only (snapshot mode)."""
+        return self._read_only
+
+    @property
+    def _version_prefix(self) -> str:
+        return "parquet" if self._parquet else "memory"
+
+    @property
+    def data_version(self) -> Optional[str]:
+        """Stamp that changes whenever tables are (re)loaded."""
+        return self._data_version
+
+    @property
+    def rollups(self) -> dict:
+        """Rollups present in this database: name -> definition plus row_count."""
+        if self._rollups is None:
+            rollups = {}
+            if ROLLUPS_ENABLED:
+                tables = set(self.get_tables())
+                for name, definition in ROLLUP_SCHEMAS.items():
+                    if name in tables:
+                        with self.cursor() as cursor:
+                            count = cursor.execute(f"SELECT COUNT(*) FROM {name}").fetchone()[0]
+                        rollups[name] = {**definition, "row_count": count}
+            self._rollups = rollups
+        return self._rollups
+
+    @contextmanager
+    def cursor(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """
+        Borrow a pooled cursor for running queries from any thread.
+
+        At most DUCKDB_MAX_CONCURRENCY cursors are out at once; further
+        callers wait. Fetch results before the with-block exits. Once the
+        instance is retired, cursors come from the instance replacing it.
+        """
+        if self._retired:
+            with self.get_instance().cursor() as cursor:
+                yield cursor
+            return
+        if self._closed:
+            raise RuntimeError("DuckDB connection is closed")
+        with ExitStack() as stack:
+            try:
+                cursor = stack.enter_context(self._pool.cursor())
+            except PoolClosed:
+                # Retired while this caller waited for a slot
+                if not self._retired:
+                    raise
+                cursor = stack.enter_context(self.get_instance().cursor())
+            yield cursor
 
     def execute(self, sql: str):
-        """Execute SQL and return DuckDB result."""
+        """
+        Execute SQL on the connection itself and return DuckDB result.
+
+        Not safe to call from several threads at once - use cursor().
+        """
         if self._closed:
             raise RuntimeError("DuckDB connection is closed")
         return self._conn.execute(sql)
 
+    def pool_stats(self) -> dict:
+        """Get cursor pool concurrency and queue-wait counters."""
+        return self._pool.stats()
+
     def get_tables(self) -> list:
-        """Get list of loaded table names."""
-        result = self._conn.execute("SHOW TABLES").fetchall()
-        return [row[0] for row in result]
+        """Get list of loaded table names (internal "_" tables excluded)."""
+        with self.cursor() as cursor:
+            result = cursor.execute("SHOW TABLES").fetchall()
+        return [row[0] for row in result if not row[0].startswith("_")]
+
+    def _own_tables(self) -> list:
+        """Like get_tables(), but on the connection itself - sees tables of its open transaction."""
+        return [row[0] for row in self._conn.execute("SHOW TABLES").fetchall() if not row[0].startswith("_")]
 
     def get_table_info(self, table_name: str) -> dict:
         """Get column info for a table."""
-        cols = self._conn.execute(f"PRAGMA table_info({table_name})").fetchall()
-        count = self._conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+        with self.cursor() as cursor:
+            cols = cursor.execute(f"PRAGMA table_info({table_name})").fetchall()
+            count = cursor.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
         return {
             "name": table_name,
             "columns": [{"name": c[1], "type": c[2]} for c in cols],
@@ -112,9 +747,20 @@ class DuckDBConnection:
         if not self._closed:
             print("[DuckDB] Closing connection...")
             logger.info("Closing DuckDB connection")
+            self._pool.close()
             self._conn.close()
             self._closed = True
 
+    def retire(self) -> None:
+        """
+        Close the connection once every borrowed cursor is returned.
+
+        Queries already running finish on their cursors; later cursor()
+        calls are served by the current instance.
+        """
+        self._retired = True
+        self._pool.drain(self.close)
+
     @classmethod
     def reset(cls) -> None:
         """Reset singleton (for testing)."""
@@ -122,7 +768,29 @@ class DuckDBConnection:
             cls._instance.close()
         cls._instance = None
 
+    @classmethod
+    def reload(cls) -> "DuckDBConnection":
+        """
+        Reload all tables into a fresh instance (new data version).
+
+        The current instance keeps serving until the new one is loaded,
+        then closes once its running queries finish.
+        """
+        with cls._ingest_lock:
+            cls._swap(cls._create_instance())
+        return cls._instance
+
 
 def get_connection() -> DuckDBConnection:
     """Get the singleton DuckDB connection."""
     return DuckDBConnection.get_instance()
+
+
+def get_pool_stats() -> dict:
+    """Get cursor pool stats of the current connection."""
+    return get_connection().pool_stats()
+
+
+def ingest_new_files() -> dict:
+    """Ingest source files added since the last load (see DuckDBConnection.ingest)."""
+    return DuckDBConnection.ingest()
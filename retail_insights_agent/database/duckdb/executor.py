@@ -1,68 +1,330 @@
 """
 SQL query execution on DuckDB.
 
-Provides execute_query function used by ADK tools.
+Provides execute_query function used by ADK tools, and
+execute_query_async which runs it on the worker pool. Queries must pass
+admission (see admission.py) and are interrupted past their timeout.
+Results are kept as Arrow tables and only serialized (to records or
+columns) when the tool response is built. Successful results are cached
+per data version (see ResultCache). Aggregate queries covered by a
+rollup table are answered from it (see rollups.py).
 """
 
 import logging
-from typing import Optional
-from dataclasses import dataclass, field
+from typing import Iterator, Optional
+from dataclasses import dataclass, replace
 
+import duckdb
+import pyarrow as pa
+
+from .budget import limit_sql
+from .pool import check_interrupted
+from .cache import ResultCache
+from .rollups import rewrite_query
 from .connection import get_connection
+from .workers import run_in_worker, deadline, QueryTimeout
+from .admission import Rejection, check_statement, check_relations, check_cost, TIMEOUT, EXECUTION_ERROR
+from ...tracing import span, set_attributes
+from ...config import (
+    RESULT_CACHE_ENABLED,
+    RESULT_CACHE_MAX_BYTES,
+    TABLE_SCHEMAS,
+    QUERY_TIMEOUT_SECONDS,
+    QUERY_MAX_ESTIMATED_ROWS,
+)
+
+_SOURCE_COLUMNS = {
+    column
+    for schema in TABLE_SCHEMAS.values()
+    for column in schema.get("column_mapping", {}).values()
+}
 
 logger = logging.getLogger(__name__)
 
+_result_cache = ResultCache(RESULT_CACHE_MAX_BYTES) if RESULT_CACHE_ENABLED else None
+
+
+class _Rejected(Exception):
+    """Query failed admission after the statement check (e.g. plan too expensive)."""
+
+    def __init__(self, rejection: Rejection):
+        super().__init__(rejection.message)
+        self.rejection = rejection
+
+
+def _iso_interval(value) -> Optional[str]:
+    """ISO-8601 duration for a DuckDB INTERVAL (MonthDayNano), e.g. P2M30DT1H30M."""
+    if value is None:
+        return None
+    months, days, nanos = value.months, value.days, value.nanoseconds
+    sign, months = ("-", -months) if months < 0 else ("", months)
+    years, months = divmod(months, 12)
+    date_part = (f"{sign}{years}Y" if years else "") + (f"{sign}{months}M" if months else "")
+    date_part += f"{days}D" if days else ""
+
+    sign, nanos = ("-", -nanos) if nanos < 0 else ("", nanos)
+    hours, nanos = divmod(nanos, 3_600 * 10**9)
+    minutes, nanos = divmod(nanos, 60 * 10**9)
+    seconds = f"{nanos / 10**9:.9f}".rstrip("0").rstrip(".")
+    time_part = (f"{sign}{hours}H" if hours else "") + (f"{sign}{minutes}M" if minutes else "")
+    time_part += f"{sign}{seconds}S" if nanos else ""
+
+    if not date_part and not time_part:
+        return "PT0S"
+    return f"P{date_part}" + (f"T{time_part}" if time_part else "")
+
+
+def _json_safe(table: pa.Table) -> pa.Table:
+    """Cast dates/timestamps to ISO strings, intervals to ISO-8601 durations,
+    durations to seconds and decimals to floats."""
+    columns = []
+    changed = False
+    for column in table.columns:
+        if pa.types.is_interval(column.type):
+            # Arrow can't cast month_day_nano intervals to strings
+            column = pa.array([_iso_interval(v) for v in column.to_pylist()], type=pa.string())
+            changed = True
+        elif pa.types.is_duration(column.type):
+            column = pa.array(
+                [v.total_seconds() if v is not None else None for v in column.to_pylist()], type=pa.float64()
+            )
+            changed = True
+        elif pa.types.is_temporal(column.type):
+            column = column.cast(pa.string())
+            changed = True
+        elif pa.types.is_decimal(column.type):
+            column = column.cast(pa.float64())
+            changed = True
+        columns.append(column)
+    if not changed:
+        return table
+    return pa.Table.from_arrays(columns, names=table.column_names)
+
 
 @dataclass
 class QueryResult:
-    """Result from SQL query execution."""
+    """Result from SQL query execution (columnar, serialized lazily)."""
 
     success: bool
-    data: list = field(default_factory=list)
-    columns: list = field(default_factory=list)
-    row_count: int = 0
+    table: Optional[pa.Table] = None
     error: Optional[str] = None
+    error_code: Optional[str] = None  # See admission.py, e.g. "too_expensive", "timeout"
+    cached: bool = False
+    truncated: bool = False  # True if rows past max_rows were cut off
+
+    @property
+    def columns(self) -> list:
+        return self.table.column_names if self.table is not None else []
+
+    @property
+    def row_count(self) -> int:
+        return self.table.num_rows if self.table is not None else 0
 
-    def to_dict(self) -> dict:
+    @property
+    def nbytes(self) -> int:
+        return self.table.nbytes if self.table is not None else 0
+
+    @property
+    def data(self) -> list:
+        """Rows as a list of dicts (materializes the whole result)."""
+        return self.to_records()
+
+    def to_records(self) -> list:
+        """Row-oriented JSON-safe encoding: [{col: value, ...}, ...]."""
+        if self.table is None:
+            return []
+        return _json_safe(self.table).to_pylist()
+
+    def to_columns(self) -> dict:
+        """Column-oriented JSON-safe encoding: {col: [values, ...]}."""
+        if self.table is None:
+            return {}
+        return _json_safe(self.table).to_pydict()
+
+    def iter_batches(self, batch_size: int = 1024) -> Iterator[list]:
+        """Yield rows in JSON-safe record batches of at most batch_size."""
+        if self.table is None:
+            return
+        for batch in _json_safe(self.table).to_batches(max_chunksize=batch_size):
+            yield batch.to_pylist()
+
+    def to_dict(self, orient: str = "records") -> dict:
         """Convert to dictionary for JSON serialization."""
         return {
             "success": self.success,
-            "data": self.data,
+            "data": self.to_columns() if orient == "columns" else self.to_records(),
             "columns": self.columns,
             "row_count": self.row_count,
             "error": self.error,
+            "error_code": self.error_code,
         }
 
 
-def execute_query(sql: str) -> QueryResult:
+def _rejected(rejection: Rejection) -> QueryResult:
+    return QueryResult(success=False, error=rejection.message, error_code=rejection.code)
+
+
+def execute_query(
+    sql: str,
+    max_rows: Optional[int] = None,
+    timeout: Optional[float] = QUERY_TIMEOUT_SECONDS,
+) -> QueryResult:
     """
     Execute SQL query and return results.
 
     Args:
-        sql: Valid SELECT query (write operations blocked)
+        sql: A single SELECT/WITH query (anything else is rejected)
+        max_rows: Optional row cap, pushed down into the query as a LIMIT
+        timeout: Seconds before the query is interrupted (None or 0 = no limit)
 
     Returns:
-        QueryResult with data, columns, row_count, and error if failed
+        QueryResult with an Arrow table, or error and error_code if the
+        query was rejected, timed out or failed
     """
-    if not sql or not sql.strip():
-        return QueryResult(success=False, error="Empty SQL query")
+    with span("duckdb.query", **{"db.system": "duckdb", "db.statement": sql}) as current:
+        result = _execute_query(sql, max_rows, timeout)
+        set_attributes(
+            current,
+            **{
+                "db.rows": result.row_count,
+                "retail.cache_hit": result.cached,
+                "retail.truncated": result.truncated,
+                "retail.error_code": result.error_code,
+            },
+        )
+        return result
+
 
-    # Block write operations
-    sql_upper = sql.upper().strip()
-    if any(sql_upper.startswith(op) for op in ("INSERT", "UPDATE", "DELETE", "DROP", "TRUNCATE")):
-        return QueryResult(success=False, error="Write operations not permitted")
+def _execute_query(sql: str, max_rows: Optional[int], timeout: Optional[float]) -> QueryResult:
+    rejection = check_statement(sql)
+    if rejection:
+        return _rejected(rejection)
 
     try:
         conn = get_connection()
-        result_df = conn.execute(sql).fetchdf()
+        # Read before running: a result is never cached under a newer version than its data
+        version = conn.data_version
 
-        return QueryResult(
-            success=True,
-            data=result_df.to_dict(orient="records"),
-            columns=list(result_df.columns),
-            row_count=len(result_df),
-        )
+        run_sql = sql
+        if max_rows is not None:
+            run_sql = limit_sql(sql, max_rows) or sql
+
+        cache_key = None
+        if _result_cache is not None:
+            cache_key = _result_cache.key(run_sql)
+        if cache_key is not None:
+            cached = _result_cache.get(cache_key, version)
+            if cached is not None:
+                logger.info(f"Result cache hit: {sql[:50]}...")
+                return cached
+
+        with deadline(timeout):
+            table = _execute_with_rollups(conn, sql, run_sql, max_rows)
+        result = QueryResult(success=True, table=table)
+        if max_rows is not None and table.num_rows > max_rows:
+            result = QueryResult(success=True, table=table.slice(0, max_rows), truncated=True)
 
+        if cache_key is not None:
+            _result_cache.put(cache_key, version, replace(result, cached=True), result.nbytes)
+
+        return result
+
+    except _Rejected as e:
+        return _rejected(e.rejection)
+    except QueryTimeout as e:
+        logger.warning(f"{e}: {sql[:50]}...")
+        return QueryResult(success=False, error=str(e), error_code=TIMEOUT)
     except Exception as e:
         logger.error(f"Query failed: {e}")
-        return QueryResult(success=False, error=str(e))
+        return QueryResult(success=False, error=str(e), error_code=EXECUTION_ERROR)
+
+
+async def execute_query_async(
+    sql: str,
+    max_rows: Optional[int] = None,
+    timeout: Optional[float] = QUERY_TIMEOUT_SECONDS,
+) -> QueryResult:
+    """
+    Execute SQL query on the worker pool without blocking the event loop.
+
+    The query is interrupted if it runs past the timeout or the awaiting
+    task is cancelled (CancelledError propagates).
+
+    Args:
+        sql: Valid SELECT query (write operations blocked)
+        max_rows: Optional row cap, pushed down into the query as a LIMIT
+        timeout: Seconds before the query is interrupted (None or 0 = no limit)
+
+    Returns:
+        QueryResult with an Arrow table, or error and error_code if the
+        query was rejected, timed out or failed
+    """
+    try:
+        # The worker interrupts on timeout itself - no second deadline inside
+        return await run_in_worker(execute_query, sql, max_rows, None, timeout=timeout)
+    except QueryTimeout as e:
+        return QueryResult(success=False, error=str(e), error_code=TIMEOUT)
+
+
+def _execute_with_rollups(conn, sql: str, run_sql: str, max_rows: Optional[int]) -> pa.Table:
+    """Run the query on the smallest covering rollup if any, else on the fact table."""
+    rewritten = rewrite_query(sql, conn.rollups, _SOURCE_COLUMNS)
+    with conn.cursor() as cursor:
+        rejection = check_relations(cursor, run_sql)
+        if rejection:
+            raise _Rejected(rejection)
+
+        if rewritten is not None:
+            rollup_sql, rollup = rewritten
+            if max_rows is not None:
+                rollup_sql = limit_sql(rollup_sql, max_rows) or rollup_sql
+            check_interrupted()
+            try:
+                table = cursor.execute(rollup_sql).fetch_arrow_table()
+                # Keep the column names the original query would have produced
+                names = [row[0] for row in cursor.execute(f"DESCRIBE {run_sql}").fetchall()]
+                if len(names) == table.num_columns:
+                    logger.info(f"Answered from rollup {rollup}: {sql[:50]}...")
+                    set_attributes(**{"retail.rollup": rollup})
+                    return table.rename_columns(names)
+            except duckdb.InterruptException:
+                raise
+            except Exception as e:
+                logger.warning(f"Rollup query on {rollup} failed, using fact table: {e}")
+
+        rejection = check_cost(cursor, run_sql, QUERY_MAX_ESTIMATED_ROWS)
+        if rejection:
+            raise _Rejected(rejection)
+        # A timeout that fired during admission would otherwise be lost
+        check_interrupted()
+        return cursor.execute(run_sql).fetch_arrow_table()
+
+
+def stream_query(sql: str, batch_size: int = 10_000) -> Iterator[pa.RecordBatch]:
+    """
+    Execute SQL query and stream Arrow record batches.
+
+    Unlike execute_query, the full result is never materialized, which
+    suits exports and other large scans. Results are not cached. The
+    pooled cursor is held until the stream is exhausted or closed.
+
+    Raises:
+        ValueError: If the query is not admitted (see admission.py)
+    """
+    rejection = check_statement(sql)
+    if rejection:
+        raise ValueError(rejection.message)
+
+    with get_connection().cursor() as cursor:
+        rejection = check_relations(cursor, sql) or check_cost(cursor, sql, QUERY_MAX_ESTIMATED_ROWS)
+        if rejection:
+            raise ValueError(rejection.message)
+        check_interrupted()
+        yield from cursor.execute(sql).fetch_record_batch(batch_size)
+
+
+def get_result_cache_stats() -> dict:
+    """Get result cache hit/miss counters."""
+    if _result_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **_result_cache.stats()}
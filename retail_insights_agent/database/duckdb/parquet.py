@@ -0,0 +1,66 @@
+"""
+Parquet storage for out-of-core tables.
+
+In "parquet" storage mode tables are views over Parquet files, scanned
+lazily with projection and filter pushdown instead of being copied into
+memory. Source CSVs are converted once per file into PARQUET_DIR under a
+directory keyed by the table schema, so a schema change starts a fresh
+conversion and a new CSV only costs converting that one file.
+"""
+
+import json
+import shutil
+import hashlib
+import logging
+from pathlib import Path
+from typing import List
+
+from .sources import file_stamp
+from ...config import DATA_DIR, PARQUET_DIR
+
+logger = logging.getLogger(__name__)
+
+
+def parquet_root(table_name: str, schema: dict) -> Path:
+    """Get the directory holding a table's converted Parquet files."""
+    fingerprint = hashlib.sha256(json.dumps(schema, sort_keys=True).encode()).hexdigest()[:12]
+    return PARQUET_DIR / f"{table_name}-{fingerprint}"
+
+
+def parquet_target(root: Path, source: Path) -> Path:
+    """
+    Get the Parquet file a source CSV converts to (keeps partition directories).
+
+    The name carries the source's size and mtime, so a changed source
+    converts to a new file - views over the previous one stay readable
+    until they are re-pointed.
+    """
+    relative = source.relative_to(DATA_DIR)
+    size, mtime_ns = file_stamp(source)
+    return root / relative.parent / f"{relative.stem}.{size}-{mtime_ns}.parquet"
+
+
+def needs_conversion(source: Path, target: Path) -> bool:
+    """Whether the Parquet copy of a source file is missing or older than it."""
+    if not target.exists():
+        return True
+    return target.stat().st_mtime_ns < file_stamp(source)[1]
+
+
+def existing_parquet(schema: dict) -> List[Path]:
+    """Get Parquet files a table serves directly ("parquet_glob" under DATA_DIR)."""
+    return sorted(p for p in DATA_DIR.glob(schema["parquet_glob"]) if p.is_file())
+
+
+def prune_parquet(table_name: str, root: Path, keep: set) -> None:
+    """Remove conversions of deleted sources and directories of old schemas."""
+    if root.exists():
+        for path in root.glob("**/*.parquet"):
+            if path not in keep:
+                path.unlink()
+                logger.info(f"Removed stale Parquet file: {path}")
+
+    for path in PARQUET_DIR.glob(f"{table_name}-*"):
+        if path != root and path.is_dir():
+            shutil.rmtree(path, ignore_errors=True)
+            logger.info(f"Removed Parquet files of an old schema: {path.name}")
@@ -0,0 +1,223 @@
+"""
+Cursor pool for concurrent queries.
+
+A DuckDB connection must not be used from several threads at once, but
+cursors (child connections to the same database) can run queries in
+parallel. CursorPool lends one cursor per call, bounded by a maximum
+concurrency, reuses idle cursors and records how long callers queued.
+Work run under interruptible() can be stopped mid-query through its
+QueryHandle. A pool that is drained (see drain()) keeps serving the
+cursors already lent and closes once the last one is returned.
+"""
+
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+import duckdb
+
+logger = logging.getLogger(__name__)
+
+# QueryHandle of the work running on this thread, if any
+_local = threading.local()
+
+
+class QueryInterrupted(Exception):
+    """Work was interrupted (timed out or cancelled) before it finished."""
+
+
+class PoolClosed(RuntimeError):
+    """The pool (and its connection) is closed - no cursors are lent."""
+
+
+class QueryHandle:
+    """Interrupts the queries one unit of work runs on pooled cursors."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cursor: Optional[duckdb.DuckDBPyConnection] = None
+        self._interrupted = False
+
+    @property
+    def interrupted(self) -> bool:
+        return self._interrupted
+
+    def attach(self, cursor: duckdb.DuckDBPyConnection) -> None:
+        with self._lock:
+            if self._interrupted:
+                raise QueryInterrupted("Query interrupted")
+            self._cursor = cursor
+
+    def detach(self) -> None:
+        with self._lock:
+            self._cursor = None
+
+    def interrupt(self) -> None:
+        """Stop the running query; later queries of this work fail at once."""
+        with self._lock:
+            self._interrupted = True
+            if self._cursor is not None:
+                self._cursor.interrupt()
+
+    def check(self) -> None:
+        """Raise QueryInterrupted if interrupted - DuckDB drops an interrupt landing between statements."""
+        if self._interrupted:
+            raise QueryInterrupted("Query interrupted")
+
+
+def current_handle() -> Optional[QueryHandle]:
+    """Get the QueryHandle of the work running on this thread, if any."""
+    return getattr(_local, "handle", None)
+
+
+def check_interrupted() -> None:
+    """Raise QueryInterrupted if the work running on this thread was interrupted."""
+    handle = current_handle()
+    if handle is not None:
+        handle.check()
+
+
+@contextmanager
+def interruptible(handle: QueryHandle) -> Iterator[None]:
+    """Route cursors borrowed on this thread through the handle."""
+    previous = current_handle()
+    _local.handle = handle
+    try:
+        yield
+    finally:
+        _local.handle = previous
+
+
+class CursorPool:
+    """Bounded pool of cursors over one DuckDB connection."""
+
+    def __init__(self, conn: duckdb.DuckDBPyConnection, max_concurrency: int):
+        self._conn = conn
+        self._max_concurrency = max(1, max_concurrency)
+        self._slots = threading.BoundedSemaphore(self._max_concurrency)
+        self._idle: list = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._on_drained: Optional[Callable[[], None]] = None
+
+        self._created = 0
+        self._in_use = 0
+        self._waiting = 0
+        self._acquired = 0
+        self._queued = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    @contextmanager
+    def cursor(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """
+        Borrow a cursor for the duration of a with-block.
+
+        Blocks while max_concurrency cursors are in use. Results must be
+        fetched inside the block - the cursor is handed to another caller
+        once it exits.
+        """
+        start = time.perf_counter()
+        with self._lock:
+            self._waiting += 1
+        self._slots.acquire()
+        wait = time.perf_counter() - start
+
+        try:
+            with self._lock:
+                self._waiting -= 1
+                if self._closed:
+                    raise PoolClosed("DuckDB connection is closed")
+                self._acquired += 1
+                self._wait_total += wait
+                self._wait_max = max(self._wait_max, wait)
+                if wait >= 0.001:
+                    self._queued += 1
+                cursor = self._idle.pop() if self._idle else None
+                self._in_use += 1
+        except Exception:
+            self._slots.release()
+            raise
+
+        handle = current_handle()
+        try:
+            if cursor is None:
+                cursor = self._conn.cursor()
+                with self._lock:
+                    self._created += 1
+            if handle is None:
+                yield cursor
+            else:
+                handle.attach(cursor)
+                try:
+                    yield cursor
+                finally:
+                    handle.detach()
+        finally:
+            drained, idle = None, []
+            with self._lock:
+                self._in_use -= 1
+                if cursor is not None:
+                    if self._closed:
+                        cursor.close()
+                    else:
+                        self._idle.append(cursor)
+                if not self._in_use and self._on_drained is not None:
+                    drained, self._on_drained = self._on_drained, None
+                    idle = self._shut()
+            self._slots.release()
+            if drained is not None:
+                self._close_cursors(idle)
+                drained()
+
+    def close(self) -> None:
+        """Close idle cursors; cursors in use are closed when returned."""
+        with self._lock:
+            idle = self._shut()
+        self._close_cursors(idle)
+
+    def drain(self, on_drained: Callable[[], None]) -> None:
+        """
+        Close the pool once no cursor is in use, then call on_drained.
+
+        Queries running on lent cursors finish undisturbed, and callers
+        still holding the pool may borrow until then. Closes (and calls
+        on_drained) at once if nothing is in use.
+        """
+        with self._lock:
+            if self._in_use:
+                self._on_drained = on_drained
+                return
+            idle = self._shut()
+        self._close_cursors(idle)
+        on_drained()
+
+    def _shut(self) -> list:
+        """Refuse further borrows and take the idle cursors (call under the lock)."""
+        self._closed = True
+        idle, self._idle = self._idle, []
+        return idle
+
+    @staticmethod
+    def _close_cursors(idle: list) -> None:
+        for cursor in idle:
+            try:
+                cursor.close()
+            except Exception as e:
+                logger.debug(f"Failed to close cursor: {e}")
+
+    def stats(self) -> dict:
+        """Get concurrency and queue-wait counters."""
+        with self._lock:
+            return {
+                "max_concurrency": self._max_concurrency,
+                "cursors": self._created,
+                "in_use": self._in_use,
+                "waiting": self._waiting,
+                "acquired": self._acquired,
+                "queued": self._queued,
+                "avg_wait_ms": round(1000 * self._wait_total / self._acquired, 3) if self._acquired else 0.0,
+                "max_wait_ms": round(1000 * self._wait_max, 3),
+            }
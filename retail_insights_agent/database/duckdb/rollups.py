@@ -0,0 +1,256 @@
+"""
+Materialized rollups.
+
+Rollup tables pre-aggregate a fact table over a few low-cardinality
+dimensions (see ROLLUP_SCHEMAS). rewrite_query() answers an aggregate
+query from the smallest rollup that covers every column it references,
+turning SUM/COUNT/AVG/MIN/MAX over measures into re-aggregations of the
+stored partial aggregates. Anything it cannot prove equivalent is left
+alone and runs against the fact table.
+"""
+
+import logging
+from typing import List, Optional, Tuple
+
+from .sql_text import tokenize
+
+logger = logging.getLogger(__name__)
+
+_AGGREGATES = {"SUM", "COUNT", "AVG", "MIN", "MAX"}
+
+_KEYWORDS = {
+    "SELECT", "FROM", "WHERE", "GROUP", "BY", "HAVING", "ORDER", "LIMIT", "OFFSET",
+    "AS", "AND", "OR", "NOT", "IN", "IS", "NULL", "LIKE", "ILIKE", "BETWEEN",
+    "CASE", "WHEN", "THEN", "ELSE", "END", "ASC", "DESC", "NULLS", "FIRST", "LAST",
+    "DISTINCT", "ALL", "TRUE", "FALSE", "FILTER", "OVER", "PARTITION", "ROWS",
+    "RANGE", "UNBOUNDED", "PRECEDING", "FOLLOWING", "CURRENT", "ROW",
+    "DATE", "TIMESTAMP", "INTERVAL", "YEAR", "MONTH", "DAY", "QUARTER", "WEEK", "DOW",
+    "VARCHAR", "TEXT", "INTEGER", "INT", "BIGINT", "HUGEINT", "DOUBLE", "FLOAT",
+    "DECIMAL", "NUMERIC", "BOOLEAN",
+}
+
+# Row-level scalar functions - safe to evaluate over rollup dimensions
+_SCALAR_FUNCTIONS = {
+    "ROUND", "CAST", "TRY_CAST", "COALESCE", "NULLIF", "IFNULL", "ABS", "CEIL",
+    "CEILING", "FLOOR", "GREATEST", "LEAST", "UPPER", "LOWER", "TRIM", "LENGTH",
+    "CONCAT", "REPLACE", "SUBSTRING", "SUBSTR", "LEFT", "RIGHT", "DATE_TRUNC",
+    "DATE_PART", "DATEPART", "EXTRACT", "STRFTIME", "STRPTIME", "DAYOFWEEK",
+    "DAYNAME", "MONTHNAME", "LAST_DAY",
+}
+
+# Window functions - evaluated over the aggregated rows, so only valid in aggregate queries
+_WINDOW_FUNCTIONS = {
+    "ROW_NUMBER", "RANK", "DENSE_RANK", "PERCENT_RANK", "CUME_DIST", "NTILE",
+    "LAG", "LEAD", "FIRST_VALUE", "LAST_VALUE",
+}
+
+_CLAUSES_AFTER_FROM = {"WHERE", "GROUP", "HAVING", "ORDER", "LIMIT", "OFFSET"}
+
+
+def rollup_sql(name: str, definition: dict) -> str:
+    """Get the statement (re)building a rollup table."""
+    dims = ", ".join(definition["dimensions"])
+    aggregates = ["COUNT(*) AS row_count"]
+    for measure in definition["measures"]:
+        aggregates += [
+            f"SUM({measure}) AS {measure}_sum",
+            f"COUNT({measure}) AS {measure}_count",
+            f"MIN({measure}) AS {measure}_min",
+            f"MAX({measure}) AS {measure}_max",
+        ]
+    return (
+        f"CREATE OR REPLACE TABLE {name} AS SELECT {dims}, {', '.join(aggregates)} "
+        f"FROM {definition['source_table']} GROUP BY {dims}"
+    )
+
+
+class _Unsupported(Exception):
+    """Query shape the rewriter can't prove equivalent on a rollup."""
+
+
+def _matching_paren(tokens: list, start: int) -> int:
+    """Index of the ")" closing the "(" at tokens[start]."""
+    depth = 0
+    for i in range(start, len(tokens)):
+        if tokens[i][1] == "(":
+            depth += 1
+        elif tokens[i][1] == ")":
+            depth -= 1
+            if depth == 0:
+                return i
+    raise _Unsupported("unbalanced parentheses")
+
+
+def _name(kind: str, text: str) -> str:
+    """Column/alias name of a word or quoted identifier token."""
+    if kind == "ident":
+        return text[1:-1].replace('""', '"').lower()
+    return text.lower()
+
+
+class _Rewriter:
+    """Rewrites the tokens of one query, recording what it references."""
+
+    def __init__(self, measures: set, source_columns: set, aliases: set):
+        self.measures = measures
+        self.source_columns = source_columns
+        self.aliases = aliases - source_columns  # Aliases shadowing real columns count as columns
+        self.columns: set = set()
+        self.used_measures: set = set()
+        self.has_aggregate = False
+
+    def rewrite(self, tokens: list) -> List[str]:
+        out = []
+        i = 0
+        while i < len(tokens):
+            kind, text = tokens[i]
+            upper = text.upper()
+            is_call = kind == "word" and i + 1 < len(tokens) and tokens[i + 1][1] == "("
+
+            if is_call and upper in _AGGREGATES:
+                end = _matching_paren(tokens, i + 1)
+                args = tokens[i + 2:end]
+                i = end + 1
+                filter_sql = ""
+                if i + 1 < len(tokens) and tokens[i][1].upper() == "FILTER" and tokens[i + 1][1] == "(":
+                    filter_end = _matching_paren(tokens, i + 1)
+                    filter_sql = f" FILTER ( {' '.join(self.rewrite(tokens[i + 2:filter_end]))} )"
+                    i = filter_end + 1
+                windowed = i < len(tokens) and tokens[i][1].upper() == "OVER"
+                out.append(self._aggregate(upper, args, filter_sql, windowed))
+                continue
+
+            if is_call and upper not in _SCALAR_FUNCTIONS | _WINDOW_FUNCTIONS | _KEYWORDS:
+                raise _Unsupported(f"function {upper}")
+
+            out.append(self._token(kind, text))
+            i += 1
+        return out
+
+    def _token(self, kind: str, text: str) -> str:
+        if kind == "word" and (text.upper() in _KEYWORDS or text.upper() in _SCALAR_FUNCTIONS | _WINDOW_FUNCTIONS):
+            return text
+        if kind in ("word", "ident"):
+            name = _name(kind, text)
+            if name in self.aliases:
+                return text
+            if name in self.measures:
+                raise _Unsupported(f"measure {name} outside an aggregate")
+            self.columns.add(name)
+        return text
+
+    def _aggregate(self, name: str, args: list, filter_sql: str, windowed: bool) -> str:
+        """Rewrite one aggregate call over fact rows into one over rollup rows."""
+        if windowed:
+            # Window over the already-aggregated rows - only nested aggregates change
+            return f"{name} ( {' '.join(self.rewrite(args))} ){filter_sql}"
+
+        self.has_aggregate = True
+        if any(t[1].upper() in _AGGREGATES for t in args):
+            raise _Unsupported("nested aggregate")
+
+        if args and args[0][1].upper() == "DISTINCT":
+            # Distinct values of dimension expressions are the same on the rollup
+            return f"{name} ( {' '.join(self.rewrite(args))} ){filter_sql}"
+
+        if name == "COUNT" and [t[1] for t in args] in (["*"], ["1"]):
+            return f"CAST(COALESCE(SUM(row_count){filter_sql}, 0) AS BIGINT)"
+
+        if len(args) == 1 and args[0][0] in ("word", "ident") and _name(*args[0]) in self.measures:
+            measure = _name(*args[0])
+            self.used_measures.add(measure)
+            if name == "SUM":
+                return f"SUM({measure}_sum){filter_sql}"
+            if name == "COUNT":
+                return f"CAST(COALESCE(SUM({measure}_count){filter_sql}, 0) AS BIGINT)"
+            if name == "AVG":
+                return f"(SUM({measure}_sum){filter_sql} / SUM({measure}_count){filter_sql})"
+            return f"{name}({measure}_{name.lower()}){filter_sql}"
+
+        # Expression over dimensions only (measures are rejected in _token)
+        expr = " ".join(self.rewrite(args))
+        if name in ("MIN", "MAX"):
+            return f"{name} ( {expr} ){filter_sql}"
+        if name == "SUM":
+            return f"SUM(( {expr} ) * row_count){filter_sql}"
+        if name == "COUNT":
+            return f"CAST(COALESCE(SUM(CASE WHEN ( {expr} ) IS NOT NULL THEN row_count END){filter_sql}, 0) AS BIGINT)"
+        raise _Unsupported(f"{name} over an expression")
+
+
+def rewrite_query(sql: str, rollups: dict, source_columns: set) -> Optional[Tuple[str, str]]:
+    """
+    Rewrite an aggregate query to run on the smallest covering rollup.
+
+    Args:
+        sql: Query against a fact table
+        rollups: Rollup name -> definition (with "row_count") present in the database
+        source_columns: Column names of the fact table (aliases must not shadow them)
+
+    Returns:
+        (rewritten_sql, rollup_name), or None if no rollup can answer the query
+    """
+    if not rollups:
+        return None
+
+    tokens = tokenize(sql)
+    while tokens and tokens[-1][1] == ";":
+        tokens.pop()
+    if not tokens or tokens[0][1].upper() != "SELECT":
+        return None
+    if sum(1 for kind, text in tokens if kind == "word" and text.upper() == "SELECT") != 1:
+        return None  # Subqueries, CTEs, set operations
+
+    # Single top-level FROM <fact table> with no alias or join
+    depth, from_index, has_group_by = 0, None, False
+    for i, (kind, text) in enumerate(tokens):
+        if text == "(":
+            depth += 1
+        elif text == ")":
+            depth -= 1
+        elif depth == 0 and kind == "word" and text.upper() == "FROM":
+            if from_index is not None:
+                return None
+            from_index = i
+        elif depth == 0 and kind == "word" and text.upper() == "GROUP":
+            has_group_by = True
+    if from_index is None or from_index + 1 >= len(tokens):
+        return None
+
+    source = _name(*tokens[from_index + 1])
+    after = tokens[from_index + 2] if from_index + 2 < len(tokens) else None
+    if after is not None and after[1].upper() not in _CLAUSES_AFTER_FROM:
+        return None
+
+    candidates = {n: d for n, d in rollups.items() if d["source_table"] == source}
+    if not candidates:
+        return None
+    measures = set().union(*(d["measures"] for d in candidates.values()))
+
+    aliases = {
+        _name(*tokens[i + 1])
+        for i in range(len(tokens) - 1)
+        if tokens[i][1].upper() == "AS" and tokens[i + 1][0] in ("word", "ident")
+    }
+    rewriter = _Rewriter(measures, {c.lower() for c in source_columns}, aliases)
+    try:
+        select_part = rewriter.rewrite(tokens[:from_index])
+        rest = rewriter.rewrite(tokens[from_index + 2:])
+    except _Unsupported as e:
+        logger.debug(f"Rollup rewrite skipped: {e}")
+        return None
+
+    if not (rewriter.has_aggregate or has_group_by):
+        return None  # Row-level query
+
+    covering = [
+        (definition["row_count"], name)
+        for name, definition in candidates.items()
+        if rewriter.columns <= set(definition["dimensions"])
+        and rewriter.used_measures <= set(definition["measures"])
+    ]
+    if not covering:
+        return None
+
+    _, rollup = min(covering)
+    return " ".join(select_part + ["FROM", rollup] + rest), rollup
@@ -0,0 +1,107 @@
+"""
+On-disk DuckDB snapshots.
+
+A snapshot is a DuckDB database file built once from the source CSVs.
+It is keyed by a hash of the source files, TABLE_SCHEMAS and the rollup
+definitions, so later process starts can attach it read-only instead of
+re-parsing the CSVs.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Optional
+
+import duckdb
+
+from .sources import source_files
+from ...config import SNAPSHOT_DIR
+
+logger = logging.getLogger(__name__)
+
+# Bump when the snapshot build logic changes in a way the key can't see
+SNAPSHOT_FORMAT_VERSION = 3
+
+_DIGEST_INDEX = "digests.json"
+
+
+def _load_digest_index() -> dict:
+    """Load cached file digests keyed by path, size and mtime."""
+    index_path = SNAPSHOT_DIR / _DIGEST_INDEX
+    try:
+        return json.loads(index_path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_digest_index(index: dict) -> None:
+    """Persist cached file digests (best effort)."""
+    try:
+        SNAPSHOT_DIR.mkdir(parents=True, exist_ok=True)
+        (SNAPSHOT_DIR / _DIGEST_INDEX).write_text(json.dumps(index, indent=2))
+    except OSError as e:
+        logger.warning(f"Could not save digest index: {e}")
+
+
+def file_digest(path: Path, index: Optional[dict] = None) -> str:
+    """
+    Get SHA-256 of a file's contents.
+
+    Digests are memoized by (size, mtime) so unchanged files are not
+    re-read on every start.
+    """
+    stat = path.stat()
+    stamp = f"{stat.st_size}:{stat.st_mtime_ns}"
+    entry = (index or {}).get(str(path))
+    if entry and entry.get("stamp") == stamp:
+        return entry["sha256"]
+
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    digest = h.hexdigest()
+
+    if index is not None:
+        index[str(path)] = {"stamp": stamp, "sha256": digest}
+    return digest
+
+
+def snapshot_key(schemas: dict, data_dir: Path, rollups: Optional[dict] = None) -> Optional[str]:
+    """
+    Compute the snapshot key for the given table schemas and rollups.
+
+    Returns None if a table has no source files (nothing to snapshot).
+    """
+    index = _load_digest_index()
+    h = hashlib.sha256()
+    h.update(f"format={SNAPSHOT_FORMAT_VERSION};duckdb={duckdb.__version__}".encode())
+    h.update(json.dumps(schemas, sort_keys=True, default=str).encode())
+    h.update(json.dumps(rollups or {}, sort_keys=True).encode())
+
+    for table_name, schema in sorted(schemas.items()):
+        files = source_files(schema, data_dir)
+        if not files:
+            return None
+        for source in files:
+            h.update(f"{table_name}:{source.relative_to(data_dir)}={file_digest(source, index)}".encode())
+
+    _save_digest_index(index)
+    return h.hexdigest()[:16]
+
+
+def snapshot_path(key: str) -> Path:
+    """Get the snapshot file path for a key."""
+    return SNAPSHOT_DIR / f"retail_{key}.duckdb"
+
+
+def prune_snapshots(keep: Path) -> None:
+    """Remove snapshots other than the current one."""
+    for path in SNAPSHOT_DIR.glob("retail_*.duckdb"):
+        if path != keep:
+            try:
+                path.unlink()
+                logger.info(f"Removed stale snapshot: {path.name}")
+            except OSError as e:
+                logger.warning(f"Could not remove stale snapshot {path.name}: {e}")
@@ -0,0 +1,42 @@
+"""
+Source files for TABLE_SCHEMAS tables.
+
+A table is loaded either from a single source_file or from every file
+matching source_glob under DATA_DIR (optionally Hive-partitioned, e.g.
+"sales/month=2022-04/day.csv"). Files are identified by path, size and
+mtime so incremental ingest can tell new files from changed ones.
+"""
+
+from pathlib import Path
+from typing import List, Tuple
+
+
+def source_files(schema: dict, data_dir: Path) -> List[Path]:
+    """Get the existing source files of a table, in a stable order."""
+    pattern = schema.get("source_glob")
+    if pattern:
+        return sorted(p for p in data_dir.glob(pattern) if p.is_file())
+
+    path = data_dir / schema["source_file"]
+    return [path] if path.exists() else []
+
+
+def source_description(schema: dict) -> str:
+    """Human-readable source of a table, for log messages."""
+    return schema.get("source_glob") or schema["source_file"]
+
+
+def file_stamp(path: Path) -> Tuple[int, int]:
+    """Get (size, mtime_ns) of a file."""
+    stat = path.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+def sql_path(path: Path) -> str:
+    """Quote a file path as a SQL string literal."""
+    return "'" + str(path).replace("\\", "/").replace("'", "''") + "'"
+
+
+def sql_path_list(paths: List[Path]) -> str:
+    """Quote file paths as a SQL list literal for read_csv."""
+    return "[" + ", ".join(sql_path(p) for p in paths) + "]"
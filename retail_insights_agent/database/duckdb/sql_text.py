@@ -0,0 +1,72 @@
+"""
+Lightweight SQL text utilities.
+
+A small tokenizer that understands string literals, quoted identifiers
+and comments - enough to canonicalize generated SQL for cache keys
+without pulling in a full SQL parser.
+"""
+
+import re
+from typing import List, Tuple
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<comment>--[^\n]*|/\*.*?\*/)
+  | (?P<string>'(?:[^']|'')*')
+  | (?P<ident>"(?:[^"]|"")*")
+  | (?P<number>\d+(?:\.\d*)?(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)
+  | (?P<word>[A-Za-z_][A-Za-z0-9_$]*)
+  | (?P<space>\s+)
+  | (?P<op><>|!=|>=|<=|::|\|\||.)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+
+def tokenize(sql: str) -> List[Tuple[str, str]]:
+    """Split SQL into (kind, text) tokens, dropping comments and whitespace."""
+    tokens = []
+    for match in _TOKEN_RE.finditer(sql):
+        kind = match.lastgroup
+        if kind in ("comment", "space"):
+            continue
+        tokens.append((kind, match.group()))
+    return tokens
+
+
+# DuckDB's reserved keywords (duckdb_keywords(), category "reserved"). They
+# can't name a column unquoted, so their case never shows in a result.
+_RESERVED_KEYWORDS = frozenset("""
+    ALL ANALYSE ANALYZE AND ANY ARRAY AS ASC ASYMMETRIC BOTH CASE CAST CHECK
+    COLLATE COLUMN CONSTRAINT CREATE DEFAULT DEFERRABLE DESC DESCRIBE DISTINCT
+    DO ELSE END EXCEPT FALSE FETCH FOR FOREIGN FROM GRANT GROUP HAVING IN
+    INITIALLY INTERSECT INTO LATERAL LEADING LIMIT NOT NULL OFFSET ON ONLY OR
+    ORDER PIVOT PIVOT_LONGER PIVOT_WIDER PLACING PRIMARY QUALIFY REFERENCES
+    RETURNING SELECT SHOW SOME SUMMARIZE SYMMETRIC TABLE THEN TO TRAILING TRUE
+    UNION UNIQUE UNPIVOT USING VARIADIC WHEN WHERE WINDOW WITH
+""".split())
+
+
+def canonicalize_sql(sql: str) -> str:
+    """
+    Canonical form of a query for cache keys.
+
+    Collapses whitespace, drops comments and trailing semicolons and
+    uppercases reserved keywords. Everything else is kept verbatim:
+    identifiers and aliases (their spelling names result columns, e.g.
+    sum(Amount) vs sum(amount)) and literals (1.50 is DECIMAL(3,2), 1.5
+    DECIMAL(2,1)), so two queries share a key only if they return the
+    same result.
+    """
+    parts = []
+    for kind, text in tokenize(sql):
+        # A word after AS or "." is a name, even when it spells a keyword
+        named = parts and parts[-1] in ("AS", ".")
+        if kind == "word" and not named and text.upper() in _RESERVED_KEYWORDS:
+            parts.append(text.upper())
+        else:
+            parts.append(text)
+
+    while parts and parts[-1] == ";":
+        parts.pop()
+    return " ".join(parts)
@@ -0,0 +1,112 @@
+"""
+Executive summary in one scan.
+
+Totals, top categories, top states and the order status distribution
+are computed by a single GROUPING SETS query over the sales table
+instead of one query per section. The payload is cached per data
+version.
+"""
+
+import logging
+import threading
+from typing import Optional
+
+from .connection import get_connection
+
+logger = logging.getLogger(__name__)
+
+_TABLE = "amazon_sales"
+_TOP_N = 5
+
+_SUMMARY_SQL = f"""
+SELECT
+    GROUPING(category) AS g_category,
+    GROUPING(state) AS g_state,
+    GROUPING(status) AS g_status,
+    CAST(category AS VARCHAR) AS category,
+    state,
+    CAST(status AS VARCHAR) AS status,
+    CAST(SUM(amount) AS DOUBLE) AS revenue,
+    COUNT(*) AS orders,
+    MIN(order_date) AS first_date,
+    MAX(order_date) AS last_date
+FROM {_TABLE}
+GROUP BY GROUPING SETS ((), (category), (state), (status))
+"""
+
+_summary: Optional[dict] = None
+_summary_version: Optional[str] = None
+_lock = threading.Lock()
+
+
+def _share(part: float, total: float) -> Optional[float]:
+    return round(100.0 * part / total, 1) if total else None
+
+
+def _build_summary(rows: list, data_version: Optional[str]) -> dict:
+    """Split grouping-set rows into the summary sections."""
+    total, categories, states, statuses = None, [], [], []
+    for g_category, g_state, g_status, category, state, status, revenue, orders, first, last in rows:
+        if g_category and g_state and g_status:
+            total = (revenue or 0.0, orders, first, last)
+        elif not g_category:
+            categories.append((category, revenue or 0.0, orders))
+        elif not g_state:
+            states.append((state, revenue or 0.0, orders))
+        else:
+            statuses.append((status, orders))
+
+    revenue, orders, first, last = total or (0.0, 0, None, None)
+    categories.sort(key=lambda c: -c[1])
+    states.sort(key=lambda s: -s[2])
+    statuses.sort(key=lambda s: -s[1])
+
+    return {
+        "data_version": data_version,
+        "period": {
+            "start": first.isoformat() if first else None,
+            "end": last.isoformat() if last else None,
+        },
+        "total": {
+            "revenue": round(revenue, 2),
+            "orders": orders,
+            "avg_order_value": round(revenue / orders, 2) if orders else None,
+        },
+        "top_categories": [
+            {"category": name, "revenue": round(value, 2), "share": _share(value, revenue), "orders": count}
+            for name, value, count in categories[:_TOP_N]
+        ],
+        "top_states": [
+            {"state": name, "orders": count, "share": _share(count, orders), "revenue": round(value, 2)}
+            for name, value, count in states[:_TOP_N]
+        ],
+        "status_distribution": [
+            {"status": name, "orders": count, "share": _share(count, orders)}
+            for name, count in statuses
+        ],
+    }
+
+
+def compute_summary() -> dict:
+    """
+    Get the executive summary of the sales table.
+
+    Returns:
+        Dict with period, total (revenue, orders, avg_order_value),
+        top_categories (by revenue), top_states (by orders) and
+        status_distribution, with percentage shares
+    """
+    global _summary, _summary_version
+    conn = get_connection()
+    version = conn.data_version
+    if _summary is not None and _summary_version == version:
+        return _summary
+
+    with _lock:
+        if _summary is None or _summary_version != version:
+            with conn.cursor() as cursor:
+                rows = cursor.execute(_SUMMARY_SQL).fetchall()
+            _summary = _build_summary(rows, version)
+            _summary_version = version
+            logger.info(f"Executive summary computed for data version {version}")
+    return _summary
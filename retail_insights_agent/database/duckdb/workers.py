@@ -0,0 +1,117 @@
+"""
+Worker pool for DuckDB work awaited from async code.
+
+Queries run on a bounded thread pool so a long scan never blocks the
+event loop. When the awaiting task is cancelled or the timeout passes,
+the running query is interrupted and its worker freed. deadline() puts
+the same wall-clock limit on synchronous callers.
+"""
+
+import asyncio
+import logging
+import threading
+import contextvars
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+from concurrent.futures import ThreadPoolExecutor
+
+import duckdb
+
+from .pool import QueryHandle, QueryInterrupted, current_handle, interruptible
+from ...config import DUCKDB_MAX_CONCURRENCY
+
+logger = logging.getLogger(__name__)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+
+
+class QueryTimeout(Exception):
+    """Work did not finish within its timeout and was interrupted."""
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the shared worker pool (one worker per pooled cursor)."""
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=max(1, DUCKDB_MAX_CONCURRENCY), thread_name_prefix="duckdb-query"
+                )
+    return _executor
+
+
+@contextmanager
+def deadline(timeout: Optional[float]) -> Iterator[None]:
+    """
+    Interrupt queries this thread runs on pooled cursors after timeout seconds.
+
+    Raises:
+        QueryTimeout: If a query was interrupted because the time ran out
+    """
+    if not timeout:
+        yield
+        return
+
+    handle = current_handle() or QueryHandle()
+    expired = threading.Event()
+
+    def expire():
+        expired.set()
+        handle.interrupt()
+
+    timer = threading.Timer(timeout, expire)
+    timer.daemon = True
+    with interruptible(handle):
+        timer.start()
+        try:
+            yield
+        except (duckdb.InterruptException, QueryInterrupted):
+            if expired.is_set():
+                raise QueryTimeout(f"Query timed out after {timeout:g}s") from None
+            raise
+        finally:
+            timer.cancel()
+
+
+def _retrieve(future: asyncio.Future) -> None:
+    # Interrupted work finishes after nobody awaits it - consume its outcome
+    if not future.cancelled():
+        future.exception()
+
+
+async def run_in_worker(fn: Callable, *args, timeout: Optional[float] = None):
+    """
+    Run blocking DuckDB work on the worker pool and await its result.
+
+    Args:
+        fn: Function borrowing pooled cursors (e.g. execute_query)
+        *args: Arguments for fn
+        timeout: Seconds before the work is interrupted (None or 0 = no limit)
+
+    Raises:
+        QueryTimeout: If the timeout passed; the query is interrupted
+        asyncio.CancelledError: If the awaiting task was cancelled; the query is interrupted
+    """
+    handle = QueryHandle()
+
+    def work():
+        with interruptible(handle):
+            return fn(*args)
+
+    # Carry the caller's context (current trace span) into the worker thread
+    context = contextvars.copy_context()
+    future = asyncio.get_running_loop().run_in_executor(_get_executor(), context.run, work)
+    future.add_done_callback(_retrieve)
+    try:
+        # shield: the worker can't be cancelled, only its query interrupted
+        return await asyncio.wait_for(asyncio.shield(future), timeout or None)
+    except asyncio.TimeoutError:
+        handle.interrupt()
+        logger.warning(f"DuckDB work timed out after {timeout}s, interrupted")
+        raise QueryTimeout(f"Query timed out after {timeout:g}s") from None
+    except asyncio.CancelledError:
+        handle.interrupt()
+        logger.info("DuckDB work cancelled, interrupted")
+        raise
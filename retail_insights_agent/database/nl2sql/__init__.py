@@ -0,0 +1,5 @@
+"""Schema-aware natural language to SQL generation."""
+
+from .cache import SQLCache
+from .profile import get_schema_context
+from .generator import NativeSQLGenerator, SQLGenerationResult, get_generator
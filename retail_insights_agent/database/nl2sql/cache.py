@@ -0,0 +1,264 @@
+"""
+Cache for generated SQL.
+
+Two tiers sit in front of the LLM:
+1. Exact match on the normalized question
+2. N-gram similarity match against cached questions with the same set
+   of content words - they may differ in stopwords, word order, plurals
+   and punctuation only, so "top 5 states" never reuses the SQL for
+   "top 10 states", "bottom 5 states" or "top 5 states excluding Kerala"
+
+Entries are evicted LRU and by TTL, optionally persisted to a JSON file,
+and dropped whenever TABLE_SCHEMAS changes.
+"""
+
+import os
+import re
+import json
+import math
+import time
+import logging
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+_STOPWORDS = {
+    "a", "an", "the", "of", "in", "on", "for", "to", "by", "and", "or", "is",
+    "are", "was", "were", "be", "me", "my", "show", "give", "tell", "list",
+    "what", "which", "who", "how", "please", "can", "you", "i", "we", "our",
+    "do", "does", "with", "from", "all",
+}
+
+
+@dataclass
+class CacheHit:
+    """A cached SQL lookup result."""
+
+    sql: str
+    tier: str  # "exact" or "similar"
+    score: float = 1.0
+    matched_question: Optional[str] = None
+
+
+@dataclass
+class _Entry:
+    question: str
+    sql: str
+    created_at: float
+    guard: str
+    vector: dict
+
+
+def normalize_question(question: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace."""
+    return " ".join(_WORD_RE.findall(question.lower()))
+
+
+def _stem(word: str) -> str:
+    """Crude plural folding so 'categories' matches 'category'."""
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith("s") and not word.endswith(("ss", "us")):
+        return word[:-1]
+    return word
+
+
+class SQLCache:
+    """
+    Thread-safe two-tier NL -> SQL cache.
+
+    Similarity is cosine over character trigrams and word tokens. A
+    similar match is only considered when both questions share the same
+    guard key: their set of (stemmed) content words. Any word that can
+    change the SQL - a number, column, data value, direction ("top",
+    "lowest") or negation ("excluding", "not") - therefore has to match.
+    """
+
+    def __init__(
+        self,
+        schema_fingerprint: str,
+        max_entries: int = 1024,
+        ttl_seconds: float = 86400,
+        similarity_threshold: float = 0.9,
+        persist_path: Optional[str] = None,
+    ):
+        self._fingerprint = schema_fingerprint
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._threshold = similarity_threshold
+        self._persist_path = Path(persist_path) if persist_path else None
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = {"exact": 0, "similar": 0}
+        self.misses = 0
+
+        if self._persist_path:
+            self._load()
+
+    def _tokens(self, normalized: str) -> list:
+        return [_stem(w) for w in normalized.split() if w not in _STOPWORDS]
+
+    def _guard(self, tokens: list) -> str:
+        return "|".join(sorted(set(tokens)))
+
+    def _vector(self, tokens: list) -> dict:
+        text = " ".join(tokens)
+        grams = Counter(f"w:{t}" for t in tokens)
+        padded = f"  {text} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+        norm = math.sqrt(sum(v * v for v in grams.values())) or 1.0
+        return {k: v / norm for k, v in grams.items()}
+
+    @staticmethod
+    def _cosine(a: dict, b: dict) -> float:
+        if len(a) > len(b):
+            a, b = b, a
+        return sum(v * b.get(k, 0.0) for k, v in a.items())
+
+    def _expired(self, entry: _Entry, now: float) -> bool:
+        return self._ttl > 0 and now - entry.created_at > self._ttl
+
+    def get(self, question: str) -> Optional[CacheHit]:
+        """Look up cached SQL for a question."""
+        key = normalize_question(question)
+        if not key:
+            return None
+
+        now = time.time()
+        with self._lock:
+            # Tier 1: exact normalized match
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self._expired(entry, now):
+                    del self._entries[key]
+                else:
+                    self._entries.move_to_end(key)
+                    self.hits["exact"] += 1
+                    return CacheHit(sql=entry.sql, tier="exact", matched_question=entry.question)
+
+            # Tier 2: similarity within the same guard bucket
+            tokens = self._tokens(key)
+            guard = self._guard(tokens)
+            vector = self._vector(tokens)
+            best_key, best_score = None, 0.0
+            for cached_key, cached in list(self._entries.items()):
+                if self._expired(cached, now):
+                    del self._entries[cached_key]
+                    continue
+                if cached.guard != guard:
+                    continue
+                score = self._cosine(vector, cached.vector)
+                if score > best_score:
+                    best_key, best_score = cached_key, score
+
+            if best_key is not None and best_score >= self._threshold:
+                cached = self._entries[best_key]
+                self._entries.move_to_end(best_key)
+                self.hits["similar"] += 1
+                return CacheHit(
+                    sql=cached.sql,
+                    tier="similar",
+                    score=round(best_score, 4),
+                    matched_question=cached.question,
+                )
+
+            self.misses += 1
+            return None
+
+    def put(self, question: str, sql: str) -> None:
+        """Store generated SQL for a question."""
+        key = normalize_question(question)
+        if not key or not sql:
+            return
+
+        tokens = self._tokens(key)
+        entry = _Entry(
+            question=question,
+            sql=sql,
+            created_at=time.time(),
+            guard=self._guard(tokens),
+            vector=self._vector(tokens),
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+        if self._persist_path:
+            self._save()
+
+    def invalidate(self, schema_fingerprint: Optional[str] = None) -> None:
+        """Drop all entries, optionally switching to a new schema fingerprint."""
+        with self._lock:
+            self._entries.clear()
+            if schema_fingerprint:
+                self._fingerprint = schema_fingerprint
+        if self._persist_path:
+            self._save()
+
+    def stats(self) -> dict:
+        """Get hit/miss counters and size."""
+        return {
+            "entries": len(self._entries),
+            "hits_exact": self.hits["exact"],
+            "hits_similar": self.hits["similar"],
+            "misses": self.misses,
+        }
+
+    def _load(self) -> None:
+        """Load persisted entries, discarding them if the schema changed."""
+        try:
+            payload = json.loads(self._persist_path.read_text())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable SQL cache file: {e}")
+            return
+
+        if payload.get("schema_fingerprint") != self._fingerprint:
+            logger.info("TABLE_SCHEMAS changed - discarding persisted SQL cache")
+            return
+
+        now = time.time()
+        for item in payload.get("entries", []):
+            key = normalize_question(item["question"])
+            tokens = self._tokens(key)
+            entry = _Entry(
+                question=item["question"],
+                sql=item["sql"],
+                created_at=item["created_at"],
+                guard=self._guard(tokens),
+                vector=self._vector(tokens),
+            )
+            if key and not self._expired(entry, now):
+                self._entries[key] = entry
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        logger.info(f"Loaded {len(self._entries)} cached SQL entries")
+
+    def _save(self) -> None:
+        """Write entries to disk atomically (best effort)."""
+        with self._lock:
+            payload = {
+                "schema_fingerprint": self._fingerprint,
+                "entries": [
+                    {"question": e.question, "sql": e.sql, "created_at": e.created_at}
+                    for e in self._entries.values()
+                ],
+            }
+
+            try:
+                self._persist_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self._persist_path.with_name(f"{self._persist_path.name}.{os.getpid()}.tmp")
+                tmp_path.write_text(json.dumps(payload))
+                os.replace(tmp_path, self._persist_path)
+            except OSError as e:
+                logger.warning(f"Could not persist SQL cache: {e}")
@@ -0,0 +1,205 @@
+"""
+Schema-aware SQL generation.
+
+Converts natural language questions to DuckDB SQL with one OpenAI call.
+The prompt carries the schema, field descriptions and a column profile
+(see profile.py), and the model answers with the SQL itself - no
+generated Python to mine, no sampling queries per request.
+Repeated and near-duplicate questions are served from SQLCache.
+"""
+
+import re
+import asyncio
+import logging
+import threading
+from typing import Optional
+from dataclasses import dataclass
+
+from openai import OpenAI
+
+from .cache import SQLCache
+from .profile import get_schema_context
+from ..duckdb.admission import check_statement
+from ...tracing import span, set_attributes
+from ...replay.openai_chat import ReplayOpenAIChat
+from ...config import (
+    OPENAI_API_KEY,
+    OPENAI_MODEL,
+    LLM_REPLAY_MODE,
+    SQL_CACHE_ENABLED,
+    SQL_CACHE_MAX_ENTRIES,
+    SQL_CACHE_TTL_SECONDS,
+    SQL_CACHE_SIMILARITY_THRESHOLD,
+    SQL_CACHE_PATH,
+    get_schema_fingerprint,
+)
+
+logger = logging.getLogger(__name__)
+
+SYSTEM_PROMPT = """You translate questions about retail sales data into DuckDB SQL.
+
+{schema}
+
+Rules:
+- Reply with one DuckDB SELECT (or WITH) statement and nothing else: no explanation, no markdown.
+- Use only the tables and columns above. Text values are case-sensitive - use them exactly as listed.
+- Give result columns short snake_case aliases, and order rankings and "top N" results with a LIMIT.
+- If the question cannot be answered from these tables, reply with the single word UNANSWERABLE."""
+
+_FENCE_RE = re.compile(r"^```(?:sql)?\s*(.*?)\s*```$", re.DOTALL | re.IGNORECASE)
+
+
+@dataclass
+class SQLGenerationResult:
+    """Result from SQL generation."""
+
+    success: bool
+    sql: Optional[str] = None
+    error: Optional[str] = None
+    cache_tier: Optional[str] = None  # "exact" / "similar" when served from cache
+
+
+class OpenAIChat:
+    """Minimal OpenAI chat client: messages in, content and token usage out."""
+
+    def __init__(self, api_key: str, model: str):
+        self._client = OpenAI(api_key=api_key)
+        self._model = model
+
+    def complete(self, messages: list) -> dict:
+        response = self._client.chat.completions.create(model=self._model, messages=messages, temperature=0)
+        usage = response.usage
+        return {
+            "content": response.choices[0].message.content or "",
+            "input_tokens": usage.prompt_tokens if usage else None,
+            "output_tokens": usage.completion_tokens if usage else None,
+        }
+
+
+class NativeSQLGenerator:
+    """
+    Generates SQL from natural language with a single schema-aware prompt.
+
+    Stateless per call, so concurrent questions need no pooling.
+    """
+
+    _instance: Optional["NativeSQLGenerator"] = None
+    _lock = threading.Lock()
+
+    def __init__(self):
+        self._llm = None
+        self._cache: Optional[SQLCache] = None
+
+    @classmethod
+    def get_instance(cls) -> "NativeSQLGenerator":
+        """Get or create singleton instance."""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    instance = cls()
+                    instance._initialize()
+                    cls._instance = instance
+        return cls._instance
+
+    def _initialize(self) -> None:
+        """Build the schema context, the LLM client and the SQL cache."""
+        if self._llm is not None:
+            return
+
+        get_schema_context()
+        self._llm = self._create_llm()
+
+        if SQL_CACHE_ENABLED:
+            self._cache = SQLCache(
+                schema_fingerprint=get_schema_fingerprint(),
+                max_entries=SQL_CACHE_MAX_ENTRIES,
+                ttl_seconds=SQL_CACHE_TTL_SECONDS,
+                similarity_threshold=SQL_CACHE_SIMILARITY_THRESHOLD,
+                persist_path=SQL_CACHE_PATH or None,
+            )
+
+        logger.info("NativeSQLGenerator initialized")
+
+    def _create_llm(self):
+        """Create the OpenAI chat client (or its record/replay stand-in)."""
+        if LLM_REPLAY_MODE == "replay":
+            return ReplayOpenAIChat()
+
+        llm = OpenAIChat(api_key=OPENAI_API_KEY, model=OPENAI_MODEL)
+        if LLM_REPLAY_MODE == "record":
+            return ReplayOpenAIChat(inner=llm)
+        return llm
+
+    def _messages(self, question: str) -> list:
+        return [
+            {"role": "system", "content": SYSTEM_PROMPT.format(schema=get_schema_context())},
+            {"role": "user", "content": question},
+        ]
+
+    def generate(self, question: str) -> SQLGenerationResult:
+        """
+        Generate SQL from natural language question.
+
+        Args:
+            question: Natural language question about the data
+
+        Returns:
+            SQLGenerationResult with generated SQL or error
+        """
+        if self._cache is not None:
+            hit = self._cache.get(question)
+            if hit:
+                logger.info(f"SQL cache hit ({hit.tier}, score={hit.score}): {question[:50]}...")
+                return SQLGenerationResult(success=True, sql=hit.sql, cache_tier=hit.tier)
+
+        try:
+            with span(
+                "nl2sql.generate", **{"gen_ai.system": "openai", "gen_ai.request.model": OPENAI_MODEL}
+            ) as current:
+                completion = self._llm.complete(self._messages(question))
+                set_attributes(
+                    current,
+                    **{
+                        "gen_ai.usage.input_tokens": completion["input_tokens"],
+                        "gen_ai.usage.output_tokens": completion["output_tokens"],
+                    },
+                )
+            sql = self._extract_sql(completion["content"])
+
+            if sql is None:
+                return SQLGenerationResult(success=False, error="The question can't be answered from the sales data")
+            rejection = check_statement(sql)
+            if rejection is not None:
+                return SQLGenerationResult(success=False, error=f"Generated SQL rejected: {rejection.message}")
+
+            if self._cache is not None:
+                self._cache.put(question, sql)
+            return SQLGenerationResult(success=True, sql=sql)
+
+        except Exception as e:
+            logger.error(f"SQL generation failed: {e}")
+            return SQLGenerationResult(success=False, error=str(e))
+
+    async def generate_async(self, question: str) -> SQLGenerationResult:
+        """Generate SQL without blocking the event loop (runs generate() on a thread)."""
+        return await asyncio.to_thread(self.generate, question)
+
+    def _extract_sql(self, content: str) -> Optional[str]:
+        """The SQL in a reply (tolerating a markdown fence), or None if unanswerable."""
+        text = content.strip()
+        match = _FENCE_RE.match(text)
+        if match:
+            text = match.group(1).strip()
+        if not text or text.upper().rstrip(".") == "UNANSWERABLE":
+            return None
+        return text
+
+    def invalidate_cache(self) -> None:
+        """Drop cached SQL (call after TABLE_SCHEMAS changes at runtime)."""
+        if self._cache is not None:
+            self._cache.invalidate(get_schema_fingerprint())
+
+
+def get_generator() -> NativeSQLGenerator:
+    """Get the singleton SQL generator."""
+    return NativeSQLGenerator.get_instance()
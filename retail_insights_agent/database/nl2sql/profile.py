@@ -0,0 +1,99 @@
+"""
+Schema and column profile context for SQL generation.
+
+The prompt describes each table once: column types, field descriptions
+and a profile of the data - the most frequent values of dimension
+columns, the range of numeric columns and the span of date columns.
+The profile comes from one SUMMARIZE pass per table and is rebuilt only
+when the data version changes, so generation never samples the tables.
+"""
+
+import logging
+import threading
+from typing import Optional
+
+from ..duckdb import get_connection, summarize_query
+from ...config import TABLE_SCHEMAS, SQL_PROFILE_TOP_K
+
+logger = logging.getLogger(__name__)
+
+_NUMERIC_TYPES = ("INT", "DECIMAL", "DOUBLE", "FLOAT", "REAL", "NUMERIC")
+_DATE_TYPES = ("DATE", "TIMESTAMP")
+
+
+def _format_value(value) -> str:
+    text = str(value)
+    return text[:-3] if text.endswith(".00") else text
+
+
+def _describe_column(column: dict, description: str) -> str:
+    """One prompt line for a profiled column."""
+    name, col_type = column["name"], column["type"]
+    line = f"- {name} {col_type}"
+    if description:
+        line += f": {description}"
+
+    facts = []
+    ranged = col_type.startswith(_NUMERIC_TYPES) or col_type.startswith(_DATE_TYPES)
+    if ranged:
+        if column["min"] is not None:
+            facts.append(f"{_format_value(column['min'])} to {_format_value(column['max'])}")
+    elif column.get("top_values"):
+        values = ", ".join(repr(v["value"]) for v in column["top_values"])
+        if column["approx_unique"] <= len(column["top_values"]):
+            facts.append(f"values {values}")
+        else:
+            facts.append(f"~{column['approx_unique']} distinct, most frequent {values}")
+    else:
+        facts.append(f"~{column['approx_unique']} distinct")
+
+    if column.get("null_percentage"):
+        facts.append(f"{column['null_percentage']:.0f}% null")
+    if facts:
+        line += f" [{'; '.join(facts)}]"
+    return line
+
+
+def _describe_table(table_name: str, schema: dict) -> str:
+    """Prompt block for one table: header line, then one line per column."""
+    profile = summarize_query(f"SELECT * FROM {table_name}", top_k=SQL_PROFILE_TOP_K)
+    descriptions = schema.get("field_descriptions", {})
+
+    header = f"Table {table_name} ({profile['row_count']:,} rows)"
+    if schema.get("description"):
+        header += f" - {schema['description']}"
+    lines = [header]
+    for column in profile["columns"]:
+        lines.append(_describe_column(column, descriptions.get(column["name"], "")))
+    return "\n".join(lines)
+
+
+def build_schema_context(conn) -> str:
+    """Describe every loaded table in TABLE_SCHEMAS for the generation prompt."""
+    tables = set(conn.get_tables())
+    blocks = [
+        _describe_table(table_name, schema)
+        for table_name, schema in TABLE_SCHEMAS.items()
+        if table_name in tables
+    ]
+    if not blocks:
+        raise RuntimeError("No tables loaded - cannot build the schema context")
+    return "\n\n".join(blocks)
+
+
+_context: Optional[str] = None
+_context_version: Optional[str] = None
+_lock = threading.Lock()
+
+
+def get_schema_context() -> str:
+    """Get the schema/profile prompt context, rebuilt whenever the data version changes."""
+    global _context, _context_version
+    conn = get_connection()
+    if _context is None or _context_version != conn.data_version:
+        with _lock:
+            if _context is None or _context_version != conn.data_version:
+                _context = build_schema_context(conn)
+                _context_version = conn.data_version
+                logger.info(f"Built schema context ({len(_context)} chars) for data version {_context_version}")
+    return _context
@@ -1,4 +1,4 @@
 """PandasAI integration for natural language to SQL conversion."""
 
 from .connector import DuckDBConnector
-from .generator import SQLGenerator, get_generator
+from .generator import SQLGenerator, get_generator, get_generator_stats
@@ -13,9 +13,10 @@ class DuckDBConnector(SQLConnector):
     """
     PandasAI connector for DuckDB tables.
 
-    Wraps a DuckDB connection to work with PandasAI's Agent.
-    Multiple connectors share the same connection ID so PandasAI
-    treats them as one datasource (required for direct_sql mode).
+    Wraps the shared DuckDBConnection to work with PandasAI's Agent;
+    queries run on its pooled cursors. Multiple connectors share the
+    same connection ID so PandasAI treats them as one datasource
+    (required for direct_sql mode).
     """
 
     _shared_connection_id = "duckdb_memory_shared"
@@ -26,9 +27,9 @@ class DuckDBConnector(SQLConnector):
         self._connection_id = self._shared_connection_id
 
         # Get schema info
-        cols = connection.execute(f"PRAGMA table_info({table_name})").fetchall()
-        self._columns = [{"name": c[1], "type": c[2]} for c in cols]
-        self._row_count = connection.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+        info = connection.get_table_info(table_name)
+        self._columns = info["columns"]
+        self._row_count = info["row_count"]
 
         # Required by SQLConnector - skip parent __init__
         self._cache_interval = 0
@@ -96,19 +97,23 @@ class DuckDBConnector(SQLConnector):
     def type(self):
         return "sql"
 
+    def _fetchdf(self, sql: str) -> pd.DataFrame:
+        with self._conn.cursor() as cursor:
+            return cursor.execute(sql).fetchdf()
+
     def head(self, n: int = 5) -> pd.DataFrame:
         """Get first n rows."""
-        df = self._conn.execute(f"SELECT * FROM {self._table_name} LIMIT {n}").fetchdf()
+        df = self._fetchdf(f"SELECT * FROM {self._table_name} LIMIT {n}")
         self._head_df = df
         return df
 
     def execute(self) -> pd.DataFrame:
         """Get full table."""
-        return self._conn.execute(f"SELECT * FROM {self._table_name}").fetchdf()
+        return self._fetchdf(f"SELECT * FROM {self._table_name}")
 
     def execute_direct_sql_query(self, sql: str) -> pd.DataFrame:
         """Execute raw SQL query."""
-        return self._conn.execute(sql).fetchdf()
+        return self._fetchdf(sql)
 
     def get_head(self) -> pd.DataFrame:
         return self.head()
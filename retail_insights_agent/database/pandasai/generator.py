@@ -2,90 +2,123 @@
 SQL generation using PandasAI.
 
 Converts natural language questions to SQL using OpenAI.
+Repeated and near-duplicate questions are served from SQLCache; the
+rest are generated concurrently on pooled, isolated PandasAI agents.
 """
 
 import re
+import asyncio
 import logging
+import threading
 from typing import Optional
-from dataclasses import dataclass
 
 from pandasai import Agent
 from pandasai.llm.openai import OpenAI
+from pandasai.helpers.openai_info import get_openai_callback
 
+from .pool import AgentPool
 from .connector import DuckDBConnector
+from ..nl2sql.cache import SQLCache
+from ..nl2sql.generator import SQLGenerationResult
 from ..duckdb import get_connection
-from ...config import OPENAI_API_KEY, OPENAI_MODEL, TABLE_SCHEMAS
+from ...tracing import span, set_attributes
+from ...replay.pandasai_llm import ReplayPandasAILLM
+from ...config import (
+    OPENAI_API_KEY,
+    OPENAI_MODEL,
+    LLM_REPLAY_MODE,
+    TABLE_SCHEMAS,
+    SQL_CACHE_ENABLED,
+    SQL_CACHE_MAX_ENTRIES,
+    SQL_CACHE_TTL_SECONDS,
+    SQL_CACHE_SIMILARITY_THRESHOLD,
+    SQL_CACHE_PATH,
+    SQL_GENERATOR_MAX_CONCURRENCY,
+    get_schema_fingerprint,
+)
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class SQLGenerationResult:
-    """Result from SQL generation."""
-
-    success: bool
-    sql: Optional[str] = None
-    error: Optional[str] = None
-
-
 class SQLGenerator:
     """
     Generates SQL from natural language using PandasAI.
 
-    Uses OpenAI to convert questions to DuckDB SQL syntax.
+    Uses OpenAI to convert questions to DuckDB SQL syntax. Thread-safe:
+    each generation borrows its own agent from an AgentPool.
     """
 
     _instance: Optional["SQLGenerator"] = None
+    _lock = threading.Lock()
 
     def __init__(self):
-        self._agent = None
-        self._connectors = []
+        self._pool: Optional[AgentPool] = None
+        self._cache: Optional[SQLCache] = None
 
     @classmethod
     def get_instance(cls) -> "SQLGenerator":
         """Get or create singleton instance."""
         if cls._instance is None:
-            cls._instance = cls()
-            cls._instance._initialize()
+            with cls._lock:
+                if cls._instance is None:
+                    instance = cls()
+                    instance._initialize()
+                    cls._instance = instance
         return cls._instance
 
     def _initialize(self) -> None:
-        """Initialize PandasAI agent with connectors."""
-        if self._agent is not None:
+        """Initialize the agent pool (with one agent built) and the SQL cache."""
+        if self._pool is not None:
             return
 
+        pool = AgentPool(self._create_agent, SQL_GENERATOR_MAX_CONCURRENCY)
+        pool.prefill(1)
+        self._pool = pool
+
+        if SQL_CACHE_ENABLED:
+            self._cache = SQLCache(
+                schema_fingerprint=get_schema_fingerprint(),
+                max_entries=SQL_CACHE_MAX_ENTRIES,
+                ttl_seconds=SQL_CACHE_TTL_SECONDS,
+                similarity_threshold=SQL_CACHE_SIMILARITY_THRESHOLD,
+                persist_path=SQL_CACHE_PATH or None,
+            )
+
+        logger.info(f"SQLGenerator initialized (up to {SQL_GENERATOR_MAX_CONCURRENCY} concurrent agents)")
+
+    def _create_agent(self) -> Agent:
+        """Create a PandasAI agent with its own connectors and LLM client."""
         conn = get_connection()
 
         # Create connector for each table
+        connectors = []
         for table_name, schema in TABLE_SCHEMAS.items():
             if table_name in conn.get_tables():
                 connector = DuckDBConnector(
-                    conn._conn,
+                    conn,
                     table_name,
                     field_descriptions=schema.get("field_descriptions", {})
                 )
-                self._connectors.append(connector)
+                connectors.append(connector)
 
-        if not self._connectors:
+        if not connectors:
             raise RuntimeError("No tables loaded - cannot initialize SQLGenerator")
 
-        # Setup OpenAI LLM
-        llm = self._create_llm()
-
-        self._agent = Agent(
-            self._connectors,
+        return Agent(
+            connectors,
             config={
-                "llm": llm,
+                "llm": self._create_llm(),
                 "verbose": False,
                 "direct_sql": True,
                 "enable_cache": False,
             },
         )
 
-        logger.info(f"SQLGenerator initialized with {len(self._connectors)} tables")
+    def _create_llm(self):
+        """Create OpenAI LLM instance for PandasAI (or its record/replay stand-in)."""
+        if LLM_REPLAY_MODE == "replay":
+            return ReplayPandasAILLM()
 
-    def _create_llm(self) -> OpenAI:
-        """Create OpenAI LLM instance for PandasAI."""
         if OPENAI_MODEL not in OpenAI._supported_chat_models:
             OpenAI._supported_chat_models.append(OPENAI_MODEL)
 
@@ -98,6 +131,8 @@ class SQLGenerator:
                 return {"model": self.model, "temperature": self.temperature}
             type(llm)._default_params = patched_params
 
+        if LLM_REPLAY_MODE == "record":
+            return ReplayPandasAILLM(inner=llm)
         return llm
 
     def generate(self, question: str) -> SQLGenerationResult:
@@ -110,12 +145,31 @@ class SQLGenerator:
         Returns:
             SQLGenerationResult with generated SQL or error
         """
+        if self._cache is not None:
+            hit = self._cache.get(question)
+            if hit:
+                logger.info(f"SQL cache hit ({hit.tier}, score={hit.score}): {question[:50]}...")
+                return SQLGenerationResult(success=True, sql=hit.sql, cache_tier=hit.tier)
+
         try:
-            self._agent.generate_code(question)
-            code = self._agent.last_code_generated
+            with self._pool.agent() as agent:
+                with span(
+                    "pandasai.generate_code", **{"gen_ai.system": "openai", "gen_ai.request.model": OPENAI_MODEL}
+                ) as current, get_openai_callback() as usage:
+                    agent.generate_code(question)
+                    set_attributes(
+                        current,
+                        **{
+                            "gen_ai.usage.input_tokens": usage.prompt_tokens,
+                            "gen_ai.usage.output_tokens": usage.completion_tokens,
+                        },
+                    )
+                code = agent.last_code_generated
             sql = self._extract_sql(code)
 
             if sql:
+                if self._cache is not None:
+                    self._cache.put(question, sql)
                 return SQLGenerationResult(success=True, sql=sql)
             else:
                 return SQLGenerationResult(success=False, error="Could not extract SQL from generated code")
@@ -124,6 +178,15 @@ class SQLGenerator:
             logger.error(f"SQL generation failed: {e}")
             return SQLGenerationResult(success=False, error=str(e))
 
+    async def generate_async(self, question: str) -> SQLGenerationResult:
+        """
+        Generate SQL without blocking the event loop.
+
+        Runs generate() on a thread; concurrent calls proceed in parallel
+        up to SQL_GENERATOR_MAX_CONCURRENCY and queue beyond that.
+        """
+        return await asyncio.to_thread(self.generate, question)
+
     def _extract_sql(self, code: str) -> Optional[str]:
         """Extract SQL query from generated Python code."""
         if not code:
@@ -144,7 +207,21 @@ class SQLGenerator:
 
         return None
 
+    def invalidate_cache(self) -> None:
+        """Drop cached SQL (call after TABLE_SCHEMAS changes at runtime)."""
+        if self._cache is not None:
+            self._cache.invalidate(get_schema_fingerprint())
+
+    def pool_stats(self) -> dict:
+        """Get agent pool concurrency and queue-wait counters."""
+        return self._pool.stats()
+
 
 def get_generator() -> SQLGenerator:
     """Get the singleton SQL generator."""
     return SQLGenerator.get_instance()
+
+
+def get_generator_stats() -> dict:
+    """Get agent pool stats of the SQL generator."""
+    return get_generator().pool_stats()
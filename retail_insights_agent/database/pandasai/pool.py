@@ -0,0 +1,98 @@
+"""
+Agent pool for concurrent SQL generation.
+
+A PandasAI Agent keeps per-call state - conversation memory and the
+last generated code - so one shared agent can't serve concurrent
+questions without crossing their SQL. AgentPool lends one agent per
+call, bounded by a maximum concurrency, builds agents on demand,
+reuses idle ones and records how long callers queued.
+"""
+
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+from pandasai import Agent
+
+logger = logging.getLogger(__name__)
+
+
+class AgentPool:
+    """Bounded pool of isolated PandasAI agents."""
+
+    def __init__(self, factory: Callable[[], Agent], max_concurrency: int):
+        self._factory = factory
+        self._max_concurrency = max(1, max_concurrency)
+        self._slots = threading.BoundedSemaphore(self._max_concurrency)
+        self._idle: list = []
+        self._lock = threading.Lock()
+
+        self._created = 0
+        self._in_use = 0
+        self._waiting = 0
+        self._acquired = 0
+        self._queued = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def prefill(self, count: int = 1) -> None:
+        """Build agents ahead of the first calls (surfaces setup errors early)."""
+        agents = [self._factory() for _ in range(min(count, self._max_concurrency))]
+        with self._lock:
+            self._created += len(agents)
+            self._idle.extend(agents)
+
+    @contextmanager
+    def agent(self) -> Iterator[Agent]:
+        """
+        Borrow an agent for the duration of a with-block.
+
+        Blocks while max_concurrency agents are in use. The agent's
+        conversation is cleared first, so earlier questions (from any
+        session) never leak into the prompt.
+        """
+        start = time.perf_counter()
+        with self._lock:
+            self._waiting += 1
+        self._slots.acquire()
+        wait = time.perf_counter() - start
+
+        with self._lock:
+            self._waiting -= 1
+            self._acquired += 1
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+            if wait >= 0.001:
+                self._queued += 1
+            agent = self._idle.pop() if self._idle else None
+            self._in_use += 1
+
+        try:
+            if agent is None:
+                agent = self._factory()
+                with self._lock:
+                    self._created += 1
+            agent.start_new_conversation()
+            yield agent
+        finally:
+            with self._lock:
+                self._in_use -= 1
+                if agent is not None:
+                    self._idle.append(agent)
+            self._slots.release()
+
+    def stats(self) -> dict:
+        """Get concurrency and queue-wait counters."""
+        with self._lock:
+            return {
+                "max_concurrency": self._max_concurrency,
+                "agents": self._created,
+                "in_use": self._in_use,
+                "waiting": self._waiting,
+                "acquired": self._acquired,
+                "queued": self._queued,
+                "avg_wait_ms": round(1000 * self._wait_total / self._acquired, 3) if self._acquired else 0.0,
+                "max_wait_ms": round(1000 * self._wait_max, 3),
+            }
@@ -0,0 +1,3 @@
+"""Template-based NL-to-SQL for common retail questions (no LLM)."""
+
+from .matcher import TemplateMatch, TemplateMatcher, get_matcher, match_question
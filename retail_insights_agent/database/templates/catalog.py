@@ -0,0 +1,151 @@
+"""
+Catalog of templated retail intents.
+
+Vocabulary that maps question phrases to SQL building blocks for the
+amazon_sales table: dimensions, metrics, rates, status filters, ranking
+direction and filler words. A question only matches a template when
+every word in it is covered by this vocabulary (or a known data value).
+"""
+
+TABLE = "amazon_sales"
+
+# Dimension -> (SQL expression, label, singular, plural, phrases)
+DIMENSIONS = {
+    "category": (
+        "category", "Category", "category", "categories",
+        ["category", "categories", "product category", "product categories",
+         "product", "products", "product type", "product types"],
+    ),
+    "state": (
+        "state", "State", "state", "states",
+        ["state", "states", "region", "regions", "ship state"],
+    ),
+    "city": (
+        "city", "City", "city", "cities",
+        ["city", "cities", "ship city"],
+    ),
+    "status": (
+        "status", "Status", "status", "statuses",
+        ["status", "statuses", "order status", "order statuses"],
+    ),
+    "fulfilment": (
+        "fulfilment", "Fulfilment", "fulfilment type", "fulfilment types",
+        ["fulfilment", "fulfillment", "fulfilment type", "fulfillment type",
+         "fulfilment method", "fulfillment method"],
+    ),
+    "size": (
+        "size", "Size", "size", "sizes",
+        ["size", "sizes", "product size", "product sizes"],
+    ),
+    "month": (
+        "DATE_TRUNC('month', order_date)", "Month", "month", "months",
+        ["month", "months", "monthly", "per month", "month over month"],
+    ),
+}
+
+# Dimensions listed chronologically instead of by metric
+TIME_DIMENSIONS = {"month"}
+
+# Metric -> (SQL aggregate, column alias, label, value kind, phrases)
+METRICS = {
+    "revenue": (
+        "SUM(amount)", "revenue", "Revenue", "currency",
+        ["revenue", "sales", "sale", "amount", "selling", "sellers", "seller",
+         "total sales", "sales amount", "gmv", "turnover"],
+    ),
+    "orders": (
+        "COUNT(*)", "orders", "Orders", "count",
+        ["orders", "order", "order count", "number of orders", "order volume",
+         "count of orders", "how many orders", "volume"],
+    ),
+    "quantity": (
+        "SUM(quantity)", "quantity", "Units", "count",
+        ["quantity", "units", "units sold", "qty", "items", "items sold",
+         "quantity sold", "quantity ordered"],
+    ),
+    "aov": (
+        "AVG(amount)", "avg_order_value", "Average Order Value", "currency",
+        ["average order value", "aov", "average order amount", "average amount",
+         "avg order value", "average sales", "average revenue"],
+    ),
+}
+
+# Metrics for which a share of total makes sense
+ADDITIVE_METRICS = {"revenue", "orders", "quantity"}
+
+# Rate -> (SQL predicate, column alias, label, phrases)
+RATES = {
+    "cancellation": (
+        "status = 'Cancelled'", "cancellation_rate_pct", "Cancellation Rate",
+        ["cancellation rate", "cancel rate", "cancellation percentage",
+         "percentage of cancelled orders", "cancelled percentage"],
+    ),
+    "return": (
+        "status ILIKE '%Returned%'", "return_rate_pct", "Return Rate",
+        ["return rate", "returns rate", "percentage of returned orders"],
+    ),
+    "delivery": (
+        "status ILIKE '%Delivered%'", "delivery_rate_pct", "Delivery Rate",
+        ["delivery rate", "delivered rate", "percentage of delivered orders"],
+    ),
+}
+
+# Status filter -> (SQL predicate, label, phrases)
+STATUS_FILTERS = {
+    "cancelled": ("status = 'Cancelled'", "cancelled", ["cancelled", "canceled", "cancellations"]),
+    "shipped": ("status ILIKE 'Shipped%'", "shipped", ["shipped"]),
+    "delivered": ("status ILIKE '%Delivered%'", "delivered", ["delivered"]),
+    "pending": ("status ILIKE 'Pending%'", "pending", ["pending"]),
+    "returned": ("status ILIKE '%Returned%'", "returned", ["returned", "returns"]),
+}
+
+# Ranking direction
+DESCENDING = ["top", "best", "highest", "most", "largest", "biggest", "leading", "maximum", "max"]
+ASCENDING = ["bottom", "worst", "lowest", "least", "fewest", "smallest", "minimum", "min"]
+
+# Words that force a single-row total
+TOTAL_WORDS = ["total", "overall", "sum", "how much", "how many"]
+
+# Words that ask for a full breakdown (no ranking)
+BREAKDOWN_WORDS = [
+    "by", "per", "each", "breakdown", "distribution", "split", "across",
+    "wise", "trend", "trends", "over time",
+]
+
+# Month filter -> month number (data spans a single year)
+MONTHS = {
+    "january": 1, "jan": 1, "february": 2, "feb": 2, "march": 3, "mar": 3,
+    "april": 4, "apr": 4, "may": 5, "june": 6, "jun": 6, "july": 7, "jul": 7,
+    "august": 8, "aug": 8, "september": 9, "sep": 9, "sept": 9,
+    "october": 10, "oct": 10, "november": 11, "nov": 11, "december": 12, "dec": 12,
+}
+
+# Month tokens that are also ordinary words or clipped forms ("which state may
+# have..."); they only count as a month right after one of MONTH_PREPOSITIONS
+AMBIGUOUS_MONTHS = {"may", "jan", "mar", "apr", "jun", "jul", "aug", "sep", "sept", "oct", "nov", "dec"}
+MONTH_PREPOSITIONS = ["in", "during"]
+
+# Low-cardinality columns whose values may appear as filters ("revenue in Kerala")
+VALUE_FILTER_COLUMNS = ["state", "category"]
+
+NUMBER_WORDS = {
+    "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10,
+    "fifteen": 15, "twenty": 20,
+}
+
+# Words that carry no meaning for template selection
+FILLER = [
+    "what", "whats", "which", "who", "is", "are", "was", "were", "the", "a", "an",
+    "of", "for", "in", "on", "to", "from", "with", "and", "me", "us", "show",
+    "give", "list", "tell", "get", "find", "display", "please", "can", "you",
+    "i", "we", "our", "do", "does", "did", "have", "has", "had", "all",
+    "data", "value", "values", "rank", "ranked", "ranking", "performing",
+    "performance", "generated", "generate", "made", "placed", "there", "it",
+    "their", "its", "see", "view", "about", "current", "at", "be", "that",
+    "this", "these", "those", "amazon sales",
+]
+
+# Default row limit for ranked questions
+DEFAULT_TOP_N = 5
+MAX_TOP_N = 50
@@ -0,0 +1,287 @@
+"""
+Template matcher for common retail questions.
+
+Recognizes parameterized intents (top-N by dimension and metric,
+breakdowns, totals, rates, with state/category/status/month filters)
+and builds DuckDB SQL directly, without an LLM. Matching is deliberately
+strict: every word must be explained by the catalog or a known data
+value, otherwise the question falls back to the full pipeline.
+"""
+
+import re
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Optional
+
+from . import catalog
+from ..duckdb import get_connection
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_MAX_PHRASE_WORDS = 5
+
+
+@dataclass
+class TemplateMatch:
+    """A recognized intent and the SQL that answers it."""
+
+    intent: str  # "top_n", "breakdown", "total" or "rate"
+    sql: str
+    dimension: Optional[str] = None
+    metrics: list = field(default_factory=list)
+    rate: Optional[str] = None
+    ascending: bool = False
+    limit: Optional[int] = None
+    filters: list = field(default_factory=list)  # Human-readable filter labels
+
+
+def _quote(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _words(text: str) -> tuple:
+    return tuple(_WORD_RE.findall(text.lower()))
+
+
+class TemplateMatcher:
+    """Maps questions onto the template catalog."""
+
+    def __init__(self, values: Optional[dict] = None):
+        # phrase (tuple of words) -> (kind, payload); first registration wins
+        self._phrases: dict = {}
+
+        for key, (_, _, _, phrases) in catalog.RATES.items():
+            self._add(phrases, "rate", key)
+        for key, (*_, phrases) in catalog.METRICS.items():
+            self._add(phrases, "metric", key)
+        for key, (*_, phrases) in catalog.DIMENSIONS.items():
+            self._add(phrases, "dimension", key)
+        for key, (predicate, label, phrases) in catalog.STATUS_FILTERS.items():
+            self._add(phrases, "filter", ("status", predicate, label))
+        for name, month in catalog.MONTHS.items():
+            kind = "ambiguous_month" if name in catalog.AMBIGUOUS_MONTHS else "filter"
+            self._add([name], kind, ("month", f"MONTH(order_date) = {month}", name.title()))
+        self._add(catalog.MONTH_PREPOSITIONS, "preposition", None)
+        self._add(catalog.DESCENDING, "direction", False)
+        self._add(catalog.ASCENDING, "direction", True)
+        self._add(catalog.TOTAL_WORDS, "total", None)
+        self._add(catalog.BREAKDOWN_WORDS, "breakdown", None)
+        for word, number in catalog.NUMBER_WORDS.items():
+            self._add([word], "number", number)
+        self._add(catalog.FILLER, "filler", None)
+
+        # Data values last, and never shadowing vocabulary ("Top" the category vs "top 5").
+        # Spellings of one phrase (KERALA / Kerala) become one filter matching all of them.
+        for column, column_values in (values or {}).items():
+            spellings: dict = {}
+            for value in sorted(column_values):
+                phrase = _words(value)
+                if phrase and phrase not in self._phrases:
+                    spellings.setdefault(phrase, []).append(value)
+            for phrase, variants in spellings.items():
+                self._phrases[phrase] = ("filter", (column, self._in_predicate(column, variants), variants[0]))
+
+    @staticmethod
+    def _in_predicate(column: str, values: list) -> str:
+        if len(values) == 1:
+            return f"{column} = {_quote(values[0])}"
+        return f"{column} IN ({', '.join(_quote(value) for value in values)})"
+
+    def _add(self, phrases: list, kind: str, payload) -> None:
+        for phrase in phrases:
+            self._phrases.setdefault(_words(phrase), (kind, payload))
+
+    def _scan(self, words: tuple) -> Optional[list]:
+        """Greedy longest-phrase scan; None if any word is unexplained."""
+        slots = []
+        i = 0
+        while i < len(words):
+            for size in range(min(_MAX_PHRASE_WORDS, len(words) - i), 0, -1):
+                entry = self._phrases.get(words[i:i + size])
+                if entry:
+                    slots.append(entry)
+                    i += size
+                    break
+            else:
+                if words[i].isdigit():
+                    slots.append(("number", int(words[i])))
+                    i += 1
+                else:
+                    return None
+        return slots
+
+    def match(self, question: str) -> Optional[TemplateMatch]:
+        """Match a question to a template, or None to use the full pipeline."""
+        words = _words(question)
+        if not words:
+            return None
+
+        slots = self._scan(words)
+        if slots is None:
+            return None
+
+        dimensions, metrics, rates, filters = [], [], [], []
+        ascending, has_direction, has_total, has_breakdown = False, False, False, False
+        limit = None
+
+        for index, (kind, payload) in enumerate(slots):
+            prev_kind = slots[index - 1][0] if index else None
+            next_kind = slots[index + 1][0] if index + 1 < len(slots) else None
+            if kind == "ambiguous_month":
+                # "in may" is a month, "which state may have" is not
+                if prev_kind != "preposition":
+                    return None
+                filters.append(payload)
+            elif kind == "dimension":
+                dimensions.append(payload)
+            elif kind == "metric" and payload not in metrics:
+                metrics.append(payload)
+            elif kind == "rate":
+                rates.append(payload)
+            elif kind == "filter":
+                filters.append(payload)
+            elif kind == "direction":
+                has_direction, ascending = True, payload
+            elif kind == "total":
+                has_total = True
+            elif kind == "breakdown":
+                # "revenue per order" is a ratio of two metrics, not a breakdown
+                if prev_kind == "metric" and next_kind == "metric":
+                    return None
+                has_breakdown = True
+            elif kind == "number":
+                # Only "top 5 ..." / "5 states ..." - anything else (years, ids) is unexplained
+                if prev_kind != "direction" and next_kind != "dimension":
+                    return None
+                if not 1 <= payload <= catalog.MAX_TOP_N:
+                    return None
+                limit = payload
+
+        if len(set(dimensions)) > 1 or len(rates) > 1 or (rates and metrics):
+            return None
+        filter_columns = [column for column, _, _ in filters]
+        if len(set(filter_columns)) != len(filter_columns):
+            return None  # "Kerala and Karnataka" would need OR - leave it to the LLM
+        dimension = dimensions[0] if dimensions else None
+
+        if dimension is None:
+            if has_direction or has_breakdown or limit is not None:
+                return None
+            if rates:
+                return self._build(intent="rate", rate=rates[0], filters=filters)
+            if not metrics:
+                return None
+            return self._build(intent="total", metrics=metrics, filters=filters)
+
+        if has_total and not (has_breakdown or has_direction):
+            return None  # "total number of cities" etc. - not a grouped question
+
+        if rates:
+            return self._build(
+                intent="rate", rate=rates[0], dimension=dimension, filters=filters,
+                ascending=ascending, limit=limit if (has_direction or limit) else None,
+            )
+
+        metrics = metrics or ["orders"]
+        ranked = has_direction or limit is not None
+        if ranked:
+            return self._build(
+                intent="top_n", dimension=dimension, metrics=metrics, filters=filters,
+                ascending=ascending, limit=limit or catalog.DEFAULT_TOP_N,
+            )
+        return self._build(intent="breakdown", dimension=dimension, metrics=metrics, filters=filters)
+
+    def _build(
+        self,
+        intent: str,
+        dimension: Optional[str] = None,
+        metrics: Optional[list] = None,
+        rate: Optional[str] = None,
+        filters: Optional[list] = None,
+        ascending: bool = False,
+        limit: Optional[int] = None,
+    ) -> TemplateMatch:
+        """Build SQL for a recognized intent."""
+        metrics = metrics or []
+        filters = filters or []
+        select, where = [], [predicate for _, predicate, _ in filters]
+
+        if dimension:
+            dim_expr = catalog.DIMENSIONS[dimension][0]
+            select.append(f"{dim_expr} AS {dimension}")
+            where.append(f"{dim_expr} IS NOT NULL")
+
+        if rate:
+            predicate, alias, _, _ = catalog.RATES[rate]
+            select.append(f"ROUND(100.0 * COUNT(*) FILTER (WHERE {predicate}) / COUNT(*), 2) AS {alias}")
+            select.append("COUNT(*) AS orders")
+        for metric in metrics:
+            expr, alias, *_ = catalog.METRICS[metric]
+            select.append(f"{expr} AS {alias}")
+
+        if dimension and len(metrics) == 1 and metrics[0] in catalog.ADDITIVE_METRICS:
+            expr = catalog.METRICS[metrics[0]][0]
+            select.append(f"ROUND(100.0 * {expr} / SUM({expr}) OVER (), 1) AS share_pct")
+
+        sql = f"SELECT {', '.join(select)} FROM {catalog.TABLE}"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+
+        if dimension:
+            sql += " GROUP BY 1"
+            if intent == "breakdown" and dimension in catalog.TIME_DIMENSIONS:
+                sql += " ORDER BY 1"
+            else:
+                sql += f" ORDER BY 2 {'ASC' if ascending else 'DESC'} NULLS LAST"
+            if limit:
+                sql += f" LIMIT {limit}"
+
+        return TemplateMatch(
+            intent=intent,
+            sql=sql,
+            dimension=dimension,
+            metrics=metrics,
+            rate=rate,
+            ascending=ascending,
+            limit=limit,
+            filters=[label for _, _, label in filters],
+        )
+
+
+_matcher: Optional[TemplateMatcher] = None
+_matcher_version: Optional[str] = None
+_lock = threading.Lock()
+
+
+def _load_values(conn) -> dict:
+    """Distinct values of the filterable low-cardinality columns."""
+    values = {}
+    tables = conn.get_tables()
+    if catalog.TABLE not in tables:
+        return values
+    with conn.cursor() as cursor:
+        for column in catalog.VALUE_FILTER_COLUMNS:
+            rows = cursor.execute(
+                f"SELECT DISTINCT CAST({column} AS VARCHAR) FROM {catalog.TABLE} WHERE {column} IS NOT NULL"
+            ).fetchall()
+            values[column] = [row[0] for row in rows]
+    return values
+
+
+def get_matcher() -> TemplateMatcher:
+    """Get the shared matcher, rebuilt whenever the data version changes."""
+    global _matcher, _matcher_version
+    conn = get_connection()
+    if _matcher is None or _matcher_version != conn.data_version:
+        with _lock:
+            if _matcher is None or _matcher_version != conn.data_version:
+                _matcher = TemplateMatcher(_load_values(conn))
+                _matcher_version = conn.data_version
+    return _matcher
+
+
+def match_question(question: str) -> Optional[TemplateMatch]:
+    """Match a question against the template catalog."""
+    return get_matcher().match(question)
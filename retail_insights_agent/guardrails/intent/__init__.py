@@ -0,0 +1,3 @@
+"""Local intent classifier - first-stage guardrail before the LLM rail."""
+
+from .classifier import IntentClassifier, IntentPrediction, get_classifier
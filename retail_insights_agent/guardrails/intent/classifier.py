@@ -0,0 +1,157 @@
+"""
+Hashed n-gram intent classifier.
+
+A small logistic-regression model over hashed word and character
+n-grams, trained in pure Python from the bundled examples on first use
+(a few milliseconds). It scores how likely a query is an in-scope retail
+analytics question:
+- score >= allow threshold: allow without calling the LLM rail
+- score <= block threshold: block without calling the LLM rail
+- otherwise: uncertain, escalate to the LLM rail
+
+Queries containing escalation terms (instructions, system prompt,
+data-modifying verbs, ...) are never allowed locally, and neither are
+compound queries (several sentences or clauses) or queries whose words
+are mostly outside the training vocabulary - retail n-grams in one
+clause must not vouch for a harmful request in another.
+"""
+
+import re
+import math
+import random
+import logging
+import threading
+import zlib
+from dataclasses import dataclass
+from typing import Optional
+
+from .training_data import IN_SCOPE, OUT_OF_SCOPE
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+# Words that must always go to the LLM rail rather than be allowed locally
+_ESCALATE_TERMS = {
+    "ignore", "forget", "pretend", "roleplay", "act", "bypass", "instruction",
+    "instructions", "prompt", "system", "rules", "password", "secret", "hack",
+    "drop", "delete", "update", "insert", "truncate", "alter", "modify",
+    "change", "remove", "email", "letter", "write", "draft", "compose", "send",
+}
+
+# Sentence breaks ("...? Show ...") and clause joiners ("... - also ...", "..., then ...")
+_CLAUSE_BREAK_RE = re.compile(
+    r"[.?!;:]+\s+\S"
+    r"|\s[-\u2013\u2014]+\s"
+    r"|(?:,\s*|\b)(?:also|then|plus|additionally|afterwards|but)\b"
+    r"|,\s*and\b"
+)
+
+_N_FEATURES = 1 << 18
+
+
+@dataclass
+class IntentPrediction:
+    """Classifier decision for a query."""
+
+    decision: str  # "allow", "block" or "escalate"
+    score: float   # Probability the query is in scope
+
+
+def _features(text: str) -> dict:
+    """Hashed word unigrams/bigrams and character trigrams (L2-normalized)."""
+    words = _WORD_RE.findall(text.lower())
+    grams = [f"w:{w}" for w in words]
+    grams += [f"b:{a} {b}" for a, b in zip(words, words[1:])]
+    padded = f" {' '.join(words)} "
+    grams += [f"c:{padded[i:i + 3]}" for i in range(len(padded) - 2)]
+
+    counts = {}
+    for gram in grams:
+        index = zlib.crc32(gram.encode()) % _N_FEATURES
+        counts[index] = counts.get(index, 0.0) + 1.0
+    norm = math.sqrt(sum(v * v for v in counts.values())) or 1.0
+    return {k: v / norm for k, v in counts.items()}
+
+
+class IntentClassifier:
+    """Binary in-scope/out-of-scope classifier with a confidence band."""
+
+    def __init__(
+        self,
+        allow_threshold: float = 0.85,
+        block_threshold: float = 0.15,
+        epochs: int = 40,
+        learning_rate: float = 0.5,
+        l2: float = 1e-4,
+        seed: int = 7,
+        max_unknown_share: float = 0.35,
+    ):
+        self._allow_threshold = allow_threshold
+        self._block_threshold = block_threshold
+        self._max_unknown_share = max_unknown_share
+        self._weights: dict = {}
+        self._bias = 0.0
+        self._vocabulary = {w for q in IN_SCOPE for w in _WORD_RE.findall(q.lower())}
+        self._train(epochs, learning_rate, l2, seed)
+
+    def _train(self, epochs: int, learning_rate: float, l2: float, seed: int) -> None:
+        """Fit logistic regression with plain SGD on the bundled examples."""
+        samples = [(_features(q), 1.0) for q in IN_SCOPE]
+        samples += [(_features(q), 0.0) for q in OUT_OF_SCOPE]
+        rng = random.Random(seed)
+
+        for _ in range(epochs):
+            rng.shuffle(samples)
+            for features, label in samples:
+                error = self._score(features) - label
+                for index, value in features.items():
+                    weight = self._weights.get(index, 0.0)
+                    self._weights[index] = weight - learning_rate * (error * value + l2 * weight)
+                self._bias -= learning_rate * error
+
+        logger.info(f"Intent classifier trained on {len(samples)} examples")
+
+    def _score(self, features: dict) -> float:
+        z = self._bias + sum(self._weights.get(i, 0.0) * v for i, v in features.items())
+        return 1.0 / (1.0 + math.exp(-max(min(z, 30.0), -30.0)))
+
+    def _unknown_share(self, words: list) -> float:
+        """Share of (non-numeric) words never seen in an in-scope example."""
+        words = [w for w in words if not w.isdigit()]
+        if not words:
+            return 0.0
+        return sum(w not in self._vocabulary for w in words) / len(words)
+
+    def predict(self, query: str) -> IntentPrediction:
+        """Classify a query as allow, block or escalate."""
+        score = self._score(_features(query))
+
+        if score >= self._allow_threshold:
+            words = _WORD_RE.findall(query.lower())
+            if (
+                set(words) & _ESCALATE_TERMS
+                or _CLAUSE_BREAK_RE.search(query.strip())
+                or self._unknown_share(words) > self._max_unknown_share
+            ):
+                return IntentPrediction(decision="escalate", score=score)
+            return IntentPrediction(decision="allow", score=score)
+
+        if score <= self._block_threshold:
+            return IntentPrediction(decision="block", score=score)
+
+        return IntentPrediction(decision="escalate", score=score)
+
+
+_classifier: Optional[IntentClassifier] = None
+_lock = threading.Lock()
+
+
+def get_classifier(allow_threshold: float = 0.85, block_threshold: float = 0.15) -> IntentClassifier:
+    """Get the shared classifier (trained on first use)."""
+    global _classifier
+    if _classifier is None:
+        with _lock:
+            if _classifier is None:
+                _classifier = IntentClassifier(allow_threshold, block_threshold)
+    return _classifier
@@ -1,3 +1,4 @@
 """NVIDIA NeMo Guardrails for input validation."""
 
-from .validator import InputValidator, ValidationResult, validate_query
+from .validator import InputValidator, ValidationResult, validate_query, validate_query_async, get_validator
+from .rails import RailsPool
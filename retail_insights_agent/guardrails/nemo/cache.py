@@ -0,0 +1,134 @@
+"""
+Guardrail verdict cache.
+
+Stores allow/block decisions from the LLM rail keyed by a normalized
+query (case-folded, whitespace-collapsed, numbers abstracted), so
+"Top 5 states by sales" and "top 10 states  by sales" share one verdict.
+Entries are evicted LRU and by TTL, and can be persisted to a JSON file.
+Persisted verdicts are discarded when the rails config changes.
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple
+
+from .config import RAILS_YAML, RAILS_COLANG, BLOCK_PATTERNS
+
+logger = logging.getLogger(__name__)
+
+_NUMBER_RE = re.compile(r"\d+(?:[.,]\d+)*")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Case-fold, collapse whitespace and abstract numbers."""
+    text = _NUMBER_RE.sub("<n>", query.casefold())
+    return _SPACE_RE.sub(" ", text).strip().rstrip("?.!").strip()
+
+
+def rails_fingerprint() -> str:
+    """Hash of everything that affects a verdict."""
+    payload = json.dumps([RAILS_YAML, RAILS_COLANG, BLOCK_PATTERNS])
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+class VerdictCache:
+    """Thread-safe TTL + LRU cache of (allowed, reason) verdicts."""
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        ttl_seconds: float = 86400,
+        persist_path: Optional[str] = None,
+    ):
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._persist_path = Path(persist_path) if persist_path else None
+        self._fingerprint = rails_fingerprint()
+        # key -> (allowed, reason, created_at)
+        self._entries: "OrderedDict[str, Tuple[bool, Optional[str], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        if self._persist_path:
+            self._load()
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self._ttl > 0 and now - created_at > self._ttl
+
+    def get(self, query: str) -> Optional[Tuple[bool, Optional[str]]]:
+        """Get a cached (allowed, reason) verdict, or None."""
+        key = normalize_query(query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._expired(entry[2], time.time()):
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0], entry[1]
+
+    def put(self, query: str, allowed: bool, reason: Optional[str] = None) -> None:
+        """Store a verdict."""
+        key = normalize_query(query)
+        if not key:
+            return
+        with self._lock:
+            self._entries[key] = (allowed, reason, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+        if self._persist_path:
+            self._save()
+
+    def stats(self) -> dict:
+        """Get hit/miss counters and size."""
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def _load(self) -> None:
+        """Load persisted verdicts, discarding them if the rails config changed."""
+        try:
+            payload = json.loads(self._persist_path.read_text())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable verdict cache file: {e}")
+            return
+
+        if payload.get("rails_fingerprint") != self._fingerprint:
+            logger.info("Rails config changed - discarding persisted verdict cache")
+            return
+
+        now = time.time()
+        for key, allowed, reason, created_at in payload.get("entries", []):
+            if not self._expired(created_at, now):
+                self._entries[key] = (allowed, reason, created_at)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        logger.info(f"Loaded {len(self._entries)} cached guardrail verdicts")
+
+    def _save(self) -> None:
+        """Write verdicts to disk atomically (best effort)."""
+        with self._lock:
+            payload = {
+                "rails_fingerprint": self._fingerprint,
+                "entries": [[key, *entry] for key, entry in self._entries.items()],
+            }
+            try:
+                self._persist_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self._persist_path.with_name(f"{self._persist_path.name}.{os.getpid()}.tmp")
+                tmp_path.write_text(json.dumps(payload))
+                os.replace(tmp_path, self._persist_path)
+            except OSError as e:
+                logger.warning(f"Could not persist verdict cache: {e}")
@@ -0,0 +1,117 @@
+"""
+Shared NeMo Guardrails runtime.
+
+The rails config is parsed once per process. LLMRails instances (and
+the LLM/HTTP clients inside them) are bound to an event loop, so one
+instance is kept per loop and reused for every check on that loop.
+Synchronous callers share a single long-lived background loop.
+"""
+
+import asyncio
+import logging
+import threading
+import weakref
+from typing import Optional
+
+from nemoguardrails import LLMRails, RailsConfig
+
+from .config import RAILS_YAML, RAILS_COLANG
+from ...replay.nemo_llm import ReplayChatModel
+from ...config import LLM_REPLAY_MODE
+
+logger = logging.getLogger(__name__)
+
+
+class RailsPool:
+    """
+    Process-wide, lazily initialized pool of LLMRails instances.
+
+    Thread-safe: the config is compiled once under a lock, and each
+    event loop gets its own LLMRails so async clients are never shared
+    across loops.
+    """
+
+    _config: Optional[RailsConfig] = None
+    _rails: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, LLMRails]" = weakref.WeakKeyDictionary()
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_config(cls) -> RailsConfig:
+        """Get the compiled rails config (parsed on first use)."""
+        if cls._config is None:
+            with cls._lock:
+                if cls._config is None:
+                    logger.info("Compiling NeMo Guardrails config")
+                    cls._config = RailsConfig.from_content(
+                        colang_content=RAILS_COLANG,
+                        yaml_content=RAILS_YAML,
+                    )
+        return cls._config
+
+    @classmethod
+    def get(cls, loop: Optional[asyncio.AbstractEventLoop] = None) -> LLMRails:
+        """Get the LLMRails instance for an event loop (current loop by default)."""
+        loop = loop or asyncio.get_running_loop()
+        rails = cls._rails.get(loop)
+        if rails is None:
+            config = cls.get_config()
+            with cls._lock:
+                rails = cls._rails.get(loop)
+                if rails is None:
+                    logger.info("Creating NeMo LLMRails instance")
+                    rails = cls._create_rails(config)
+                    cls._rails[loop] = rails
+        return rails
+
+    @staticmethod
+    def _create_rails(config: RailsConfig) -> LLMRails:
+        """Build LLMRails, with the record/replay stand-in as main LLM if enabled."""
+        if LLM_REPLAY_MODE == "replay":
+            # No inner model: NeMo would need an OpenAI key just to build one
+            return LLMRails(config, llm=ReplayChatModel())
+
+        rails = LLMRails(config)
+        if LLM_REPLAY_MODE == "record":
+            rails.update_llm(ReplayChatModel(inner=rails.llm))
+        return rails
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drop the compiled config and all instances (for testing)."""
+        with cls._lock:
+            cls._config = None
+            cls._rails = weakref.WeakKeyDictionary()
+
+
+class BackgroundLoop:
+    """
+    A single daemon thread running an event loop for sync callers.
+
+    Replaces asyncio.run() per call, which created a fresh loop (and
+    fresh HTTP connections) for every guardrail check.
+    """
+
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls) -> asyncio.AbstractEventLoop:
+        """Get the background loop, starting its thread on first use."""
+        if cls._loop is None:
+            with cls._lock:
+                if cls._loop is None:
+                    loop = asyncio.new_event_loop()
+                    thread = threading.Thread(
+                        target=loop.run_forever,
+                        name="guardrails-loop",
+                        daemon=True,
+                    )
+                    thread.start()
+                    cls._loop = loop
+        return cls._loop
+
+    @classmethod
+    def run(cls, coro, timeout: Optional[float] = None):
+        """Run a coroutine on the background loop and wait for its result."""
+        future = asyncio.run_coroutine_threadsafe(coro, cls.get())
+        return future.result(timeout=timeout)
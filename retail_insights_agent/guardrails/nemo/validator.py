@@ -2,21 +2,44 @@
 Input validation using NVIDIA NeMo Guardrails.
 
 Validates user queries before processing by the agent.
+Checks run cheapest first: regex patterns, the local intent classifier,
+cached LLM verdicts, and finally the NeMo LLM rail. The rails config and
+LLMRails instances are shared process-wide (see rails.py).
 """
 
 import re
-import logging
 import asyncio
+import logging
+import threading
 from typing import Optional
 from dataclasses import dataclass
 
-from nemoguardrails import LLMRails, RailsConfig
-
-from .config import RAILS_YAML, RAILS_COLANG, BLOCK_PATTERNS
-from ...config import GUARDRAILS_BLOCKED_MESSAGE
+from nemoguardrails import LLMRails
+
+from .cache import VerdictCache
+from ..intent import IntentClassifier, get_classifier
+from .config import BLOCK_PATTERNS
+from .rails import RailsPool, BackgroundLoop
+from ...tracing import span, set_attributes
+from ...config import (
+    GUARDRAILS_BLOCKED_MESSAGE,
+    GUARDRAILS_CACHE_ENABLED,
+    GUARDRAILS_CACHE_MAX_ENTRIES,
+    GUARDRAILS_CACHE_TTL_SECONDS,
+    GUARDRAILS_CACHE_PATH,
+    INTENT_CLASSIFIER_ENABLED,
+    INTENT_ALLOW_THRESHOLD,
+    INTENT_BLOCK_THRESHOLD,
+)
 
 logger = logging.getLogger(__name__)
 
+# Compiled once per process
+_COMPILED_PATTERNS = [re.compile(p) for p in BLOCK_PATTERNS]
+
+# Seconds a check waits for the LLM rail before failing open
+_CHECK_TIMEOUT = 30
+
 
 @dataclass
 class ValidationResult:
@@ -38,11 +61,18 @@ class InputValidator:
     """
     Validates user input using NeMo Guardrails.
 
-    Combines fast regex pattern matching with LLM-based policy checking.
+    Combines fast regex pattern matching and a local intent classifier
+    with LLM-based policy checking for uncertain queries.
     """
 
-    def __init__(self):
-        self._patterns = [re.compile(p) for p in BLOCK_PATTERNS]
+    def __init__(
+        self,
+        cache: Optional[VerdictCache] = None,
+        classifier: Optional[IntentClassifier] = None,
+    ):
+        self._patterns = _COMPILED_PATTERNS
+        self._cache = cache
+        self._classifier = classifier
 
     def _quick_pattern_check(self, query: str) -> Optional[str]:
         """Fast pattern matching before LLM call."""
@@ -51,14 +81,9 @@ class InputValidator:
                 return f"Blocked by pattern: {pattern.pattern}"
         return None
 
-    def _create_rails(self) -> LLMRails:
-        """Create NeMo Guardrails instance."""
-        return LLMRails(
-            RailsConfig.from_content(
-                colang_content=RAILS_COLANG,
-                yaml_content=RAILS_YAML,
-            )
-        )
+    def _get_rails(self) -> LLMRails:
+        """Get the shared NeMo Guardrails instance for the current loop."""
+        return RailsPool.get()
 
     async def check_async(self, query: str) -> ValidationResult:
         """
@@ -80,13 +105,56 @@ class InputValidator:
                 reason=pattern_match,
             )
 
+        # Local classifier - only the uncertain band escalates to the LLM
+        if self._classifier is not None:
+            prediction = self._classifier.predict(query)
+            if prediction.decision == "allow":
+                return ValidationResult(
+                    allowed=True,
+                    message=query,
+                    reason=f"Allowed by local classifier (score={prediction.score:.2f})",
+                )
+            if prediction.decision == "block":
+                logger.info(f"Query blocked by local classifier: {query[:50]}...")
+                return ValidationResult(
+                    allowed=False,
+                    message=GUARDRAILS_BLOCKED_MESSAGE,
+                    reason=f"Blocked by local classifier (score={prediction.score:.2f})",
+                )
+
+        # Cached LLM verdict
+        if self._cache is not None:
+            verdict = self._cache.get(query)
+            if verdict is not None:
+                allowed, reason = verdict
+                logger.info(f"Guardrail cache hit ({'allowed' if allowed else 'blocked'}): {query[:50]}...")
+                return ValidationResult(
+                    allowed=allowed,
+                    message=query if allowed else GUARDRAILS_BLOCKED_MESSAGE,
+                    reason=f"{reason} (cache hit)" if reason else "Cache hit",
+                )
+
         # LLM-based check
         try:
-            rails = self._create_rails()
-            result = await rails.generate_async(
-                messages=[{"role": "user", "content": query}],
-                options={"rails": ["input"]}
-            )
+            rails = self._get_rails()
+            with span("nemo.input_rail", **{"gen_ai.system": "openai"}) as current:
+                result = await asyncio.wait_for(
+                    rails.generate_async(
+                        messages=[{"role": "user", "content": query}],
+                        options={"rails": ["input"], "log": {"llm_calls": True}}
+                    ),
+                    timeout=_CHECK_TIMEOUT,
+                )
+                stats = result.log.stats if result.log else None
+                if stats is not None:
+                    set_attributes(
+                        current,
+                        **{
+                            "retail.llm_calls": stats.llm_calls_count,
+                            "gen_ai.usage.input_tokens": stats.llm_calls_total_prompt_tokens,
+                            "gen_ai.usage.output_tokens": stats.llm_calls_total_completion_tokens,
+                        },
+                    )
 
             # Check if blocked
             response = ""
@@ -95,6 +163,9 @@ class InputValidator:
 
             is_blocked = response.startswith("I can only help with")
 
+            if self._cache is not None:
+                self._cache.put(query, not is_blocked, "Policy violation" if is_blocked else None)
+
             if is_blocked:
                 logger.info(f"Query blocked by LLM: {query[:50]}...")
                 return ValidationResult(
@@ -118,26 +189,49 @@ class InputValidator:
         """
         Validate query synchronously.
 
+        Fallback for sync callers only - async code should await
+        check_async() directly on its own loop.
+
         Args:
             query: User's input query
 
         Returns:
             ValidationResult with allowed status and message
         """
-        try:
-            loop = asyncio.get_running_loop()
-            # In async context - use thread
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, self.check_async(query))
-                return future.result(timeout=30)
-        except RuntimeError:
-            # No running loop
-            return asyncio.run(self.check_async(query))
-
-
-# Module-level convenience function
+        # Runs on the shared background loop, so rails and HTTP clients stay warm
+        return BackgroundLoop.run(self.check_async(query), timeout=_CHECK_TIMEOUT + 5)
+
+
+_default_validator: Optional[InputValidator] = None
+_default_lock = threading.Lock()
+
+
+def get_validator() -> InputValidator:
+    """Get the shared default validator."""
+    global _default_validator
+    if _default_validator is None:
+        with _default_lock:
+            if _default_validator is None:
+                cache = None
+                if GUARDRAILS_CACHE_ENABLED:
+                    cache = VerdictCache(
+                        max_entries=GUARDRAILS_CACHE_MAX_ENTRIES,
+                        ttl_seconds=GUARDRAILS_CACHE_TTL_SECONDS,
+                        persist_path=GUARDRAILS_CACHE_PATH or None,
+                    )
+                classifier = None
+                if INTENT_CLASSIFIER_ENABLED:
+                    classifier = get_classifier(INTENT_ALLOW_THRESHOLD, INTENT_BLOCK_THRESHOLD)
+                _default_validator = InputValidator(cache=cache, classifier=classifier)
+    return _default_validator
+
+
+# Module-level convenience functions
 def validate_query(query: str) -> ValidationResult:
     """Validate a query using the default validator."""
-    validator = InputValidator()
-    return validator.check(query)
+    return get_validator().check(query)
+
+
+async def validate_query_async(query: str) -> ValidationResult:
+    """Validate a query on the caller's event loop using the default validator."""
+    return await get_validator().check_async(query)
@@ -0,0 +1,167 @@
+"""
+Liveness, readiness and background warm-up.
+
+Importing the package builds nothing heavy: the DuckDB tables, the
+template matcher, the SQL generator and the NeMo guardrails
+are each built on first use. start_warmup() builds them ahead of time
+on a daemon thread, and readiness() reports each component's progress,
+so a probe can tell "process is up" (liveness) from "able to answer
+without a cold start" (readiness).
+"""
+
+import time
+import logging
+import threading
+from typing import Optional
+
+from .config import FAST_PATH_ENABLED
+
+logger = logging.getLogger(__name__)
+
+_started_at = time.time()
+
+# Component states
+PENDING = "pending"
+BUILDING = "building"
+READY = "ready"
+SKIPPED = "skipped"
+FAILED = "failed"
+
+
+def _load_data() -> bool:
+    from .database.duckdb import get_connection
+
+    get_connection()
+    return True
+
+
+def _build_templates() -> bool:
+    if not FAST_PATH_ENABLED:
+        return False
+    from .database.templates import get_matcher
+
+    get_matcher()
+    return True
+
+
+def _build_sql_generator() -> bool:
+    from .tools.sql_generator import get_sql_generator
+
+    get_sql_generator()
+    return True
+
+
+def _build_guardrails() -> bool:
+    from .guardrails.nemo import RailsPool, get_validator
+
+    get_validator()
+    RailsPool.get_config()
+    return True
+
+
+# Built in order - the matcher and generator read from the loaded tables
+_COMPONENTS = [
+    ("duckdb", _load_data),
+    ("templates", _build_templates),
+    ("sql_generator", _build_sql_generator),
+    ("guardrails", _build_guardrails),
+]
+
+
+class Warmup:
+    """Builds the components once, in order, on a daemon thread."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._status = {name: {"state": PENDING} for name, _ in _COMPONENTS}
+
+    def start(self) -> bool:
+        """
+        Start building components that aren't ready yet.
+
+        Components that failed are retried by the next call.
+
+        Returns:
+            True if a warm-up thread was started
+        """
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return False
+            pending = [(name, build) for name, build in _COMPONENTS if self._status[name]["state"] not in (READY, SKIPPED)]
+            if not pending:
+                return False
+            self._thread = threading.Thread(target=self._run, args=(pending,), name="warmup", daemon=True)
+            self._thread.start()
+            return True
+
+    def _set(self, name: str, **status) -> None:
+        with self._lock:
+            self._status[name] = status
+
+    def _run(self, components: list) -> None:
+        print("[Startup] Warming up in the background...")
+        start = time.perf_counter()
+        for name, build in components:
+            self._set(name, state=BUILDING)
+            began = time.perf_counter()
+            try:
+                state = READY if build() else SKIPPED
+                self._set(name, state=state, seconds=round(time.perf_counter() - began, 3))
+            except Exception as e:
+                logger.error(f"Warm-up of {name} failed: {e}")
+                self._set(name, state=FAILED, seconds=round(time.perf_counter() - began, 3), error=str(e))
+
+        failed = [name for name, status in self.status().items() if status["state"] == FAILED]
+        elapsed = time.perf_counter() - start
+        if failed:
+            print(f"[Startup] Warm-up finished in {elapsed:.1f}s with failures: {', '.join(failed)}")
+        else:
+            print(f"[Startup] Ready in {elapsed:.1f}s")
+        logger.info(f"Warm-up finished in {elapsed:.1f}s (failed: {failed or 'none'})")
+
+    def status(self) -> dict:
+        """Get the state (and build seconds / error) of each component."""
+        with self._lock:
+            return {name: dict(status) for name, status in self._status.items()}
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for a running warm-up; returns True if none is running afterwards."""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        return thread is None or not thread.is_alive()
+
+
+_warmup = Warmup()
+
+
+def start_warmup() -> bool:
+    """Build data, SQL generator and guardrails in the background (idempotent)."""
+    return _warmup.start()
+
+
+def wait_for_warmup(timeout: Optional[float] = None) -> bool:
+    """Block until the running warm-up has finished (or timeout seconds passed)."""
+    return _warmup.wait(timeout)
+
+
+def liveness() -> dict:
+    """The process is up and serving; says nothing about warm-up."""
+    return {"status": "alive", "uptime_s": round(time.time() - _started_at, 1)}
+
+
+def readiness() -> dict:
+    """
+    Whether every component is built.
+
+    Starts the warm-up if it hasn't run (or retries failed components),
+    so a readiness probe alone brings the service up.
+
+    Returns:
+        Dict with status ("ready" / "not_ready") and per-component state
+    """
+    _warmup.start()
+    components = _warmup.status()
+    ready = all(status["state"] in (READY, SKIPPED) for status in components.values())
+    return {"status": "ready" if ready else "not_ready", "components": components}
@@ -0,0 +1,11 @@
+"""
+Record/replay stand-ins for the LLM clients (LLM_REPLAY_MODE).
+
+Record real Gemini, OpenAI (SQL generation) and NeMo responses once,
+then replay them with configurable latency to profile and load-test the
+pipeline offline. The SQL generator and NeMo adapters are imported where
+those clients are built.
+"""
+
+from .store import FixtureStore, FixtureMissing, request_key, replay_delay
+from .adk_model import ReplayLlm, agent_model
@@ -0,0 +1,97 @@
+"""
+Record/replay stand-in for the Gemini models behind the ADK agents.
+
+ReplayLlm is an ADK BaseLlm. In record mode it forwards each request to
+the real model (resolved through ADK's LLMRegistry) and saves the
+responses; in replay mode it serves the saved responses without any
+network call. Requests are keyed on model, system instruction, tool
+names and contents - minus the random function call ids ADK assigns.
+"""
+
+import time
+import logging
+from typing import AsyncGenerator, Optional
+
+from google.adk.models import BaseLlm, LlmRequest, LlmResponse, LLMRegistry
+
+from .store import FixtureStore, request_key
+from ..config import LLM_REPLAY_MODE
+
+logger = logging.getLogger(__name__)
+
+_store = FixtureStore("gemini")
+
+# Keys ADK fills with a fresh uuid per call
+_VOLATILE_KEYS = {"id"}
+
+
+def _strip_ids(value):
+    if isinstance(value, dict):
+        return {k: _strip_ids(v) for k, v in value.items() if k not in _VOLATILE_KEYS}
+    if isinstance(value, list):
+        return [_strip_ids(v) for v in value]
+    return value
+
+
+def _request_payload(llm_request: LlmRequest) -> dict:
+    instruction = llm_request.config.system_instruction if llm_request.config else None
+    if instruction is not None and not isinstance(instruction, str):
+        instruction = instruction.model_dump(mode="json", exclude_none=True)
+    return {
+        "model": llm_request.model,
+        "system_instruction": instruction,
+        "tools": sorted(llm_request.tools_dict),
+        "contents": [_strip_ids(c.model_dump(mode="json", exclude_none=True)) for c in llm_request.contents],
+    }
+
+
+def _preview(llm_request: LlmRequest) -> str:
+    for content in reversed(llm_request.contents):
+        for part in content.parts or []:
+            if part.text:
+                return part.text
+    return ""
+
+
+class ReplayLlm(BaseLlm):
+    """Gemini stand-in serving recorded responses (or recording live ones)."""
+
+    record: bool = False
+    inner: Optional[BaseLlm] = None
+
+    def _live_model(self) -> BaseLlm:
+        if self.inner is None:
+            self.inner = LLMRegistry.new_llm(self.model)
+        return self.inner
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        key = request_key(_request_payload(llm_request))
+        preview = _preview(llm_request)
+
+        if not self.record:
+            entry = await _store.replay_async(key, preview)
+            for response in entry["response"]:
+                yield LlmResponse.model_validate(response)
+            return
+
+        start = time.perf_counter()
+        responses = []
+        async for response in self._live_model().generate_content_async(llm_request, stream):
+            responses.append(_strip_ids(response.model_dump(mode="json", exclude_none=True)))
+            yield response
+        _store.put(key, responses, 1000 * (time.perf_counter() - start), preview)
+        logger.debug(f"Recorded {self.model} response {key[:12]}")
+
+
+def agent_model(model: str):
+    """
+    Model for an ADK LlmAgent: the name itself, or a ReplayLlm when recording or replaying.
+
+    Args:
+        model: Gemini model name
+    """
+    if LLM_REPLAY_MODE not in ("record", "replay"):
+        return model
+    return ReplayLlm(model=model, record=LLM_REPLAY_MODE == "record")
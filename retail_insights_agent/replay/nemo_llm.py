@@ -0,0 +1,74 @@
+"""
+Record/replay stand-in for the NeMo Guardrails main LLM.
+
+ReplayChatModel is a LangChain chat model handed to LLMRails. In record
+mode it wraps the model NeMo built from the rails config and saves each
+completion; in replay mode it has no inner model and serves saved
+completions (with their token usage) by prompt.
+"""
+
+import time
+import logging
+from typing import Any, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from .store import FixtureStore, request_key
+
+logger = logging.getLogger(__name__)
+
+_store = FixtureStore("nemo")
+
+
+def _request(messages: List[BaseMessage], stop: Optional[List[str]]) -> tuple:
+    payload = {"messages": [[m.type, m.content] for m in messages], "stop": stop}
+    preview = str(messages[-1].content) if messages else ""
+    return request_key(payload), preview
+
+
+def _result(entry: dict) -> ChatResult:
+    response = entry["response"]
+    return ChatResult(
+        generations=[ChatGeneration(message=AIMessage(content=response["content"]))],
+        llm_output=response.get("llm_output"),
+    )
+
+
+def _recorded(result: ChatResult) -> dict:
+    return {"content": result.generations[0].message.content, "llm_output": result.llm_output}
+
+
+class ReplayChatModel(BaseChatModel):
+    """NeMo rails LLM stand-in serving recorded completions (or recording live ones)."""
+
+    inner: Optional[BaseChatModel] = None
+
+    @property
+    def _llm_type(self) -> str:
+        return "replay"
+
+    def _generate(
+        self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager=None, **kwargs: Any
+    ) -> ChatResult:
+        key, preview = _request(messages, stop)
+        if self.inner is None:
+            return _result(_store.replay(key, preview))
+
+        start = time.perf_counter()
+        result = self.inner._generate(messages, stop=stop, **kwargs)
+        _store.put(key, _recorded(result), 1000 * (time.perf_counter() - start), preview)
+        return result
+
+    async def _agenerate(
+        self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager=None, **kwargs: Any
+    ) -> ChatResult:
+        key, preview = _request(messages, stop)
+        if self.inner is None:
+            return _result(await _store.replay_async(key, preview))
+
+        start = time.perf_counter()
+        result = await self.inner._agenerate(messages, stop=stop, **kwargs)
+        _store.put(key, _recorded(result), 1000 * (time.perf_counter() - start), preview)
+        return result
@@ -0,0 +1,37 @@
+"""
+Record/replay stand-in for the native SQL generator's OpenAI client.
+
+The system prompt embeds the column profile, which changes with the
+data, so requests are keyed on the question, model and schema
+fingerprint instead - fixtures recorded on the sample data replay
+against synthetic data of any size.
+"""
+
+import time
+import logging
+
+from .store import FixtureStore, request_key
+from ..config import OPENAI_MODEL, get_schema_fingerprint
+
+logger = logging.getLogger(__name__)
+
+_store = FixtureStore("nl2sql")
+
+
+class ReplayOpenAIChat:
+    """OpenAIChat stand-in serving recorded completions (or recording live ones)."""
+
+    def __init__(self, inner=None):
+        self._inner = inner
+
+    def complete(self, messages: list) -> dict:
+        question = messages[-1]["content"]
+        key = request_key({"model": OPENAI_MODEL, "schema": get_schema_fingerprint(), "question": question})
+
+        if self._inner is None:
+            return _store.replay(key, question)["response"]
+
+        start = time.perf_counter()
+        completion = self._inner.complete(messages)
+        _store.put(key, completion, 1000 * (time.perf_counter() - start), question)
+        return completion
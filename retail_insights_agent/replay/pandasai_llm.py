@@ -0,0 +1,51 @@
+"""
+Record/replay stand-in for the PandasAI OpenAI client.
+
+PandasAI puts the conversation memory into every prompt, so full
+prompts are not a stable key. Requests are keyed on the
+current question, model and schema fingerprint instead, like SQLCache.
+"""
+
+import time
+import logging
+from typing import Optional
+
+from pandasai.llm.base import LLM
+
+from .store import FixtureStore, request_key
+from ..config import OPENAI_MODEL, get_schema_fingerprint
+
+logger = logging.getLogger(__name__)
+
+_store = FixtureStore("pandasai")
+
+
+def _question(instruction, context) -> str:
+    memory = getattr(context, "memory", None)
+    if memory is not None and memory.count():
+        return memory.get_last_message()
+    return instruction.to_string()
+
+
+class ReplayPandasAILLM(LLM):
+    """PandasAI LLM stand-in serving recorded completions (or recording live ones)."""
+
+    def __init__(self, inner: Optional[LLM] = None):
+        self._inner = inner
+
+    @property
+    def type(self) -> str:
+        return "replay"
+
+    def call(self, instruction, context=None) -> str:
+        self.last_prompt = instruction.to_string()
+        question = _question(instruction, context)
+        key = request_key({"model": OPENAI_MODEL, "schema": get_schema_fingerprint(), "question": question})
+
+        if self._inner is None:
+            return _store.replay(key, question)["response"]
+
+        start = time.perf_counter()
+        response = self._inner.call(instruction, context)
+        _store.put(key, response, 1000 * (time.perf_counter() - start), question)
+        return response
@@ -0,0 +1,107 @@
+"""
+Fixture store for recorded LLM responses.
+
+One JSONL file per LLM client under LLM_FIXTURES_DIR. Each line holds
+a request key (hash of the normalized request), a short prompt preview,
+the response and the latency it was recorded with. Later lines win, so
+re-recording a request replaces its response.
+"""
+
+import json
+import time
+import asyncio
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Optional
+
+from ..config import LLM_FIXTURES_DIR, LLM_REPLAY_LATENCY
+
+logger = logging.getLogger(__name__)
+
+_PREVIEW_CHARS = 200
+
+
+class FixtureMissing(Exception):
+    """Replay mode found no recorded response for a request."""
+
+
+def request_key(payload) -> str:
+    """Stable hash of a JSON-serializable request."""
+    data = json.dumps(payload, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def replay_delay(recorded_ms: float) -> float:
+    """Seconds a replayed call should take (LLM_REPLAY_LATENCY)."""
+    if LLM_REPLAY_LATENCY.strip().lower() == "recorded":
+        return recorded_ms / 1000
+    return float(LLM_REPLAY_LATENCY or 0) / 1000
+
+
+class FixtureStore:
+    """Recorded responses of one LLM client, loaded on first use."""
+
+    def __init__(self, name: str, directory: Optional[Path] = None):
+        self._name = name
+        self._path = Path(directory or LLM_FIXTURES_DIR) / f"{name}.jsonl"
+        self._entries: Optional[dict] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict:
+        if self._entries is None:
+            with self._lock:
+                if self._entries is None:
+                    entries = {}
+                    if self._path.exists():
+                        with open(self._path, encoding="utf-8") as f:
+                            for line in f:
+                                if line.strip():
+                                    entry = json.loads(line)
+                                    entries[entry["key"]] = entry
+                    logger.info(f"Loaded {len(entries)} recorded {self._name} responses from {self._path}")
+                    self._entries = entries
+        return self._entries
+
+    def get(self, key: str, preview: str = "") -> dict:
+        """
+        Get the recorded entry (response, latency_ms) for a request key.
+
+        Raises:
+            FixtureMissing: If the request was never recorded
+        """
+        entry = self._load().get(key)
+        if entry is None:
+            raise FixtureMissing(
+                f"No recorded {self._name} response for request {key[:12]} "
+                f"({preview[:80]!r}) in {self._path} - record it with LLM_REPLAY_MODE=record"
+            )
+        return entry
+
+    def put(self, key: str, response, latency_ms: float, preview: str = "") -> None:
+        """Record a response and append it to the fixture file."""
+        entry = {
+            "key": key,
+            "preview": preview[:_PREVIEW_CHARS],
+            "latency_ms": round(latency_ms, 1),
+            "response": response,
+        }
+        entries = self._load()
+        with self._lock:
+            entries[key] = entry
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+
+    def replay(self, key: str, preview: str = "") -> dict:
+        """Get a recorded entry after the replay delay (blocking)."""
+        entry = self.get(key, preview)
+        time.sleep(replay_delay(entry["latency_ms"]))
+        return entry
+
+    async def replay_async(self, key: str, preview: str = "") -> dict:
+        """Get a recorded entry after the replay delay."""
+        entry = self.get(key, preview)
+        await asyncio.sleep(replay_delay(entry["latency_ms"]))
+        return entry
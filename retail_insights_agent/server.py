@@ -0,0 +1,57 @@
+"""
+ADK web server with health endpoints.
+
+Serves the same API and dev UI as `adk web` (run from the repo root),
+plus two probes:
+    GET /healthz  liveness - the process is up
+    GET /readyz   readiness - data, SQL generator and guardrails are built (503 until then)
+
+Run from the repo root:
+    python -m retail_insights_agent.server [--host 127.0.0.1] [--port 8000]
+"""
+
+import argparse
+from pathlib import Path
+
+from .health import liveness, readiness, start_warmup
+from .config import WARMUP_ON_LOAD
+
+# The directory holding this package, as `adk web` would be given
+AGENTS_DIR = Path(__file__).resolve().parent.parent
+
+
+def create_app():
+    """Build the ADK FastAPI app and add /healthz and /readyz."""
+    from fastapi.responses import JSONResponse
+    from google.adk.cli.fast_api import get_fast_api_app
+
+    app = get_fast_api_app(agents_dir=str(AGENTS_DIR), web=True)
+
+    @app.get("/healthz")
+    def healthz() -> dict:
+        return liveness()
+
+    @app.get("/readyz")
+    def readyz() -> JSONResponse:
+        report = readiness()
+        return JSONResponse(report, status_code=200 if report["status"] == "ready" else 503)
+
+    # ADK loads the agent on its first request - don't wait for that to warm up
+    if WARMUP_ON_LOAD:
+        start_warmup()
+    return app
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    uvicorn.run(create_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,3 +3,4 @@
 from .sql_generator import generate_sql
 from .sql_executor import execute_sql
 from .guardrail import input_guardrail
+from .summary import executive_summary
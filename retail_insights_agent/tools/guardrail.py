@@ -2,16 +2,17 @@
 Input guardrail tool for ADK agents.
 
 Used by root agent to validate queries before processing.
+Async so ADK awaits the check directly on the runner's event loop.
 """
 
 import logging
 
-from ..guardrails.nemo import validate_query
+from ..tracing import set_attributes
 
 logger = logging.getLogger(__name__)
 
 
-def input_guardrail(user_query: str) -> dict:
+async def input_guardrail(user_query: str) -> dict:
     """
     Validate if a user request is within scope for retail analytics.
 
@@ -33,7 +34,12 @@ def input_guardrail(user_query: str) -> dict:
     logger.info(f"Checking query safety: {user_query[:50]}...")
 
     try:
-        result = validate_query(user_query)
+        # NeMo Guardrails (and LangChain) are imported on first use, not when the agents are defined
+        from ..guardrails.nemo import validate_query_async
+
+        result = await validate_query_async(user_query)
+        # Annotates ADK's "execute_tool input_guardrail" span
+        set_attributes(**{"retail.allowed": result.allowed, "retail.reason": result.reason})
 
         return {
             "allowed": result.allowed,
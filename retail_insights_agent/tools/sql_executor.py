@@ -2,16 +2,47 @@
 SQL execution tool for ADK agents.
 
 Used by Data Extraction Agent to run queries on DuckDB.
+Results over the row/byte budget are returned as a statistical summary.
+Async so queries run on the DuckDB worker pool instead of blocking the
+runner's event loop, and are interrupted on timeout or cancellation.
 """
 
+import json
 import logging
 
-from ..database.duckdb import execute_query
+from ..database.duckdb import execute_query_async, run_in_worker, summarize_query, QueryResult
+from ..database.duckdb.admission import EXECUTION_ERROR
+from ..tracing import set_attributes
+from ..config import (
+    QUERY_TIMEOUT_SECONDS,
+    RESULT_FORMAT,
+    RESULT_BUDGET_ROWS,
+    RESULT_BUDGET_BYTES,
+    RESULT_SUMMARY_TOP_K,
+    RESULT_SAMPLE_ROWS,
+)
 
 logger = logging.getLogger(__name__)
 
 
-def execute_sql(sql_query: str) -> dict:
+def _serialize(result) -> object:
+    """Serialize the Arrow result in the configured layout."""
+    return result.to_columns() if RESULT_FORMAT == "columns" else result.to_records()
+
+
+def _serialization_error(error: Exception) -> dict:
+    """Error payload for a result that ran but couldn't be encoded."""
+    return {
+        "status": "error",
+        "error_code": EXECUTION_ERROR,
+        "data": None,
+        "columns": None,
+        "row_count": 0,
+        "message": f"Query ran but its result could not be serialized: {error}",
+    }
+
+
+async def execute_sql(sql_query: str) -> dict:
     """
     Execute SQL query against the retail database.
 
@@ -19,7 +50,9 @@ def execute_sql(sql_query: str) -> dict:
         sql_query: Valid SELECT query to execute
 
     Returns:
-        Dict with status, data, columns, row_count, and message
+        Dict with status, data, columns, row_count, and message.
+        If the result exceeds the budget, also summarized=True and a
+        summary with per-column statistics; data then holds a sample.
     """
     if not sql_query or not sql_query.strip():
         return {
@@ -32,21 +65,70 @@ def execute_sql(sql_query: str) -> dict:
 
     logger.info(f"Executing SQL: {sql_query[:50]}...")
 
-    result = execute_query(sql_query)
+    result = await execute_query_async(sql_query, max_rows=RESULT_BUDGET_ROWS)
+    # Annotates ADK's "execute_tool execute_sql" span
+    set_attributes(**{
+        "retail.row_count": result.row_count,
+        "retail.cache_hit": result.cached,
+        "retail.error_code": result.error_code,
+    })
 
-    if result.success:
-        return {
-            "status": "success",
-            "data": result.data,
-            "columns": result.columns,
-            "row_count": result.row_count,
-            "message": f"Query returned {result.row_count} rows",
-        }
-    else:
+    if not result.success:
         return {
             "status": "error",
+            "error_code": result.error_code,
             "data": None,
             "columns": None,
             "row_count": 0,
             "message": result.error,
         }
+
+    # Serialize the Arrow result only now, in the configured layout
+    try:
+        data = _serialize(result)
+        size = len(json.dumps(data, default=str))
+    except Exception as e:
+        logger.error(f"Result serialization failed: {e}")
+        return _serialization_error(e)
+
+    if not result.truncated and size <= RESULT_BUDGET_BYTES:
+        return {
+            "status": "success",
+            "data": data,
+            "columns": result.columns,
+            "row_count": result.row_count,
+            "message": f"Query returned {result.row_count} rows",
+        }
+
+    logger.info(f"Result over budget (truncated={result.truncated}, {size:,} bytes), summarizing")
+    set_attributes(**{"retail.summarized": True, "retail.result_bytes": size})
+
+    try:
+        summary = await run_in_worker(
+            summarize_query, sql_query, RESULT_SUMMARY_TOP_K, timeout=QUERY_TIMEOUT_SECONDS
+        )
+    except Exception as e:
+        logger.error(f"Result summary failed: {e}")
+        summary = {"row_count": None, "columns": []}
+
+    row_count = summary["row_count"] if summary["row_count"] is not None else result.row_count
+    sample = QueryResult(success=True, table=result.table.slice(0, RESULT_SAMPLE_ROWS))
+    try:
+        sample_data = _serialize(sample)
+    except Exception as e:
+        logger.error(f"Result serialization failed: {e}")
+        return _serialization_error(e)
+
+    return {
+        "status": "success",
+        "summarized": True,
+        "data": sample_data,
+        "columns": result.columns,
+        "row_count": row_count,
+        "summary": summary,
+        "message": (
+            f"Result too large to return in full ({row_count} rows; budget is "
+            f"{RESULT_BUDGET_ROWS} rows / {RESULT_BUDGET_BYTES:,} bytes). Returning a "
+            f"statistical summary and the first {RESULT_SAMPLE_ROWS} rows instead."
+        ),
+    }
@@ -6,15 +6,29 @@ Used by Query Resolution Agent to convert natural language to SQL.
 
 import logging
 
-from ..database.pandasai import get_generator
+from ..tracing import set_attributes
+from ..config import SQL_GENERATOR
 
 logger = logging.getLogger(__name__)
 
 
-def generate_sql(question: str) -> dict:
+def get_sql_generator():
+    """Get the SQL generator selected by SQL_GENERATOR ("native" or "pandasai")."""
+    # Imported on first use, not when the agents are defined
+    if SQL_GENERATOR == "pandasai":
+        from ..database.pandasai import get_generator
+    else:
+        from ..database.nl2sql import get_generator
+    return get_generator()
+
+
+async def generate_sql(question: str) -> dict:
     """
     Generate SQL from a natural language question.
 
+    Generation runs off the event loop, so concurrent sessions (and
+    parallel tool calls) generate in parallel.
+
     Args:
         question: Natural language question about retail data
 
@@ -31,8 +45,10 @@ def generate_sql(question: str) -> dict:
     logger.info(f"Generating SQL for: {question[:50]}...")
 
     try:
-        generator = get_generator()
-        result = generator.generate(question)
+        generator = get_sql_generator()
+        result = await generator.generate_async(question)
+        # Annotates ADK's "execute_tool generate_sql" span
+        set_attributes(**{"retail.sql_cache": result.cache_tier or "miss", "retail.success": result.success})
 
         if result.success and result.sql:
             return {
@@ -0,0 +1,34 @@
+"""
+Executive summary tool for ADK agents.
+
+Used by the root agent for summary/overview/report requests. Returns
+every summary section from one cached DuckDB pass instead of four
+analytics_agent calls.
+"""
+
+import logging
+
+from ..database.duckdb import compute_summary, run_in_worker
+from ..config import QUERY_TIMEOUT_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+async def executive_summary() -> dict:
+    """
+    Get the executive summary of the retail sales data.
+
+    Returns:
+        Dict with status and summary: period, total revenue/orders/average
+        order value, top 5 categories by revenue, top 5 states by orders
+        and the order status distribution (shares in percent)
+    """
+    logger.info("Computing executive summary...")
+
+    try:
+        summary = await run_in_worker(compute_summary, timeout=QUERY_TIMEOUT_SECONDS)
+        return {"status": "success", "summary": summary}
+
+    except Exception as e:
+        logger.error(f"Executive summary failed: {e}")
+        return {"status": "error", "summary": None, "message": str(e)}
@@ -0,0 +1,4 @@
+"""Tracing: OpenTelemetry spans for agents, tools, LLM calls and DuckDB queries."""
+
+from .setup import setup_tracing
+from .spans import span, set_attributes
@@ -0,0 +1,62 @@
+"""
+JSONL span export.
+
+One JSON object per finished span, appended to a local file - enough
+to compute per-step latency and token totals without a collector.
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Sequence
+
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+# ADK records full LLM requests/responses as attributes - keep lines readable
+_MAX_VALUE_CHARS = 2000
+
+
+def _value(value):
+    if isinstance(value, str) and len(value) > _MAX_VALUE_CHARS:
+        return value[:_MAX_VALUE_CHARS] + "..."
+    if isinstance(value, tuple):
+        return list(value)
+    return value
+
+
+def span_record(span: ReadableSpan) -> dict:
+    """Flatten a finished span into a JSON-serializable dict."""
+    context = span.get_span_context()
+    return {
+        "trace_id": format(context.trace_id, "032x"),
+        "span_id": format(context.span_id, "016x"),
+        "parent_id": format(span.parent.span_id, "016x") if span.parent else None,
+        "name": span.name,
+        "start_ns": span.start_time,
+        "duration_ms": round((span.end_time - span.start_time) / 1e6, 3),
+        "status": span.status.status_code.name,
+        "attributes": {key: _value(value) for key, value in (span.attributes or {}).items()},
+    }
+
+
+class JsonlSpanExporter(SpanExporter):
+    """Appends finished spans to a JSONL file."""
+
+    def __init__(self, path: Path):
+        self._path = Path(path)
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        lines = "".join(json.dumps(span_record(s), default=str) + "\n" for s in spans)
+        try:
+            with self._lock:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self._path, "a", encoding="utf-8") as f:
+                    f.write(lines)
+        except OSError:
+            return SpanExportResult.FAILURE
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self) -> None:
+        pass
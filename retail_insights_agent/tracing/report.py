@@ -0,0 +1,95 @@
+"""
+Latency and token report from a JSONL trace file.
+
+Groups spans by name and reports count, p50/p95/max duration and token
+totals, slowest p95 first - which agent, tool, LLM call or query
+dominates end-to-end latency.
+
+Run from the repo root:
+    python -m retail_insights_agent.tracing.report [traces.jsonl] [--json]
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+from typing import Iterable
+
+
+def _percentile(sorted_values: list, pct: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarize_spans(records: Iterable[dict], percentiles: tuple = (50, 95)) -> list:
+    """
+    Summarize span records (see span_record) per name.
+
+    Returns:
+        List of {name, count, p<N>_ms per percentile, max_ms, total_ms,
+        input_tokens, output_tokens}, sorted by the last percentile descending
+    """
+    groups = {}
+    for record in records:
+        group = groups.setdefault(record["name"], {"durations": [], "input_tokens": 0, "output_tokens": 0})
+        group["durations"].append(record["duration_ms"])
+        attributes = record.get("attributes", {})
+        group["input_tokens"] += attributes.get("gen_ai.usage.input_tokens") or 0
+        group["output_tokens"] += attributes.get("gen_ai.usage.output_tokens") or 0
+
+    rows = []
+    for name, group in groups.items():
+        durations = sorted(group["durations"])
+        row = {"name": name, "count": len(durations)}
+        for pct in percentiles:
+            row[f"p{pct}_ms"] = round(_percentile(durations, pct), 1)
+        row.update({
+            "max_ms": round(durations[-1], 1),
+            "total_ms": round(sum(durations), 1),
+            "input_tokens": group["input_tokens"],
+            "output_tokens": group["output_tokens"],
+        })
+        rows.append(row)
+    rows.sort(key=lambda r: -r[f"p{percentiles[-1]}_ms"])
+    return rows
+
+
+def summarize_traces(path: Path) -> list:
+    """
+    Summarize the spans of a JSONL trace file per name.
+
+    Returns:
+        List of {name, count, p50_ms, p95_ms, max_ms, total_ms,
+        input_tokens, output_tokens}, sorted by p95 descending
+    """
+    with open(path, encoding="utf-8") as f:
+        return summarize_spans(json.loads(line) for line in f if line.strip())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("path", nargs="?", default=None, help="JSONL trace file (default: TRACE_FILE)")
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of a table")
+    args = parser.parse_args()
+
+    if args.path is None:
+        from ..config import TRACE_FILE
+        args.path = TRACE_FILE
+
+    rows = summarize_traces(Path(args.path))
+    if args.json:
+        json.dump(rows, sys.stdout, indent=2)
+        print()
+        return
+
+    print(f"{'span':<48} {'count':>6} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9} {'tokens in/out':>16}")
+    for row in rows:
+        tokens = f"{row['input_tokens']}/{row['output_tokens']}" if row["input_tokens"] or row["output_tokens"] else "-"
+        print(
+            f"{row['name'][:48]:<48} {row['count']:>6} {row['p50_ms']:>9} "
+            f"{row['p95_ms']:>9} {row['max_ms']:>9} {tokens:>16}"
+        )
+
+
+if __name__ == "__main__":
+    main()
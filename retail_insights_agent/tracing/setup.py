@@ -0,0 +1,57 @@
+"""
+Trace export setup.
+
+Adds a batch span processor exporting to a JSONL file or an OTLP/HTTP
+collector. If a tracer provider is already installed (e.g. by `adk web`)
+the processor is added to it; otherwise a new provider is registered.
+"""
+
+import logging
+
+from ..config import TRACING_ENABLED, TRACE_EXPORTER, TRACE_FILE, TRACE_OTLP_ENDPOINT, TRACE_SERVICE_NAME
+
+logger = logging.getLogger(__name__)
+
+_configured = False
+
+
+def _create_exporter():
+    from .exporters import JsonlSpanExporter
+
+    if TRACE_EXPORTER == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+        # None falls back to OTEL_EXPORTER_OTLP_* env vars, then localhost:4318
+        return OTLPSpanExporter(endpoint=TRACE_OTLP_ENDPOINT or None)
+    return JsonlSpanExporter(TRACE_FILE)
+
+
+def setup_tracing() -> bool:
+    """
+    Start exporting spans if TRACING_ENABLED (idempotent).
+
+    Returns:
+        True if an exporter is active
+    """
+    global _configured
+    if _configured or not TRACING_ENABLED:
+        return _configured
+
+    # The SDK is only imported when tracing is on
+    from opentelemetry import trace
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+    provider = trace.get_tracer_provider()
+    if not isinstance(provider, TracerProvider):
+        provider = TracerProvider(resource=Resource.create({"service.name": TRACE_SERVICE_NAME}))
+        trace.set_tracer_provider(provider)
+
+    provider.add_span_processor(BatchSpanProcessor(_create_exporter()))
+    _configured = True
+
+    target = TRACE_FILE if TRACE_EXPORTER != "otlp" else (TRACE_OTLP_ENDPOINT or "OTLP collector")
+    print(f"[Tracing] Exporting spans to {target}")
+    logger.info(f"Tracing enabled ({TRACE_EXPORTER}): {target}")
+    return True
@@ -0,0 +1,34 @@
+"""
+Application spans.
+
+ADK already opens spans for agent runs ("agent_run [name]"), Gemini
+calls ("call_llm", with gen_ai.usage.* token counts) and tool calls
+("execute_tool name"). span() adds the work ADK can't see - NeMo and
+SQL generation LLM calls and DuckDB queries - nested under whichever span is
+current, and set_attributes() annotates the current span (e.g. a tool's)
+with row counts and cache hits. Without a configured exporter both are
+no-ops.
+"""
+
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from opentelemetry import trace
+
+_tracer = trace.get_tracer("retail_insights_agent")
+
+
+def set_attributes(current: Optional[trace.Span] = None, **attributes) -> None:
+    """Set attributes on a span (default: the current one), skipping None values."""
+    current = current or trace.get_current_span()
+    for key, value in attributes.items():
+        if value is not None:
+            current.set_attribute(key, value)
+
+
+@contextmanager
+def span(name: str, **attributes) -> Iterator[trace.Span]:
+    """Open a child span of the current span; exceptions are recorded on it."""
+    with _tracer.start_as_current_span(name) as current:
+        set_attributes(current, **attributes)
+        yield current
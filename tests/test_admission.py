@@ -0,0 +1,55 @@
+"""Query admission: read-only statements over the loaded tables only."""
+
+import duckdb
+import pytest
+
+from retail_insights_agent.database.duckdb.admission import check_statement, check_relations, NOT_A_QUERY
+
+
+@pytest.fixture
+def cursor():
+    conn = duckdb.connect()
+    conn.execute("CREATE TABLE amazon_sales (category VARCHAR, amount DOUBLE)")
+    conn.execute("CREATE VIEW sales_view AS SELECT * FROM amazon_sales")
+    conn.execute("CREATE TABLE _manifest (path VARCHAR)")
+    yield conn.cursor()
+    conn.close()
+
+
+@pytest.mark.parametrize("sql", [
+    "SELECT 1 AS update",
+    "SELECT category AS load, SUM(amount) AS delete FROM amazon_sales GROUP BY 1",
+    "WITH x(c) AS (SELECT category FROM amazon_sales) SELECT * FROM x",
+])
+def test_keywords_as_names_are_admitted(sql):
+    assert check_statement(sql) is None
+
+
+@pytest.mark.parametrize("sql", [
+    "DROP TABLE amazon_sales",
+    "WITH a AS (SELECT 1) INSERT INTO amazon_sales SELECT * FROM a",
+    "SELECT 1; DROP TABLE amazon_sales",
+])
+def test_writes_are_rejected(sql):
+    assert check_statement(sql).code == NOT_A_QUERY
+
+
+@pytest.mark.parametrize("sql", [
+    "SELECT * FROM amazon_sales",
+    "SELECT * FROM main.sales_view",
+    "WITH top AS (SELECT category FROM amazon_sales) SELECT * FROM top JOIN sales_view USING (category)",
+])
+def test_loaded_relations_are_admitted(cursor, sql):
+    assert check_relations(cursor, sql) is None
+
+
+@pytest.mark.parametrize("sql", [
+    "SELECT * FROM read_text('.env.example')",
+    "SELECT * FROM '.env.example'",
+    "SELECT * FROM glob('*')",
+    "SELECT * FROM amazon_sales WHERE category IN (SELECT column0 FROM read_csv('/etc/passwd'))",
+    "SELECT * FROM information_schema.tables",
+    "SELECT * FROM _manifest",
+])
+def test_files_and_other_relations_are_rejected(cursor, sql):
+    assert check_relations(cursor, sql).code == NOT_A_QUERY
@@ -0,0 +1,99 @@
+"""Reloads and snapshot swaps never disturb queries already running."""
+
+import duckdb
+import pytest
+
+from retail_insights_agent.database.duckdb import connection
+from retail_insights_agent.database.duckdb.connection import DuckDBConnection
+
+
+@pytest.fixture
+def swap(monkeypatch):
+    old, new = DuckDBConnection(), DuckDBConnection()
+    monkeypatch.setattr(DuckDBConnection, "_instance", old)
+    yield old, new
+    old.close()
+    new.close()
+
+
+def test_retired_instance_finishes_running_queries(swap):
+    old, new = swap
+    with old.cursor() as cursor:
+        DuckDBConnection._swap(new)
+        assert cursor.execute("SELECT 42").fetchone() == (42,)
+        assert not old._closed
+    assert old._closed
+
+
+def test_retired_instance_lends_cursors_of_its_replacement(swap):
+    old, new = swap
+    new.execute("CREATE TABLE replacement AS SELECT 1 AS x")
+    DuckDBConnection._swap(new)
+    with old.cursor() as cursor:
+        assert cursor.execute("SELECT x FROM replacement").fetchone() == (1,)
+
+
+@pytest.fixture
+def loaded(tmp_path, monkeypatch):
+    (tmp_path / "a.csv").write_text("x\n1\n2\n")
+    monkeypatch.setattr(connection, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(connection, "TABLE_SCHEMAS", {"t": {"source_glob": "*.csv"}})
+    monkeypatch.setattr(connection, "ROLLUPS_ENABLED", False)
+    instance = DuckDBConnection()
+    instance._load_tables()
+    yield tmp_path, instance
+    instance.close()
+
+
+def _count(instance) -> int:
+    with instance.cursor() as cursor:
+        return cursor.execute("SELECT COUNT(*) FROM t").fetchone()[0]
+
+
+def test_ingest_is_invisible_until_it_commits(loaded, monkeypatch):
+    data_dir, instance = loaded
+    (data_dir / "b.csv").write_text("x\n3\n")
+    seen = []
+    record_files = instance._record_files
+
+    def record_and_peek(table_name, files):
+        record_files(table_name, files)
+        seen.append(_count(instance))
+
+    monkeypatch.setattr(instance, "_record_files", record_and_peek)
+    assert instance._ingest()["t"]["mode"] == "append"
+    assert seen == [2]
+    assert _count(instance) == 3
+
+
+def test_failed_ingest_keeps_previous_tables(loaded, monkeypatch):
+    data_dir, instance = loaded
+    (data_dir / "a.csv").write_text("x\n5\n6\n7\n")
+
+    def fail(table_name, files):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(instance, "_record_files", fail)
+    with pytest.raises(Exception):
+        instance._ingest()
+    assert _count(instance) == 2
+
+
+def test_failed_append_reports_the_load_error(loaded):
+    data_dir, instance = loaded
+    # Text into a BIGINT column - the cast fails mid-INSERT and aborts the transaction
+    (data_dir / "b.csv").write_text("x\nabc\n")
+    with pytest.raises(RuntimeError, match="Appending to t failed") as failure:
+        instance._ingest()
+    assert isinstance(failure.value.__cause__, duckdb.Error)
+    assert "aborted" not in str(failure.value)
+    assert _count(instance) == 2
+
+
+def test_failed_reload_reports_the_load_error(loaded):
+    data_dir, instance = loaded
+    (data_dir / "a.csv").write_text('x\n"1\n')
+    with pytest.raises(RuntimeError, match="Reloading t failed") as failure:
+        instance._ingest()
+    assert isinstance(failure.value.__cause__, duckdb.Error)
+    assert _count(instance) == 2
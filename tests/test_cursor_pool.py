@@ -0,0 +1,162 @@
+"""Cursor pool: concurrency bound, idle reuse, close and drain."""
+
+import threading
+import time
+
+import duckdb
+import pytest
+
+from retail_insights_agent.database.duckdb.pool import CursorPool, PoolClosed
+
+
+@pytest.fixture
+def conn():
+    conn = duckdb.connect()
+    yield conn
+    conn.close()
+
+
+def _borrow_all(pool: CursorPool, count: int, hold: float) -> tuple:
+    """Borrow from count threads at once; return (peak concurrent borrowers, errors)."""
+    active, peak, errors = [0], [0], []
+    lock = threading.Lock()
+    start = threading.Barrier(count)
+
+    def borrow():
+        start.wait()
+        try:
+            with pool.cursor() as cursor:
+                with lock:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                cursor.execute("SELECT 1").fetchall()
+                time.sleep(hold)
+                with lock:
+                    active[0] -= 1
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=borrow) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return peak[0], errors
+
+
+def test_concurrency_is_bounded(conn):
+    pool = CursorPool(conn, 2)
+    peak, errors = _borrow_all(pool, 8, hold=0.05)
+    assert not errors
+    assert peak == 2
+
+    stats = pool.stats()
+    assert stats["acquired"] == 8
+    assert stats["cursors"] <= 2
+    assert stats["queued"] >= 6
+    assert stats["in_use"] == stats["waiting"] == 0
+    assert stats["max_wait_ms"] >= 50
+
+
+def test_idle_cursors_are_reused(conn):
+    pool = CursorPool(conn, 4)
+    with pool.cursor() as first:
+        pass
+    with pool.cursor() as second:
+        assert second is first
+    assert pool.stats()["cursors"] == 1
+
+
+def test_cursor_raising_is_returned(conn):
+    pool = CursorPool(conn, 1)
+    with pytest.raises(duckdb.Error):
+        with pool.cursor() as cursor:
+            cursor.execute("SELECT * FROM missing")
+    with pool.cursor() as cursor:
+        assert cursor.execute("SELECT 1").fetchone() == (1,)
+    assert pool.stats()["in_use"] == 0
+
+
+def test_close_refuses_borrows_and_closes_cursors_on_return(conn):
+    pool = CursorPool(conn, 2)
+    with pool.cursor() as cursor:
+        pool.close()
+        assert cursor.execute("SELECT 1").fetchone() == (1,)
+    with pytest.raises(duckdb.Error):
+        cursor.execute("SELECT 1")
+    with pytest.raises(PoolClosed):
+        with pool.cursor():
+            pass
+
+
+def test_idle_pool_drains_at_once(conn):
+    pool = CursorPool(conn, 2)
+    drained = threading.Event()
+    pool.drain(drained.set)
+    assert drained.is_set()
+
+
+def test_drained_pool_closes_when_last_cursor_returns(conn):
+    pool = CursorPool(conn, 2)
+    drained = threading.Event()
+
+    with pool.cursor() as cursor:
+        pool.drain(drained.set)
+        assert not drained.is_set()
+        assert cursor.execute("SELECT 42").fetchone() == (42,)
+    assert drained.is_set()
+
+    with pytest.raises(PoolClosed):
+        with pool.cursor():
+            pass
+
+
+def test_drain_waits_for_every_running_query(conn):
+    pool = CursorPool(conn, 4)
+    started, release = threading.Barrier(5), threading.Event()
+    calls, results = [], []
+
+    def run():
+        with pool.cursor() as cursor:
+            started.wait()
+            release.wait()
+            results.append(cursor.execute("SELECT SUM(range) FROM range(100000)").fetchone()[0])
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    started.wait()
+
+    pool.drain(lambda: calls.append(pool.stats()["in_use"]))
+    assert calls == []
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == [4999950000] * 4
+    assert calls == [0]
+
+
+def test_borrowers_queued_behind_a_drain_are_refused(conn):
+    pool = CursorPool(conn, 1)
+    drained = threading.Event()
+    outcome = []
+
+    def queued():
+        try:
+            with pool.cursor():
+                outcome.append("borrowed")
+        except PoolClosed:
+            outcome.append("refused")
+
+    with pool.cursor():
+        waiter = threading.Thread(target=queued)
+        waiter.start()
+        while pool.stats()["waiting"] == 0:
+            time.sleep(0.001)
+        pool.drain(drained.set)
+    waiter.join()
+
+    assert drained.is_set()
+    assert outcome == ["refused"]
+    assert pool.stats()["in_use"] == 0
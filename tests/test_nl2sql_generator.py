@@ -0,0 +1,196 @@
+"""Native SQL generator on replayed completions, and the schema profile it prompts with."""
+
+import pytest
+
+from retail_insights_agent.config import OPENAI_MODEL, get_schema_fingerprint
+from retail_insights_agent.replay import openai_chat, store
+from retail_insights_agent.replay.openai_chat import ReplayOpenAIChat
+from retail_insights_agent.replay.store import FixtureStore, request_key
+from retail_insights_agent.database.duckdb.connection import DuckDBConnection
+from retail_insights_agent.database.nl2sql import generator, profile
+from retail_insights_agent.database.nl2sql.cache import SQLCache
+from retail_insights_agent.database.nl2sql.generator import NativeSQLGenerator
+
+SQL = "SELECT state, SUM(amount) AS revenue FROM amazon_sales GROUP BY 1 ORDER BY 2 DESC LIMIT 5"
+
+
+@pytest.fixture
+def fixtures(tmp_path, monkeypatch):
+    """An empty nl2sql fixture store; record(question, content) adds a completion."""
+    fixture_store = FixtureStore("nl2sql", tmp_path)
+    monkeypatch.setattr(openai_chat, "_store", fixture_store)
+    monkeypatch.setattr(store, "LLM_REPLAY_LATENCY", "0")
+
+    def record(question: str, content: str) -> None:
+        key = request_key({"model": OPENAI_MODEL, "schema": get_schema_fingerprint(), "question": question})
+        completion = {"content": content, "input_tokens": 900, "output_tokens": 40}
+        fixture_store.put(key, completion, 250.0, question)
+
+    return record
+
+
+class CountingChat(ReplayOpenAIChat):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def complete(self, messages: list) -> dict:
+        self.calls += 1
+        return super().complete(messages)
+
+
+@pytest.fixture
+def sql_generator(fixtures, monkeypatch):
+    monkeypatch.setattr(generator, "get_schema_context", lambda: "Table amazon_sales (4 rows)")
+    instance = NativeSQLGenerator()
+    instance._llm = CountingChat()
+    instance._cache = SQLCache(schema_fingerprint="v1")
+    return instance
+
+
+@pytest.mark.parametrize("content", [
+    SQL,
+    f"  {SQL}\n",
+    f"```sql\n{SQL}\n```",
+    f"```SQL {SQL}```",
+    f"```\n{SQL}\n```",
+])
+def test_reply_is_unfenced(sql_generator, fixtures, content):
+    fixtures("top 5 states by revenue", content)
+    result = sql_generator.generate("top 5 states by revenue")
+    assert result.success and result.sql == SQL and result.cache_tier is None
+
+
+@pytest.mark.parametrize("content", ["UNANSWERABLE", "unanswerable.", "```sql\nUNANSWERABLE\n```", ""])
+def test_unanswerable(sql_generator, fixtures, content):
+    fixtures("what will revenue be next year", content)
+    result = sql_generator.generate("what will revenue be next year")
+    assert not result.success
+    assert result.error == "The question can't be answered from the sales data"
+    assert sql_generator._cache.get("what will revenue be next year") is None
+
+
+@pytest.mark.parametrize("content", [
+    "DELETE FROM amazon_sales",
+    "DROP TABLE amazon_sales",
+    "SELECT 1; DROP TABLE amazon_sales",
+    "Here is the query: SELECT 1",
+])
+def test_non_select_is_rejected_and_not_cached(sql_generator, fixtures, content):
+    fixtures("clear the sales table", content)
+    result = sql_generator.generate("clear the sales table")
+    assert not result.success and result.error.startswith("Generated SQL rejected")
+    assert sql_generator._cache.get("clear the sales table") is None
+
+
+def test_repeat_and_rephrased_questions_are_served_from_cache(sql_generator, fixtures):
+    fixtures("top 5 states by revenue", SQL)
+    assert sql_generator.generate("top 5 states by revenue").cache_tier is None
+
+    exact = sql_generator.generate("Top 5 states by revenue?")
+    similar = sql_generator.generate("what are the top 5 states by revenue")
+    assert (exact.sql, exact.cache_tier) == (SQL, "exact")
+    assert (similar.sql, similar.cache_tier) == (SQL, "similar")
+    assert sql_generator._llm.calls == 1
+
+
+def test_missing_fixture_is_an_error(sql_generator):
+    result = sql_generator.generate("a question nobody recorded")
+    assert not result.success and "No recorded nl2sql response" in result.error
+
+
+def test_prompt_carries_the_schema_context(sql_generator):
+    system, user = sql_generator._messages("total revenue")
+    assert "Table amazon_sales (4 rows)" in system["content"]
+    assert user == {"role": "user", "content": "total revenue"}
+
+
+@pytest.mark.parametrize("column, description, line", [
+    (
+        {"name": "amount", "type": "DOUBLE", "min": "40.00", "max": "250.5", "approx_unique": 4,
+         "null_percentage": 0.0},
+        "Order amount in INR",
+        "- amount DOUBLE: Order amount in INR [40 to 250.5]",
+    ),
+    (
+        {"name": "order_date", "type": "DATE", "min": "2022-03-09", "max": "2022-05-01", "approx_unique": 4,
+         "null_percentage": 25.0},
+        "",
+        "- order_date DATE [2022-03-09 to 2022-05-01; 25% null]",
+    ),
+    (
+        {"name": "state", "type": "VARCHAR", "min": "GOA", "max": "KERALA", "approx_unique": 2,
+         "null_percentage": 0.0, "top_values": [{"value": "GOA", "count": 2}, {"value": "KERALA", "count": 1}]},
+        "",
+        "- state VARCHAR [values 'GOA', 'KERALA']",
+    ),
+    (
+        {"name": "city", "type": "VARCHAR", "min": "A", "max": "Z", "approx_unique": 900,
+         "null_percentage": 0.0, "top_values": [{"value": "PUNE", "count": 40}]},
+        "Delivery city",
+        "- city VARCHAR: Delivery city [~900 distinct, most frequent 'PUNE']",
+    ),
+    (
+        {"name": "order_id", "type": "VARCHAR", "min": "1", "max": "9", "approx_unique": 1000,
+         "null_percentage": None},
+        "",
+        "- order_id VARCHAR [~1000 distinct]",
+    ),
+])
+def test_describe_column(column, description, line):
+    assert profile._describe_column(column, description) == line
+
+
+SCHEMAS = {
+    "amazon_sales": {
+        "description": "Amazon India orders",
+        "field_descriptions": {"amount": "Order amount in INR"},
+    },
+    "returns": {"description": "Not loaded"},
+}
+
+
+@pytest.fixture
+def loaded(monkeypatch):
+    instance = DuckDBConnection()
+    instance.execute(
+        "CREATE TABLE amazon_sales AS SELECT "
+        "DATE '2022-04-01' + CAST(range AS INTEGER) AS order_date, "
+        "CASE WHEN range % 4 = 0 THEN 'GOA' ELSE 'KERALA' END AS state, "
+        "CASE WHEN range < 10 THEN CAST(100 * range AS DOUBLE) END AS amount "
+        "FROM range(20)"
+    )
+    monkeypatch.setattr(DuckDBConnection, "_instance", instance)
+    monkeypatch.setattr(profile, "TABLE_SCHEMAS", SCHEMAS)
+    monkeypatch.setattr(profile, "_context", None)
+    monkeypatch.setattr(profile, "_context_version", None)
+    yield instance
+    instance.close()
+
+
+def test_build_schema_context(loaded):
+    assert profile.build_schema_context(loaded).splitlines() == [
+        "Table amazon_sales (20 rows) - Amazon India orders",
+        "- order_date DATE [2022-04-01 to 2022-04-20]",
+        "- state VARCHAR [values 'KERALA', 'GOA']",
+        "- amount DOUBLE: Order amount in INR [0.0 to 900.0; 50% null]",
+    ]
+
+
+def test_build_schema_context_needs_a_loaded_table(loaded, monkeypatch):
+    monkeypatch.setattr(profile, "TABLE_SCHEMAS", {"returns": {}})
+    with pytest.raises(RuntimeError, match="No tables loaded"):
+        profile.build_schema_context(loaded)
+
+
+def test_schema_context_is_rebuilt_when_the_data_changes(loaded):
+    context = profile.get_schema_context()
+    assert profile.get_schema_context() is context
+
+    loaded.execute("INSERT INTO amazon_sales VALUES (DATE '2022-06-01', 'DELHI', 999.0)")
+    assert profile.get_schema_context() is context  # Same data version - not rebuilt
+
+    loaded._data_version = "v2"
+    rebuilt = profile.get_schema_context()
+    assert rebuilt.startswith("Table amazon_sales (21 rows)")
+    assert "[values 'KERALA', 'GOA', 'DELHI']" in rebuilt
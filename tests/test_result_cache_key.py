@@ -0,0 +1,32 @@
+"""Result cache keys: only spellings that can't change the result are folded."""
+
+import pytest
+
+from retail_insights_agent.database.duckdb.cache import ResultCache
+
+
+@pytest.mark.parametrize("a, b", [
+    ("select state from amazon_sales", "SELECT state FROM amazon_sales"),
+    ("SELECT  state\n  FROM amazon_sales -- top states\n;", "SELECT state FROM amazon_sales"),
+    ("select 1 as n where true and x in (1, 2)", "SELECT 1 AS n WHERE TRUE AND x IN (1, 2)"),
+])
+def test_keyword_case_and_whitespace_share_a_key(a, b):
+    assert ResultCache.key(a) == ResultCache.key(b)
+
+
+@pytest.mark.parametrize("a, b", [
+    ("SELECT SUM(amount) AS Revenue FROM amazon_sales", "SELECT SUM(amount) AS revenue FROM amazon_sales"),
+    ("SELECT sum(Amount) FROM amazon_sales", "SELECT sum(amount) FROM amazon_sales"),
+    ('SELECT "State" FROM amazon_sales', 'SELECT "state" FROM amazon_sales'),
+    ("SELECT 1.50", "SELECT 1.5"),
+    ("SELECT 007", "SELECT 7"),
+    ("SELECT 1 AS select", "SELECT 1 AS SELECT"),
+    ("SELECT * FROM amazon_sales WHERE state = 'goa'", "SELECT * FROM amazon_sales WHERE state = 'GOA'"),
+])
+def test_names_and_literals_keep_their_spelling(a, b):
+    assert ResultCache.key(a) != ResultCache.key(b)
+
+
+@pytest.mark.parametrize("sql", ["SELECT random()", "SELECT RANDOM()", "SELECT * FROM t WHERE d < today()"])
+def test_volatile_queries_are_not_cached(sql):
+    assert ResultCache.key(sql) is None
@@ -0,0 +1,19 @@
+"""JSON-safe encoding of query results."""
+
+import duckdb
+import pyarrow as pa
+
+from retail_insights_agent.database.duckdb.executor import _json_safe
+
+
+def test_intervals_become_iso_durations():
+    table = duckdb.sql(
+        "SELECT age(DATE '2022-06-30', DATE '2022-03-31') AS a, INTERVAL 90 MINUTE AS b, "
+        "INTERVAL '-14 months' AS c, INTERVAL 0 SECOND AS d, NULL::INTERVAL AS e"
+    ).arrow()
+    assert _json_safe(table).to_pylist() == [{"a": "P2M30D", "b": "PT1H30M", "c": "P-1Y-2M", "d": "PT0S", "e": None}]
+
+
+def test_durations_become_seconds():
+    table = pa.table({"d": pa.array([1_500_000, None], type=pa.duration("us"))})
+    assert _json_safe(table).to_pylist() == [{"d": 1.5}, {"d": None}]
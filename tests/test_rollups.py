@@ -0,0 +1,120 @@
+"""Rollup rewrites return what the original query returns - or are skipped."""
+
+import duckdb
+import pytest
+
+from retail_insights_agent.database.duckdb.rollups import rollup_sql, rewrite_query
+
+ROLLUPS = {
+    "rollup_state": {
+        "source_table": "sales",
+        "dimensions": ["state", "category", "status"],
+        "measures": ["amount", "quantity"],
+    },
+    "rollup_city": {
+        "source_table": "sales",
+        "dimensions": ["state", "city"],
+        "measures": ["amount"],
+    },
+}
+
+SOURCE_COLUMNS = {"order_id", "order_date", "state", "city", "category", "status", "amount", "quantity"}
+
+
+@pytest.fixture(scope="module")
+def db():
+    conn = duckdb.connect()
+    conn.execute(
+        "CREATE TABLE sales AS SELECT * FROM (VALUES "
+        "(1, DATE '2022-04-01', 'KERALA', 'KOCHI', 'Kurta', 'Shipped', 100.0, 1), "
+        "(2, DATE '2022-04-02', 'KERALA', 'KOCHI', 'Set', 'Cancelled', 250.5, 2), "
+        "(3, DATE '2022-04-02', 'KERALA', 'TRIVANDRUM', 'Kurta', 'Shipped', NULL, 1), "
+        "(4, DATE '2022-05-01', 'GOA', 'PANAJI', 'Top', 'Shipped', 80.0, NULL), "
+        "(5, DATE '2022-05-03', 'GOA', 'PANAJI', 'Kurta', 'Delivered', 40.25, 3), "
+        "(6, DATE '2022-05-03', NULL, NULL, 'Set', 'Shipped', 12.0, 1), "
+        "(7, DATE '2022-06-09', 'DELHI', 'NEW DELHI', 'Top', 'Cancelled', 999.0, 5)"
+        ") AS t(order_id, order_date, state, city, category, status, amount, quantity)"
+    )
+    rollups = {}
+    for name, definition in ROLLUPS.items():
+        conn.execute(rollup_sql(name, definition))
+        count = conn.execute(f"SELECT COUNT(*) FROM {name}").fetchone()[0]
+        rollups[name] = {**definition, "row_count": count}
+    yield conn, rollups
+    conn.close()
+
+
+def _rows(conn, sql: str, ordered: bool) -> list:
+    rows = [tuple(round(v, 6) if isinstance(v, float) else v for v in row) for row in conn.execute(sql).fetchall()]
+    return rows if ordered else sorted(rows, key=repr)
+
+
+@pytest.mark.parametrize("sql, rollup", [
+    ("SELECT state, SUM(amount) FROM sales GROUP BY state", "rollup_city"),
+    ("SELECT state, city, SUM(amount) AS revenue FROM sales GROUP BY 1, 2", "rollup_city"),
+    ("SELECT category, COUNT(*), COUNT(amount), AVG(amount), MIN(amount), MAX(amount) FROM sales GROUP BY 1",
+     "rollup_state"),
+    ("SELECT status, SUM(quantity), AVG(quantity) FROM sales WHERE state = 'KERALA' GROUP BY status", "rollup_state"),
+    ("SELECT COUNT(*), SUM(amount) FROM sales", "rollup_city"),
+    ("SELECT COUNT(*) FROM sales WHERE state = 'NOWHERE'", "rollup_city"),
+    ("SELECT state, COUNT(*) FILTER (WHERE status = 'Cancelled') AS cancelled, COUNT(*) AS orders "
+     "FROM sales GROUP BY state", "rollup_state"),
+    ("SELECT COUNT(DISTINCT category) FROM sales", "rollup_state"),
+    ("SELECT COUNT(state), SUM(LENGTH(state)), MIN(category) FROM sales", "rollup_state"),
+    ("SELECT category, SUM(amount) AS revenue FROM sales GROUP BY category HAVING SUM(amount) > 100 "
+     "ORDER BY revenue DESC", "rollup_state"),
+    ("SELECT state, SUM(amount), RANK() OVER (ORDER BY SUM(amount) DESC) FROM sales GROUP BY state",
+     "rollup_city"),
+    ("SELECT state, ROUND(100.0 * SUM(amount) / SUM(SUM(amount)) OVER (), 1) FROM sales GROUP BY state",
+     "rollup_city"),
+    ("SELECT UPPER(category) AS c, SUM(amount) FROM sales GROUP BY 1 ORDER BY 2 DESC LIMIT 2", "rollup_state"),
+    ("SELECT state FROM sales GROUP BY state", "rollup_city"),
+])
+def test_rewrite_matches_original(db, sql, rollup):
+    conn, rollups = db
+    rewritten = rewrite_query(sql, rollups, SOURCE_COLUMNS)
+    assert rewritten is not None and rewritten[1] == rollup
+    ordered = "ORDER BY" in sql
+    assert _rows(conn, rewritten[0], ordered) == _rows(conn, sql, ordered)
+
+
+@pytest.mark.parametrize("sql", [
+    # Row-level queries
+    "SELECT state, amount FROM sales",
+    "SELECT DISTINCT state FROM sales",
+    # Columns no rollup has
+    "SELECT order_date, SUM(amount) FROM sales GROUP BY 1",
+    "SELECT city, SUM(quantity) FROM sales GROUP BY 1",
+    "SELECT city, category, COUNT(*) FROM sales GROUP BY 1, 2",
+    # Aliases: table aliases, and column aliases shadowing a real column
+    "SELECT s.state, SUM(s.amount) FROM sales s GROUP BY 1",
+    "SELECT state, SUM(amount) FROM sales AS s GROUP BY 1",
+    "SELECT order_id AS state, SUM(amount) FROM sales GROUP BY 1",
+    # Joins, subqueries, CTEs, set operations
+    "SELECT a.state, SUM(a.amount) FROM sales a JOIN sales b ON a.order_id = b.order_id GROUP BY 1",
+    "SELECT state, SUM(amount) FROM sales, sales_2 GROUP BY 1",
+    "SELECT state, SUM(amount) FROM sales WHERE state IN (SELECT state FROM sales) GROUP BY 1",
+    "WITH x AS (SELECT * FROM sales) SELECT state, SUM(amount) FROM x GROUP BY 1",
+    "SELECT state, SUM(amount) FROM sales GROUP BY 1 UNION ALL SELECT 'all', SUM(amount) FROM sales",
+    # Aggregates that don't decompose over partial aggregates
+    "SELECT state, MEDIAN(amount) FROM sales GROUP BY 1",
+    "SELECT state, STDDEV(amount) FROM sales GROUP BY 1",
+    "SELECT state, COUNT(DISTINCT amount) FROM sales GROUP BY 1",
+    "SELECT state, SUM(amount * quantity) FROM sales GROUP BY 1",
+    "SELECT state, AVG(LENGTH(city)) FROM sales GROUP BY 1",
+    "SELECT state, SUM(amount) FROM sales WHERE amount > 50 GROUP BY 1",
+    "SELECT state, MAX(SUM(amount)) FROM sales GROUP BY 1",
+    # Other tables
+    "SELECT state, SUM(amount) FROM returns GROUP BY 1",
+])
+def test_unsupported_shapes_are_not_rewritten(db, sql):
+    _, rollups = db
+    assert rewrite_query(sql, rollups, SOURCE_COLUMNS) is None
+
+
+def test_smallest_covering_rollup_wins(db):
+    _, rollups = db
+    sizes = {name: rollups[name]["row_count"] for name in rollups}
+    assert sizes["rollup_city"] < sizes["rollup_state"]
+    assert rewrite_query("SELECT state, SUM(amount) FROM sales GROUP BY 1", rollups, SOURCE_COLUMNS)[1] == "rollup_city"
+    assert rewrite_query("SELECT state, SUM(quantity) FROM sales GROUP BY 1", rollups, SOURCE_COLUMNS)[1] == "rollup_state"
@@ -0,0 +1,117 @@
+"""Generated-SQL cache: exact and similar tiers, eviction, persistence."""
+
+import json
+
+import pytest
+
+from retail_insights_agent.database.nl2sql import cache as sql_cache
+from retail_insights_agent.database.nl2sql.cache import SQLCache, normalize_question
+
+SQL = "SELECT 1"
+
+
+def make_cache(**kwargs) -> SQLCache:
+    return SQLCache(schema_fingerprint="v1", **kwargs)
+
+
+def test_normalize_question():
+    assert normalize_question("  What's the TOP-5 states?\n") == "what s the top 5 states"
+    assert normalize_question("?!") == ""
+
+
+def test_exact_hit_ignores_case_and_punctuation():
+    cache = make_cache()
+    cache.put("Top 5 states by revenue?", SQL)
+    hit = cache.get("top 5 states, by revenue")
+    assert hit.tier == "exact" and hit.sql == SQL
+
+
+@pytest.mark.parametrize("cached, asked", [
+    ("top 5 states by revenue", "what are the top 5 states by revenue"),
+    ("revenue by category for every state", "for every state revenue by category"),
+])
+def test_rephrasings_are_similar_hits(cached, asked):
+    cache = make_cache()
+    cache.put(cached, SQL)
+    hit = cache.get(asked)
+    assert hit.tier == "similar" and hit.matched_question == cached
+
+
+@pytest.mark.parametrize("cached, asked", [
+    (
+        "what is the highest revenue category for business to business orders over the whole period",
+        "what is the lowest revenue category for business to business orders over the whole period",
+    ),
+    (
+        "list revenue for every category excluding kurta over the whole period",
+        "list revenue for every category including kurta over the whole period",
+    ),
+    ("top 5 states by revenue", "top 10 states by revenue"),
+    ("top 5 states by revenue", "bottom 5 states by revenue"),
+    ("states with the most orders", "states with the least orders"),
+    ("revenue by category sorted asc", "revenue by category sorted desc"),
+    ("orders shipped to kerala by category", "orders shipped to goa by category"),
+    ("cancelled orders in april by state", "cancelled orders in may by state"),
+    ("revenue by state for amazon fulfilled orders", "revenue by state for orders not amazon fulfilled"),
+])
+def test_questions_differing_in_meaning_never_share_sql(cached, asked):
+    cache = make_cache(similarity_threshold=0.5)
+    cache.put(cached, SQL)
+    assert cache.get(asked) is None
+
+
+def test_lru_eviction():
+    cache = make_cache(max_entries=2)
+    cache.put("revenue by state", "SELECT 'state'")
+    cache.put("revenue by city", "SELECT 'city'")
+    cache.get("revenue by state")
+    cache.put("revenue by category", "SELECT 'category'")
+    assert cache.get("revenue by city") is None
+    assert cache.get("revenue by state").sql == "SELECT 'state'"
+    assert cache.stats()["entries"] == 2
+
+
+def test_ttl_expiry(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(sql_cache.time, "time", lambda: now[0])
+    cache = make_cache(ttl_seconds=60)
+    cache.put("revenue by state", SQL)
+    now[0] += 30
+    assert cache.get("revenue by state") is not None
+    now[0] += 31
+    assert cache.get("revenue by state") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_persistence_round_trip(tmp_path):
+    path = tmp_path / "sql_cache.json"
+    make_cache(persist_path=str(path)).put("top 5 states by revenue", SQL)
+
+    reloaded = make_cache(persist_path=str(path))
+    assert reloaded.get("top 5 states by revenue").tier == "exact"
+    assert reloaded.get("what are the top 5 states by revenue").tier == "similar"
+    assert reloaded.get("top 10 states by revenue") is None
+
+
+def test_schema_change_discards_persisted_entries(tmp_path):
+    path = tmp_path / "sql_cache.json"
+    make_cache(persist_path=str(path)).put("revenue by state", SQL)
+
+    other = SQLCache(schema_fingerprint="v2", persist_path=str(path))
+    assert other.get("revenue by state") is None
+
+
+def test_invalidate_switches_fingerprint(tmp_path):
+    path = tmp_path / "sql_cache.json"
+    cache = make_cache(persist_path=str(path))
+    cache.put("revenue by state", SQL)
+    cache.invalidate("v2")
+    assert cache.get("revenue by state") is None
+    assert json.loads(path.read_text()) == {"schema_fingerprint": "v2", "entries": []}
+
+
+def test_unreadable_file_is_ignored(tmp_path):
+    path = tmp_path / "sql_cache.json"
+    path.write_text("{not json")
+    cache = make_cache(persist_path=str(path))
+    assert cache.stats()["entries"] == 0
@@ -0,0 +1,164 @@
+"""Template fast path: question -> SQL (or fallback), and answer formatting."""
+
+import duckdb
+import pytest
+
+from retail_insights_agent.agents.fast_path import format_answer
+from retail_insights_agent.database.templates.matcher import TemplateMatcher
+
+VALUES = {"state": ["KERALA", "Kerala", "GOA"], "category": ["Kurta", "Set", "Top"]}
+
+SHARE = "ROUND(100.0 * SUM(amount) / SUM(SUM(amount)) OVER (), 1) AS share_pct"
+
+CASES = [
+    (
+        "top 5 states by revenue",
+        f"SELECT state AS state, SUM(amount) AS revenue, {SHARE} FROM amazon_sales "
+        "WHERE state IS NOT NULL GROUP BY 1 ORDER BY 2 DESC NULLS LAST LIMIT 5",
+    ),
+    (
+        "bottom 3 categories by orders",
+        "SELECT category AS category, COUNT(*) AS orders, "
+        "ROUND(100.0 * COUNT(*) / SUM(COUNT(*)) OVER (), 1) AS share_pct FROM amazon_sales "
+        "WHERE category IS NOT NULL GROUP BY 1 ORDER BY 2 ASC NULLS LAST LIMIT 3",
+    ),
+    (
+        "Top category sales",
+        f"SELECT category AS category, SUM(amount) AS revenue, {SHARE} FROM amazon_sales "
+        "WHERE category IS NOT NULL GROUP BY 1 ORDER BY 2 DESC NULLS LAST LIMIT 5",
+    ),
+    (
+        "revenue per state",
+        f"SELECT state AS state, SUM(amount) AS revenue, {SHARE} FROM amazon_sales "
+        "WHERE state IS NOT NULL GROUP BY 1 ORDER BY 2 DESC NULLS LAST",
+    ),
+    (
+        "monthly revenue trend",
+        f"SELECT DATE_TRUNC('month', order_date) AS month, SUM(amount) AS revenue, {SHARE} FROM amazon_sales "
+        "WHERE DATE_TRUNC('month', order_date) IS NOT NULL GROUP BY 1 ORDER BY 1",
+    ),
+    (
+        "average order value by category",
+        "SELECT category AS category, AVG(amount) AS avg_order_value FROM amazon_sales "
+        "WHERE category IS NOT NULL GROUP BY 1 ORDER BY 2 DESC NULLS LAST",
+    ),
+    (
+        "cancellation rate by state",
+        "SELECT state AS state, ROUND(100.0 * COUNT(*) FILTER (WHERE status = 'Cancelled') / COUNT(*), 2) "
+        "AS cancellation_rate_pct, COUNT(*) AS orders FROM amazon_sales "
+        "WHERE state IS NOT NULL GROUP BY 1 ORDER BY 2 DESC NULLS LAST",
+    ),
+    ("total revenue", "SELECT SUM(amount) AS revenue FROM amazon_sales"),
+    (
+        "how many orders were cancelled in april",
+        "SELECT COUNT(*) AS orders FROM amazon_sales WHERE status = 'Cancelled' AND MONTH(order_date) = 4",
+    ),
+    # Ambiguous month tokens count after a preposition
+    ("revenue in may", "SELECT SUM(amount) AS revenue FROM amazon_sales WHERE MONTH(order_date) = 5"),
+    (
+        "revenue by state in mar",
+        f"SELECT state AS state, SUM(amount) AS revenue, {SHARE} FROM amazon_sales "
+        "WHERE MONTH(order_date) = 3 AND state IS NOT NULL GROUP BY 1 ORDER BY 2 DESC NULLS LAST",
+    ),
+    # Every spelling of a data value is matched
+    (
+        "top categories by revenue in Kerala",
+        f"SELECT category AS category, SUM(amount) AS revenue, {SHARE} FROM amazon_sales "
+        "WHERE state IN ('KERALA', 'Kerala') AND category IS NOT NULL GROUP BY 1 ORDER BY 2 DESC NULLS LAST LIMIT 5",
+    ),
+    (
+        "revenue in goa",
+        "SELECT SUM(amount) AS revenue FROM amazon_sales WHERE state = 'GOA'",
+    ),
+    # Fallbacks
+    ("which state may have the highest revenue", None),
+    ("revenue by state mar", None),
+    ("top 5 states by revenue per order", None),
+    ("revenue per unit by state", None),
+    ("top 5 states by profit", None),
+    ("revenue by state for 2022", None),
+    ("revenue in kerala and goa", None),
+    ("top 5 states and categories by revenue", None),
+    ("", None),
+]
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    return TemplateMatcher(VALUES)
+
+
+@pytest.fixture(scope="module")
+def sales():
+    conn = duckdb.connect()
+    conn.execute(
+        "CREATE TABLE amazon_sales AS SELECT * FROM (VALUES "
+        "(DATE '2022-04-02', 'KERALA', 'Kurta', 'Shipped', 100.0, 1), "
+        "(DATE '2022-04-03', 'Kerala', 'Set', 'Cancelled', 250.0, 2), "
+        "(DATE '2022-05-01', 'GOA', 'Top', 'Shipped', 80.0, 1), "
+        "(DATE '2022-03-09', 'GOA', 'Kurta', 'Delivered', 40.0, 3)"
+        ") AS t(order_date, state, category, status, amount, quantity)"
+    )
+    yield conn
+    conn.close()
+
+
+@pytest.mark.parametrize("question, sql", CASES)
+def test_question_to_sql(matcher, question, sql):
+    match = matcher.match(question)
+    assert (match.sql if match else None) == sql
+
+
+@pytest.mark.parametrize("question, sql", [case for case in CASES if case[1]])
+def test_template_sql_runs(sales, question, sql):
+    assert sales.execute(sql).fetchall()
+
+
+def test_case_variants_are_counted_together(matcher, sales):
+    match = matcher.match("revenue in kerala")
+    assert sales.execute(match.sql).fetchone() == (350.0,)
+
+
+def test_format_ranked():
+    match = TemplateMatcher(VALUES).match("top 2 states by revenue")
+    records = [
+        {"state": "MAHARASHTRA", "revenue": 2_500_000.0, "share_pct": 62.5},
+        {"state": "GOA", "revenue": 1_500_000.0, "share_pct": 37.5},
+    ]
+    assert format_answer(match, records) == "\n".join([
+        "**Maharashtra Leads States by Revenue**",
+        "",
+        "Maharashtra accounts for 62.5% of total revenue.",
+        "",
+        "- **Maharashtra:** ₹2.5M (62.5%)",
+        "- **Goa:** ₹1.5M (37.5%)",
+        "",
+        "**Insight:** The top 2 states make up 100% of revenue - a highly concentrated mix.",
+    ])
+
+
+def test_format_total():
+    match = TemplateMatcher(VALUES).match("total revenue and orders in goa")
+    answer = format_answer(match, [{"revenue": 12_000.0, "orders": 4}])
+    assert answer.splitlines()[0] == "**Total Revenue: ₹12.0K**"
+    assert "Across all orders (GOA)." in answer
+    assert answer.endswith("**Insight:** That works out to about ₹3.0K per order.")
+
+
+def test_format_rate():
+    match = TemplateMatcher(VALUES).match("cancellation rate")
+    answer = format_answer(match, [{"cancellation_rate_pct": 12.5, "orders": 800}])
+    assert answer.splitlines()[0] == "**Cancellation Rate: 12.5%**"
+    assert "Based on 800 orders." in answer
+    assert answer.endswith("Roughly 1 in 8 orders falls in this group.")
+
+
+def test_format_chronological_breakdown():
+    match = TemplateMatcher(VALUES).match("monthly revenue trend")
+    records = [
+        {"month": "2022-04-01", "revenue": 100.0, "share_pct": 40.0},
+        {"month": "2022-05-01", "revenue": 150.0, "share_pct": 60.0},
+    ]
+    answer = format_answer(match, records)
+    assert answer.splitlines()[0] == "**May 2022 Was the Peak Month for Revenue**"
+    assert answer.endswith("**Insight:** Revenue is up 50% from Apr 2022 to May 2022.")
@@ -0,0 +1,121 @@
+"""Timeouts and cancellation interrupt DuckDB work instead of abandoning it."""
+
+import asyncio
+import threading
+import time
+
+import duckdb
+import pytest
+
+from retail_insights_agent.database.duckdb import executor
+from retail_insights_agent.database.duckdb.admission import check_relations
+from retail_insights_agent.database.duckdb.pool import CursorPool
+from retail_insights_agent.database.duckdb.workers import QueryTimeout, deadline, run_in_worker
+from retail_insights_agent.database.duckdb.connection import DuckDBConnection
+
+# Runs for minutes unless interrupted
+LONG_SQL = "SELECT COUNT(*) FROM n a, n b, n c WHERE a.i + b.i + c.i = -1"
+
+
+@pytest.fixture
+def pool():
+    conn = duckdb.connect()
+    conn.execute("CREATE TABLE n AS SELECT range AS i FROM range(100000)")
+    yield CursorPool(conn, 2)
+    conn.close()
+
+
+def _long_query(pool: CursorPool):
+    with pool.cursor() as cursor:
+        return cursor.execute(LONG_SQL).fetchall()
+
+
+def test_deadline_interrupts_a_synchronous_query(pool):
+    start = time.perf_counter()
+    with pytest.raises(QueryTimeout):
+        with deadline(0.2):
+            _long_query(pool)
+    assert time.perf_counter() - start < 5
+    assert pool.stats()["in_use"] == 0
+
+
+def test_deadline_leaves_fast_queries_alone(pool):
+    with deadline(5):
+        with pool.cursor() as cursor:
+            assert cursor.execute("SELECT COUNT(*) FROM n").fetchone() == (100000,)
+
+
+def test_run_in_worker_runs_off_the_event_loop():
+    async def main():
+        return threading.get_ident(), await run_in_worker(threading.get_ident)
+
+    loop_thread, worker_thread = asyncio.run(main())
+    assert worker_thread != loop_thread
+
+
+def test_run_in_worker_timeout_interrupts_the_query(pool):
+    async def main():
+        start = time.perf_counter()
+        with pytest.raises(QueryTimeout):
+            await run_in_worker(_long_query, pool, timeout=0.2)
+        return time.perf_counter() - start
+
+    assert asyncio.run(main()) < 5
+    _wait_until_returned(pool)
+
+
+def test_cancelling_the_awaiting_task_interrupts_the_query(pool):
+    async def main():
+        task = asyncio.create_task(run_in_worker(_long_query, pool))
+        while pool.stats()["in_use"] == 0:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    _wait_until_returned(pool)
+
+
+def _wait_until_returned(pool: CursorPool, timeout: float = 5) -> None:
+    """The interrupted query frees its cursor (and worker) shortly after."""
+    end = time.monotonic() + timeout
+    while pool.stats()["in_use"] and time.monotonic() < end:
+        time.sleep(0.01)
+    assert pool.stats()["in_use"] == 0
+
+
+@pytest.fixture
+def connection(monkeypatch):
+    instance = DuckDBConnection()
+    instance.execute("CREATE TABLE n AS SELECT range AS i FROM range(100000)")
+    monkeypatch.setattr(DuckDBConnection, "_instance", instance)
+    monkeypatch.setattr(executor, "QUERY_MAX_ESTIMATED_ROWS", 0)  # No cost limit
+    monkeypatch.setattr(executor, "_result_cache", None)
+    yield instance
+    instance.close()
+
+
+def test_execute_query_times_out(connection):
+    result = executor.execute_query(LONG_SQL, timeout=0.2)
+    assert not result.success
+    assert result.error_code == "timeout"
+    assert connection.pool_stats()["in_use"] == 0
+
+
+def test_execute_query_async_times_out(connection):
+    result = asyncio.run(executor.execute_query_async(LONG_SQL, timeout=0.2))
+    assert not result.success
+    assert result.error_code == "timeout"
+    _wait_until_returned(connection._pool)
+
+
+def test_timeout_during_admission_is_not_lost(connection, monkeypatch):
+    # DuckDB forgets an interrupt that lands between two statements
+    def slow_check_relations(cursor, sql):
+        time.sleep(0.3)
+        return check_relations(cursor, sql)
+
+    monkeypatch.setattr(executor, "check_relations", slow_check_relations)
+    result = executor.execute_query(LONG_SQL, timeout=0.1)
+    assert result.error_code == "timeout"